@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Shell completion benchmark
+Times the completion name index on a synthetic workspace: building it, looking
+up prefixes in-process, and the wall time of one completion call as the shell
+makes it (a fresh `python3 -S` process), compared with bare interpreter
+startup and with parsing the cached NDJSON sections on every call.
+
+Usage: python benchmarks/bench_complete.py [names]
+"""
+
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from toggl_complete import CACHE_DIR, INDEX_FILE, build_index, complete  # noqa: E402
+
+RUNS = 3
+CALLS = 20
+PREFIXES = ('', 'a', 'de', 'zz', 'Mobile R')
+
+# How the completion scripts call it: imported, so its cached bytecode is used
+IMPORTED = f"import sys; sys.path.insert(0, {ROOT!r}); import toggl_complete; sys.exit(toggl_complete.main())"
+
+# Naive completer for comparison: parse every cached section on each call
+NAIVE = """import json, sys
+kind, prefix = sys.argv[1], sys.argv[2].casefold()
+names = set()
+for line in open(sys.argv[3], encoding='utf-8'):
+    name = json.loads(line)['name']
+    if name.casefold().startswith(prefix):
+        names.add(name)
+print('\\n'.join(sorted(names)))
+"""
+
+WORDS = ("Mobile", "Web", "Backend", "Release", "Design", "Review", "Client", "Support",
+         "Research", "Ops", "Infra", "Docs", "Sprint", "Audit", "Migration", "Launch")
+
+
+def synthetic_names(count):
+    """count names split 60/10/5/25 across projects, tags, clients and descriptions"""
+    rng = random.Random(42)
+    shares = {'project': 0.6, 'tag': 0.1, 'client': 0.05, 'description': 0.25}
+    return {kind: [f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}" for i in range(int(count * share))]
+            for kind, share in shares.items()}
+
+
+def best_of(func):
+    best, result = float('inf'), None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def median_call(args, cwd):
+    """Median wall time (ms) of CALLS runs of a fresh process"""
+    times = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=cwd, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    names = synthetic_names(count)
+    print(f"{count} synthetic names, best of {RUNS} runs (processes: median of {CALLS})\n")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.makedirs(os.path.join(workdir, CACHE_DIR))
+        path = os.path.join(workdir, CACHE_DIR, INDEX_FILE)
+        ms, data = best_of(lambda: build_index(names))
+        with open(path, 'wb') as f:
+            f.write(data)
+        print(f"{'build index':<36}{ms:>10.1f} ms  ({len(data) / 1024:.0f} KB)")
+        for prefix in PREFIXES:
+            ms, found = best_of(lambda: complete(path, 'project', prefix))
+            print(f"{'lookup project ' + repr(prefix):<36}{ms:>10.3f} ms  ({len(found)} names)")
+
+        sections = os.path.join(workdir, 'projects.ndjson')
+        with open(sections, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps({'id': i, 'name': name, 'active': True}) + '\n'
+                         for i, name in enumerate(names['project']))
+        script = os.path.join(ROOT, 'toggl_complete.py')
+        print()
+        for label, args in (("python3 -S (startup only)", [sys.executable, '-S', '-c', 'pass']),
+                            ("toggl_complete.py project 'Mo'", [sys.executable, '-S', script, 'project', 'Mo']),
+                            ("import toggl_complete (scripts)", [sys.executable, '-S', '-c', IMPORTED, 'project', 'Mo']),
+                            ("parse sections per call", [sys.executable, '-S', '-c', NAIVE,
+                                                         'project', 'Mo', sections])):
+            print(f"{label:<36}{median_call(args, workdir):>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Config format benchmark
+Compares disk size and load time of the cached data in four layouts:
+the v2 single toggl_config.json (pretty-printed, or with gzip-compressed
+sections) and the v3 layout: a small toggl_config.json header plus one NDJSON
+file per section in toggl_cache/, plain or gzip-compressed.
+
+Usage: python benchmarks/bench_config_format.py [projects_per_workspace]
+"""
+
+import base64
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import toggl_cli  # noqa: E402
+
+WORKSPACES = 3
+TAGS = 500
+RUNS = 5
+
+
+def synthetic_caches(projects_per_workspace):
+    """Per-workspace project and tag records that look like real API data"""
+    caches = {}
+    for ws in range(1, WORKSPACES + 1):
+        projects = [{
+            'id': ws * 1000000 + i, 'workspace_id': ws, 'client_id': 5000 + i % 40,
+            'name': f"Client {i % 40} - Project {i}", 'is_private': False, 'active': i % 7 != 0,
+            'at': '2026-03-01T10:00:00+00:00', 'created_at': '2025-01-01T10:00:00+00:00',
+            'color': '#06aaf5', 'billable': i % 2 == 0, 'template': False, 'auto_estimates': None,
+            'estimated_hours': None, 'rate': None, 'currency': None, 'actual_hours': i % 300,
+        } for i in range(projects_per_workspace)]
+        tags = [{'id': ws * 100000 + i, 'workspace_id': ws, 'name': f"tag-{i}",
+                 'at': '2026-03-01T10:00:00+00:00'} for i in range(TAGS)]
+        caches[str(ws)] = {'projects': projects, 'tags': tags, 'clients': [], 'tasks': []}
+    return caches
+
+
+def pack_v2(value):
+    """A v2 compressed section: gzip+base64 JSON inside the config"""
+    raw = json.dumps(value, separators=(',', ':')).encode('utf-8')
+    return {'__gzip__': base64.b64encode(gzip.compress(raw, compresslevel=6)).decode('ascii')}
+
+
+def write_v2(caches, compress):
+    if compress:
+        caches = {key: {kind: pack_v2(value) for kind, value in partition.items()}
+                  for key, partition in caches.items()}
+    config = {'version': 2, 'api_token': 'x' * 32, 'workspace_id': 1, 'workspace_caches': caches}
+    with open(toggl_cli.CONFIG_FILE, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=None if compress else 2, ensure_ascii=False)
+
+
+def load_v2(first_use):
+    with open(toggl_cli.CONFIG_FILE, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if first_use:
+        toggl_cli._unpack_section(config['workspace_caches']['1']['projects'])
+
+
+def write_v3(caches, compress):
+    with open(toggl_cli.CONFIG_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': 3, 'api_token': 'x' * 32, 'workspace_id': 1}, f, indent=2)
+    for key, partition in caches.items():
+        for kind, records in partition.items():
+            toggl_cli._write_section(toggl_cli._section_path(key, kind),
+                                     toggl_cli._encode_section(records), 0 if compress else None)
+
+
+def load_v3(first_use):
+    with open(toggl_cli.CONFIG_FILE, 'r', encoding='utf-8') as f:
+        json.load(f)
+    if first_use:
+        toggl_cli._read_section(toggl_cli._section_path('1', 'projects'))
+
+
+def disk_size():
+    total = os.path.getsize(toggl_cli.CONFIG_FILE)
+    for root, _, names in os.walk(toggl_cli.CACHE_DIR):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in names)
+    return total
+
+
+def best_of(load, first_use):
+    best = float('inf')
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        load(first_use)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    per_workspace = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    caches = synthetic_caches(per_workspace)
+    print(f"{WORKSPACES} workspaces x {per_workspace} projects + {TAGS} tags, best of {RUNS} runs\n")
+    print(f"{'layout':<30}{'size (KB)':>11}{'startup (ms)':>14}{'+ projects (ms)':>17}")
+
+    layouts = (("v2 pretty JSON", lambda: write_v2(caches, False), load_v2),
+               ("v2 gzip sections", lambda: write_v2(caches, True), load_v2),
+               ("v3 header + NDJSON files", lambda: write_v3(caches, False), load_v3),
+               ("v3 header + NDJSON.gz files", lambda: write_v3(caches, True), load_v3))
+    cwd = os.getcwd()
+    for label, write, load in layouts:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                write()
+                print(f"{label:<30}{disk_size() / 1024:>11.0f}"
+                      f"{best_of(load, False):>14.1f}{best_of(load, True):>17.1f}")
+            finally:
+                os.chdir(cwd)
+
+    print("\n'startup' reads what is needed before the menu shows. '+ projects' also")
+    print("decodes the active workspace's project list, as Start Timer does.")
+
+
+if __name__ == "__main__":
+    main()
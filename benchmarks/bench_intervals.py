@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Interval index benchmark
+Times IntervalIndex on synthetic time entries: building the index, whole-range
+overlap/gap/coverage sweeps, and many one-day window queries compared with
+scanning every entry per window.
+
+Usage: python benchmarks/bench_intervals.py [entries]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from toggl_intervals import IntervalIndex  # noqa: E402
+
+DAY = 86400
+WINDOWS = 1000
+RUNS = 3
+
+
+def synthetic_entries(count):
+    """Back-to-back working-day entries with occasional overlaps and gaps"""
+    rng = random.Random(42)
+    entries, cursor = [], datetime(2024, 1, 1, 9, tzinfo=timezone.utc).timestamp()
+    for i in range(count):
+        duration = rng.randint(5, 120) * 60
+        start = cursor - rng.randint(5, 30) * 60 if rng.random() < 0.05 else cursor  # 5% overlap
+        start += rng.randint(20, 90) * 60 if rng.random() < 0.1 else 0                 # 10% leave a gap
+        entries.append({'id': i, 'description': f"Task {i % 50}", 'duration': duration,
+                        'start': datetime.fromtimestamp(start, timezone.utc).isoformat().replace('+00:00', 'Z')})
+        cursor = start + duration
+        if cursor % DAY > 17 * 3600:
+            cursor += DAY - cursor % DAY + 9 * 3600  # Next morning
+    return entries
+
+
+def best_of(func):
+    best, result = float('inf'), None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    entries = synthetic_entries(count)
+    print(f"{count} synthetic entries, best of {RUNS} runs\n")
+
+    ms, index = best_of(lambda: IntervalIndex.from_entries(entries))
+    print(f"{'build (parse + sort)':<36}{ms:>10.1f} ms")
+    spans = [(s, e) for s, e, _ in index.intersecting()]
+    start, end = spans[0][0], max(e for _, e in spans)
+    for label, query in (("overlaps, whole range", lambda: len(index.overlaps(start, end))),
+                         ("gaps >= 15 min, whole range", lambda: len(index.gaps(start, end, 900))),
+                         ("coverage, whole range", lambda: index.coverage(start, end))):
+        ms, result = best_of(query)
+        print(f"{label:<36}{ms:>10.1f} ms   ({result:.0f})")
+
+    rng = random.Random(7)
+    days = [start + rng.randrange(int(end - start)) // DAY * DAY for _ in range(WINDOWS)]
+    ms, _ = best_of(lambda: [index.coverage(day, day + DAY) for day in days])
+    print(f"{f'{WINDOWS} one-day coverage queries':<36}{ms:>10.1f} ms")
+
+    def scan():
+        # What a query costs without the index: check every entry per window
+        return [sum(1 for s, e in spans if s < day + DAY and e > day) for day in days[:50]]
+    ms, _ = best_of(scan)
+    print(f"{'50 one-day windows, full scan':<36}{ms:>10.1f} ms   (x{WINDOWS // 50} = {ms * WINDOWS / 50:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Bash completion for toggl_cli.py
+# Source it from ~/.bashrc:  source /path/to/toggl_cli/completions/toggl_cli.bash
+# Completes commands and options, and project, tag, client and description
+# names from the index toggl_cli.py keeps in toggl_cache/names.idx (looked up
+# in $TOGGL_CLI_DIR, the working directory, then the toggl_cli.py directory).
+
+_TOGGL_CLI_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+# Imported rather than run as a script, so Python uses its cached bytecode
+_TOGGL_CLI_COMPLETE='import sys, toggl_complete; sys.exit(toggl_complete.main())'
+
+_toggl_cli() {
+    local cur prev command word name prefix
+    cur="${COMP_WORDS[COMP_CWORD]}"
+    prev="${COMP_WORDS[COMP_CWORD-1]}"
+    COMPREPLY=()
+
+    case "$prev" in
+        --project|--tag|--client|--description)
+            # Drop an opening quote and backslash escapes from the word typed so far
+            prefix="${cur#[\"\']}"
+            prefix="${prefix//\\/}"
+            while IFS= read -r name; do
+                COMPREPLY+=("$(printf '%q' "$name")")
+            done < <(PYTHONPATH="$_TOGGL_CLI_DIR" python3 -S -c "$_TOGGL_CLI_COMPLETE" "${prev#--}" "$prefix")
+            return ;;
+        --output)
+            COMPREPLY=($(compgen -W "text json ndjson tsv" -- "$cur"))
+            return ;;
+        --days|--date)
+            return ;;
+    esac
+
+    for word in "${COMP_WORDS[@]:1:COMP_CWORD-1}"; do
+        case "$word" in
+            current|recent|weekly|period|search|projects|tags|budget) command="$word"; break ;;
+        esac
+    done
+    case "$command" in
+        search) COMPREPLY=($(compgen -W "--description --project --tag --client --date" -- "$cur")) ;;
+        period) COMPREPLY=($(compgen -W "--days" -- "$cur")) ;;
+        "") COMPREPLY=($(compgen -W "current recent weekly period search projects tags budget --output --help" -- "$cur")) ;;
+    esac
+}
+
+complete -F _toggl_cli toggl toggl_cli.py
@@ -0,0 +1,34 @@
+# Fish completion for toggl_cli.py
+# Source it from ~/.config/fish/config.fish:
+#   source /path/to/toggl_cli/completions/toggl_cli.fish
+# Completes commands and options, and project, tag, client and description
+# names from the index toggl_cli.py keeps in toggl_cache/names.idx (looked up
+# in $TOGGL_CLI_DIR, the working directory, then the toggl_cli.py directory).
+
+set -g __toggl_cli_dir (dirname (dirname (realpath (status --current-filename))))
+
+function __toggl_cli_names
+    # Imported rather than run as a script, so Python uses its cached bytecode
+    PYTHONPATH=$__toggl_cli_dir python3 -S -c 'import sys, toggl_complete; sys.exit(toggl_complete.main())' \
+        $argv[1] (commandline -ct)
+end
+
+set -l commands current recent weekly period search projects tags budget
+for program in toggl toggl_cli.py
+    complete -c $program -f
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -l output -x -a "text json ndjson tsv" -d "Record format on stdout"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a current -d "Show the running timer"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a recent -d "Show today's entries"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a weekly -d "Summary of the last 7 days"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a period -d "Summary of the last N days"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a search -d "Search entries"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a projects -d "Sync and list projects"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a tags -d "Sync and list tags"
+    complete -c $program -n "not __fish_seen_subcommand_from $commands" -a budget -d "Tracked time against estimates"
+    complete -c $program -n "__fish_seen_subcommand_from period" -l days -x -d "Days to include"
+    complete -c $program -n "__fish_seen_subcommand_from search" -l description -x -a "(__toggl_cli_names description)" -d "Keyword in the description"
+    complete -c $program -n "__fish_seen_subcommand_from search" -l project -x -a "(__toggl_cli_names project)" -d "Project name"
+    complete -c $program -n "__fish_seen_subcommand_from search" -l tag -x -a "(__toggl_cli_names tag)" -d "Tag name"
+    complete -c $program -n "__fish_seen_subcommand_from search" -l client -x -a "(__toggl_cli_names client)" -d "Client name"
+    complete -c $program -n "__fish_seen_subcommand_from search" -l date -x -d "Day the entries start on (YYYY-MM-DD)"
+end
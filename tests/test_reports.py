@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Period summary tests
+Runs period_summary() and check_summary_consistency() against a local
+stand-in server for the Toggl API (time entries) and the Reports API v3:
+totals from the server, the fallback to adding up entries locally, and the
+consistency check with matching and mismatched totals.
+
+Usage: python -m pytest tests/  (or python -m unittest discover tests)
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, time as dtime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import toggl_cli  # noqa: E402
+
+WORKSPACE_ID = 1
+PROJECT = {'id': 101, 'name': 'Website', 'workspace_id': WORKSPACE_ID, 'client_id': 900, 'active': True}
+TAG = {'id': 501, 'name': 'focus', 'workspace_id': WORKSPACE_ID}
+
+
+def _iso(moment):
+    return moment.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _entries():
+    """Three stopped entries at local noon, one and two days ago"""
+    entries = []
+    for i, (days_ago, hours) in enumerate(((1, 2), (1, 1), (2, 3))):
+        start = datetime.combine(datetime.now().astimezone().date() - timedelta(days=days_ago),
+                                 dtime(12 + i)).astimezone()
+        entries.append({'id': 2000 + i, 'workspace_id': WORKSPACE_ID, 'description': f"Work {i}",
+                        'project_id': PROJECT['id'], 'tag_ids': [TAG['id']] if i else [],
+                        'tags': [TAG['name']] if i else [], 'billable': i == 0,
+                        'start': _iso(start), 'stop': _iso(start + timedelta(hours=hours)),
+                        'duration': hours * 3600, 'at': _iso(start)})
+    return entries
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves GET /api/v9/me/time_entries and the three Reports API calls.
+    server.reports_status set to an error code fails the Reports API;
+    server.skew seconds are added to every server-side total."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/api/v9/me/time_entries':
+            return self._reply(404, {'error': url.path})
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        start, end = (toggl_cli._parse_time(query[key]) for key in ('start_date', 'end_date'))
+        self._reply(200, [e for e in self.server.entries if start <= toggl_cli._parse_time(e['start']) < end])
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        path = urlparse(self.path).path
+        self.server.reports_calls.append(path)
+        if not path.startswith(f'/reports/api/v3/workspace/{WORKSPACE_ID}/'):
+            return self._reply(404, {'error': path})
+        if self.server.reports_status != 200:
+            return self._reply(self.server.reports_status, {'error': 'unavailable'})
+
+        entries = [e for e in self.server.entries
+                   if body['start_date'] <= toggl_cli._local_day(e) <= body['end_date']
+                   and (e['billable'] or not body.get('billable'))]
+        skew = self.server.skew
+        if path.endswith('/search/time_entries/totals'):
+            first = datetime.fromisoformat(body['start_date']).date()
+            days = (datetime.fromisoformat(body['end_date']).date() - first).days + 1
+            graph = [{'seconds': sum(e['duration'] for e in entries
+                                     if toggl_cli._local_day(e) == (first + timedelta(days=n)).isoformat())}
+                     for n in range(days)]
+            return self._reply(200, {'seconds': sum(e['duration'] for e in entries) + skew,
+                                     'resolution': 'day', 'graph': graph})
+        if body['grouping'] == 'projects':
+            seconds = sum(e['duration'] for e in entries) + skew
+            groups = [{'id': PROJECT['id'], 'sub_groups': [{'id': PROJECT['client_id'], 'seconds': seconds}]}]
+        else:
+            tagged = sum(e['duration'] for e in entries if e['tag_ids'])
+            untagged = sum(e['duration'] for e in entries if not e['tag_ids'])
+            groups = [{'id': TAG['id'], 'sub_groups': [{'id': PROJECT['id'], 'seconds': tagged}]},
+                      {'id': None, 'sub_groups': [{'id': PROJECT['id'], 'seconds': untagged}]}]
+        self._reply(200, {'groups': groups})
+
+
+class PeriodSummaryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+        self.server.entries = _entries()
+        self.server.reports_calls = []
+        self.server.reports_status = 200
+        self.server.skew = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        base = f'http://127.0.0.1:{self.server.server_port}'
+
+        self.workdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.workdir.name)  # Config, caches and log go here
+        patch = mock.patch.object(toggl_cli, 'API_BASE', f'{base}/api/v9')
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        self.cli = toggl_cli.TogglCLI()
+        self.cli.api_token, self.cli.workspace_id = 'token', WORKSPACE_ID
+        self.cli.settings['reports_base_url'] = f'{base}/reports/api/v3'
+        self.cli.settings['reports_min_days'] = 7
+        self.cli._store_entities('projects', [PROJECT], WORKSPACE_ID)
+        self.cli._store_entities('tags', [TAG], WORKSPACE_ID)
+        self.cli._store_entities('clients', [{'id': 900, 'name': 'ACME', 'wid': WORKSPACE_ID}], WORKSPACE_ID)
+
+    def tearDown(self):
+        if self.cli._client:
+            self.cli._client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        os.chdir(self.cwd)
+        self.workdir.cleanup()
+
+    def run_quietly(self, func, *args, answers=()):
+        """Run a CLI method with canned input() answers; return what it printed"""
+        out = io.StringIO()
+        with redirect_stdout(out), mock.patch('builtins.input', side_effect=list(answers)):
+            func(*args)
+        return out.getvalue()
+
+    def test_long_period_totalled_by_reports_api(self):
+        summary, source = self.cli._period_totals(*self.cli._ask_period("TEST", 7))
+        self.assertEqual(source, 'reports')
+        self.assertEqual(len(self.server.reports_calls), 4)
+        self.assertEqual(summary['total'], 6 * 3600)
+        self.assertEqual(summary['billable'], 2 * 3600)
+        self.assertEqual(summary['projects'], {'101': 6 * 3600})
+        self.assertEqual(summary['clients'], {'900': 6 * 3600})
+        self.assertEqual(summary['tags'], {'focus': 4 * 3600})
+
+        printed = self.run_quietly(self.cli.period_summary, 7)
+        self.assertIn("Totals from the Toggl Reports API", printed)
+        self.assertIn("ACME", printed)
+
+    def test_short_period_added_up_locally(self):
+        summary, source = self.cli._period_totals(*self.cli._ask_period("TEST", 3))
+        self.assertEqual(source, 'local')
+        self.assertEqual(self.server.reports_calls, [])
+        self.assertEqual(summary['total'], 6 * 3600)
+
+    def test_falls_back_to_local_totals_when_reports_fail(self):
+        self.server.reports_status = 500
+        printed = self.run_quietly(self.cli.period_summary, 7)
+        self.assertTrue(self.server.reports_calls)
+        self.assertIn("Reports API unavailable", printed)
+        self.assertIn("Added up locally from 3 entries", printed)
+
+        summary, source = self.cli._period_totals(*self.cli._ask_period("TEST", 7))
+        self.assertEqual(source, 'local')
+        self.assertEqual(summary['total'], 6 * 3600)
+        self.assertEqual(summary['clients'], {'900': 6 * 3600})
+
+    def test_falls_back_to_local_totals_when_reports_unreachable(self):
+        unused = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+        unused.server_close()  # Nothing listens on its port any more
+        self.cli.settings['reports_base_url'] = f'http://127.0.0.1:{unused.server_port}/reports/api/v3'
+        self.cli._client = None  # Rebuilt with the new Reports URL
+        summary, source = self.cli._period_totals(*self.cli._ask_period("TEST", 7))
+        self.assertEqual(source, 'local')
+        self.assertEqual(summary['total'], 6 * 3600)
+
+    def test_consistency_check_reports_agreement(self):
+        printed = self.run_quietly(self.cli.check_summary_consistency, answers=['7'])
+        self.assertIn("Reports API and local totals agree", printed)
+        self.assertNotIn("differ", printed)
+
+    def test_consistency_check_reports_mismatches(self):
+        self.server.skew = 3600
+        printed = self.run_quietly(self.cli.check_summary_consistency, answers=['7'])
+        self.assertIn("values differ (Reports API vs local)", printed)
+        self.assertIn("Total all entries: 7h 0m vs 6h 0m", printed)
+        self.assertIn("Project Website: 7h 0m vs 6h 0m", printed)
+        self.assertIn("Client ACME: 7h 0m vs 6h 0m", printed)
+        self.assertNotIn("Tag focus", printed)
+
+    def test_consistency_check_without_reports_api(self):
+        self.server.reports_status = 503
+        printed = self.run_quietly(self.cli.check_summary_consistency, answers=['7'])
+        self.assertIn("Reports API unavailable", printed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Toggl API Client
+Asyncio client for the Toggl Track API v9 endpoints used by toggl_cli.py.
+Contains no prompts or printing, so it can be embedded in other programs.
+
+Example:
+    async with TogglClient(token) as client:
+        me, projects = await asyncio.gather(client.get_me(), client.list_projects())
+"""
+
+import asyncio
+import copy
+import functools
+import threading
+from base64 import b64encode
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API_BASE = "https://api.track.toggl.com/api/v9"
+REPORTS_BASE = "https://api.track.toggl.com/reports/api/v3"
+
+Entity = Dict[str, Any]
+
+
+def _since(since: Optional[int]) -> str:
+    """Query string for the API's incremental `since` filter (UNIX time)"""
+    return f'?since={int(since)}' if since else ''
+
+
+class TogglAPIError(Exception):
+    """Raised when a Toggl API request fails (HTTP error or network error)"""
+
+    def __init__(self, message, status=None, headers=None):
+        super().__init__(message)
+        self.status = status          # HTTP status, None for network errors
+        self.headers = headers or {}  # Response headers, if any
+
+
+class TogglClient:
+    """Asyncio client for the Toggl API.
+
+    Requests run on a pooled requests.Session inside the client's own thread
+    pool. At most max_concurrency requests are in flight at once. Identical
+    GETs issued while one is in flight share its response (single-flight).
+    Cancelling an awaiting coroutine abandons its request; the HTTP call
+    itself still finishes in the background and its result is discarded.
+    """
+
+    def __init__(self, api_token: str, base_url: str = API_BASE, max_concurrency: int = 4,
+                 timeout: float = 30, on_retry: Optional[Callable[[str], None]] = None,
+                 reports_base_url: str = REPORTS_BASE):
+        self.base_url = base_url
+        self.reports_base_url = reports_base_url
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.on_retry = on_retry  # Called with a message before a timeout retry
+        auth = b64encode(f"{api_token}:api_token".encode()).decode('ascii')
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Authorization': f'Basic {auth}'
+        })
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphores = {}  # One semaphore per running event loop
+        # Transfer counters: bytes_wire is what crossed the network (compressed),
+        # bytes_decoded what it expanded to; coalesced counts GETs that shared
+        # an in-flight response
+        self.stats = {'requests': 0, 'bytes_wire': 0, 'bytes_decoded': 0, 'coalesced': 0}
+        self._stats_lock = threading.Lock()
+        self._inflight = {}  # GET endpoint -> Future of the request in flight
+
+    # --- Core ---------------------------------------------------------------
+
+    def request_blocking(self, method: str, endpoint: str, data: Any = None) -> Tuple[Any, Dict[str, str]]:
+        """Perform one request synchronously with a single retry on timeout.
+        A GET identical to one already in flight (from any thread) waits for
+        that response instead of sending its own.
+        Returns (json_data, headers); raises TogglAPIError on failure."""
+        if method != 'GET':
+            return self._send(method, endpoint, data)
+        with self._stats_lock:
+            flight = self._inflight.get(endpoint)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[endpoint] = {'future': Future(), 'followers': 0}
+            else:
+                flight['followers'] += 1
+                self.stats['coalesced'] += 1
+        if not leader:
+            result, headers = flight['future'].result()
+            return copy.deepcopy(result), headers
+
+        try:
+            response = self._send(method, endpoint, data)
+        except BaseException as e:
+            with self._stats_lock:
+                del self._inflight[endpoint]
+            flight['future'].set_exception(e)
+            raise
+        with self._stats_lock:
+            del self._inflight[endpoint]  # Later identical GETs send their own request
+        flight['future'].set_result(response)
+        if flight['followers']:
+            # Followers copy the shared response; give our caller its own copy too
+            return copy.deepcopy(response[0]), response[1]
+        return response
+
+    def _send(self, method: str, endpoint: str, data: Any = None) -> Tuple[Any, Dict[str, str]]:
+        """The HTTP exchange behind request_blocking; endpoint may also be a full URL"""
+        url = endpoint if '://' in endpoint else f"{self.base_url}{endpoint}"
+        for attempt in range(2):
+            try:
+                response = self.session.request(method, url, json=data, timeout=self.timeout)
+            except requests.exceptions.Timeout:
+                if attempt == 0:
+                    if self.on_retry:
+                        self.on_retry("Timeout, retrying...")
+                    continue
+                raise TogglAPIError("Network error: Request timed out after retry")
+            except requests.exceptions.RequestException as e:
+                raise TogglAPIError(f"Network error: {e}")
+
+            self._count_transfer(response)
+            if response.status_code in (200, 201):
+                return response.json(), response.headers
+            if response.status_code == 204:
+                return {}, response.headers
+            raise TogglAPIError(f"API Error {response.status_code}: {response.text}",
+                                response.status_code, response.headers)
+
+    def _count_transfer(self, response) -> None:
+        """Add a response's compressed and decoded sizes to stats"""
+        decoded = len(response.content)
+        try:
+            wire = response.raw.tell()  # Raw bytes read, before decompression
+        except (AttributeError, OSError):
+            wire = 0
+        wire = wire or int(response.headers.get('Content-Length') or decoded)
+        with self._stats_lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_wire'] += wire
+            self.stats['bytes_decoded'] += decoded
+
+    async def request(self, method: str, endpoint: str, data: Any = None) -> Any:
+        """Perform one request without blocking the event loop. Returns the JSON data."""
+        result, _ = await self.request_with_headers(method, endpoint, data)
+        return result
+
+    async def request_with_headers(self, method: str, endpoint: str, data: Any = None) -> Tuple[Any, Dict[str, str]]:
+        """Like request(), but returns (json_data, headers)."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # Forget the loops of finished asyncio.run() calls. A semaphore
+            # refers to its loop, so weak keys would not let them go.
+            for old in [old for old in list(self._semaphores) if old.is_closed()]:
+                self._semaphores.pop(old, None)
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            call = functools.partial(self.request_blocking, method, endpoint, data)
+            return await loop.run_in_executor(self._executor, call)
+
+    def close(self) -> None:
+        """Release pooled connections and worker threads"""
+        self.session.close()
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    # --- User & account -----------------------------------------------------
+
+    async def get_me(self) -> Entity:
+        return await self.request('GET', '/me')
+
+    async def update_me(self, data: Entity) -> Entity:
+        return await self.request('PUT', '/me', data)
+
+    async def list_workspaces(self) -> List[Entity]:
+        return await self.request('GET', '/me/workspaces') or []
+
+    async def list_organizations(self) -> List[Entity]:
+        return await self.request('GET', '/me/organizations') or []
+
+    async def get_quota(self) -> List[Entity]:
+        return await self.request('GET', '/me/quota') or []
+
+    # --- Entities -----------------------------------------------------------
+
+    async def list_projects(self, workspace_id: Optional[int] = None, since: Optional[int] = None) -> List[Entity]:
+        """Projects of one workspace, or of all workspaces when workspace_id is None.
+        With since (UNIX time), only projects changed since then, deleted ones included."""
+        prefix = f'/workspaces/{workspace_id}' if workspace_id else '/me'
+        return await self.request('GET', f'{prefix}/projects{_since(since)}') or []
+
+    async def list_projects_page(self, page: int, per_page: int) -> Tuple[List[Entity], Dict[str, str]]:
+        """One page of /me/projects/paginated plus the response headers"""
+        data, headers = await self.request_with_headers(
+            'GET', f'/me/projects/paginated?page={page}&per_page={per_page}')
+        projects = data if isinstance(data, list) else (data or {}).get('data', [])
+        return projects, headers
+
+    async def list_tags(self, workspace_id: Optional[int] = None, since: Optional[int] = None) -> List[Entity]:
+        prefix = f'/workspaces/{workspace_id}' if workspace_id else '/me'
+        return await self.request('GET', f'{prefix}/tags{_since(since)}') or []
+
+    async def list_clients(self, since: Optional[int] = None) -> List[Entity]:
+        return await self.request('GET', f'/me/clients{_since(since)}') or []
+
+    async def list_tasks(self, since: Optional[int] = None) -> List[Entity]:
+        return await self.request('GET', f'/me/tasks{_since(since)}') or []
+
+    async def list_project_tasks(self, workspace_id: int, project_id: int) -> List[Entity]:
+        return await self.request('GET', f'/workspaces/{workspace_id}/projects/{project_id}/tasks') or []
+
+    async def create_project(self, workspace_id: int, data: Entity) -> Entity:
+        return await self.request('POST', f'/workspaces/{workspace_id}/projects', data)
+
+    async def create_tag(self, workspace_id: int, data: Entity) -> Entity:
+        return await self.request('POST', f'/workspaces/{workspace_id}/tags', data)
+
+    # --- Time entries -------------------------------------------------------
+
+    async def get_current_entry(self) -> Optional[Entity]:
+        """The running entry, or None when no timer is running"""
+        current = await self.request('GET', '/me/time_entries/current')
+        return current if current and current.get('id') else None
+
+    async def list_time_entries(self, start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> List[Entity]:
+        endpoint = '/me/time_entries'
+        if start_date and end_date:
+            endpoint += f'?start_date={start_date}&end_date={end_date}'
+        return await self.request('GET', endpoint) or []
+
+    async def create_entry(self, workspace_id: int, data: Entity) -> Entity:
+        return await self.request('POST', f'/workspaces/{workspace_id}/time_entries', data)
+
+    async def update_entry(self, workspace_id: int, entry_id: int, data: Entity) -> Entity:
+        return await self.request('PUT', f'/workspaces/{workspace_id}/time_entries/{entry_id}', data)
+
+    async def stop_entry(self, workspace_id: int, entry_id: int) -> Entity:
+        return await self.request('PATCH', f'/workspaces/{workspace_id}/time_entries/{entry_id}/stop', {})
+
+    async def delete_entry(self, workspace_id: int, entry_id: int) -> None:
+        await self.request('DELETE', f'/workspaces/{workspace_id}/time_entries/{entry_id}')
+
+    # --- Reports API v3 -----------------------------------------------------
+
+    async def summary_report(self, workspace_id: int, body: Entity) -> Entity:
+        """Totals grouped server-side: {"groups": [{"id", "sub_groups": [{"id", "seconds"}]}]}"""
+        return await self.request(
+            'POST', f'{self.reports_base_url}/workspace/{workspace_id}/summary/time_entries', body) or {}
+
+    async def totals_report(self, workspace_id: int, body: Entity) -> Entity:
+        """Total seconds plus a graph of per-period totals: {"seconds", "resolution", "graph"}"""
+        return await self.request(
+            'POST', f'{self.reports_base_url}/workspace/{workspace_id}/search/time_entries/totals', body) or {}
@@ -4,33 +4,536 @@ Toggl Time Tracker CLI
 A simple command-line interface for tracking time with Toggl
 """
 
-import requests
+import argparse
+import asyncio
+import base64
+import copy
+import csv
+import gzip
 import json
+import re
+import shutil
 import sys
-from datetime import datetime, timedelta, timezone
-from base64 import b64encode
+from collections import OrderedDict, deque
+from datetime import date, datetime, time as dtime, timedelta, timezone
 import os
+import tempfile
+import threading
+import time
+import hmac
+import hashlib
 import webbrowser
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+try:
+    import yaml  # Optional: only needed for YAML batch-create specs
+except ImportError:
+    yaml = None
+from toggl_api import API_BASE, REPORTS_BASE, TogglAPIError, TogglClient
+from toggl_complete import INDEX_FILE, build_index
+from toggl_intervals import IntervalIndex
 
 # Configuration
 CONFIG_FILE = "toggl_config.json"
+CACHE_DIR = "toggl_cache"  # Cached sections, one NDJSON file each (see _section_path)
+LOCK_FILE = CONFIG_FILE + ".lock"  # Coordinates config/cache access between processes
 LOG_FILE = "toggl_cli_logs.txt"
-API_BASE = "https://api.track.toggl.com/api/v9"
+WEBHOOK_LOG_FILE = "toggl_webhooks.ndjson"  # Recorded webhook deliveries (for replay)
+TEAM_FILE = "toggl_team.json"  # Team mode: {"members": [{"name": ..., "api_token": ...}]}
+TEAM_CACHE_DIR = "team"  # Per-member caches, under CACHE_DIR (keyed by a token hash)
+BACKFILL_FILE = "toggl_backfill.json"  # Backfill checkpoint: how far back the history is stored
+HISTORY_DIR = "history"  # Backfilled time entries under CACHE_DIR, one section per month (UTC)
+NAME_INDEX_FILE = os.path.join(CACHE_DIR, INDEX_FILE)  # Sorted names for shell completion
+# Entity caches that are partitioned by workspace ID
+PARTITIONED_CACHES = ('projects', 'tags', 'clients', 'tasks')
+# Caches shared by all workspaces
+GLOBAL_CACHES = ('organizations', 'workspaces')
+# (record key, change stamp) used to merge concurrent writes of a section
+SECTION_MERGE_KEYS = {'tasks_by_project': ('project_id', 'fetched_at'), 'reports': ('key', 'used_at')}
+DEFAULT_MERGE_KEY = ('id', 'at')
+# Tunables, overridable via the "settings" section of toggl_config.json
+DEFAULT_SETTINGS = {
+    'page_size': 50,             # Rows per page for paginated endpoints
+    'max_parallel_requests': 4,  # Upper bound on concurrent API requests
+    'task_ttl': 3600,            # Seconds before a project's task list is refetched
+    'frecency_half_life_days': 7,  # Usage weight halves every N days
+    'timer_state_ttl': 900,      # Seconds the local running-timer state is trusted
+    'watch_min_interval': 30,    # Watch mode: server check interval right after a change
+    'watch_max_interval': 1200,  # Watch mode: server check interval once stable
+    'webhook_secret': None,      # Secret of the Toggl webhook subscription
+    'webhook_port': 8087,        # Port of the local webhook receiver
+    'webhook_record': True,      # Append received deliveries to WEBHOOK_LOG_FILE
+    'compress_cache': False,     # Store large cache section files gzip-compressed
+    'compress_min_bytes': 65536,  # Sections smaller than this stay plain JSON
+    'log_max_bytes': 5000000,    # Archive the log (gzip) once it grows past this; 0 = never
+    'request_memo_ttl': 10,      # Seconds a GET response is reused within one command
+    'picker_rows': 0,            # Rows per page in project/tag pickers; 0 = fit the terminal
+    'report_cache_max_bytes': 1000000,  # Memory cap of cached summaries (LRU); 0 = no caching
+    'warmup_interval': 300,      # Menu warm-up at most every N seconds; prefetched entries trusted that long; 0 = off
+    'warmup_sync_age': 3600,     # Menu warm-up syncs projects/tags last synced longer ago than this
+    'workday_start': '09:00',    # Gap audit: local start of the working day
+    'workday_end': '17:00',      # Gap audit: local end of the working day
+    'workdays': [0, 1, 2, 3, 4],  # Gap audit: working weekdays (0 = Monday)
+    'gap_min_minutes': 15,       # Gap audit: shorter untracked stretches are ignored
+    'team_max_workers': 4,       # Team summary: members fetched at the same time
+    'team_min_interval': 1.0,    # Team summary: seconds between two requests with one token
+    'reports_min_days': 31,      # Period summaries this long ask the Reports API for totals first; 0 = always
+    'reports_base_url': None,    # Reports API v3 base URL (None = Toggl's), e.g. a local stand-in server
+    'backfill_window_days': 30,  # Backfill: days of entries fetched per request
+    'backfill_empty_windows': 12,  # Backfill without an oldest day: stop after this many empty windows in a row
+    'backfill_live_days': 30,    # Entries newer than this are always fetched, never read from the history
+}
+# --output formats; every format but text streams records to stdout
+OUTPUT_FORMATS = ('text', 'json', 'ndjson', 'tsv')
+# Webhook "model" names mapped to the cache they update
+WEBHOOK_MODELS = {'project': 'projects', 'tag': 'tags', 'client': 'clients', 'task': 'tasks'}
+FRECENCY_MAX_ITEMS = 200  # Entries kept per frecency kind
+SYNC_OVERLAP = 60  # Seconds each incremental sync re-requests, to absorb clock skew
+VERSION_KEEP_DAYS = 93  # Per-day data versions kept; older days share one floor version
+# Fields a batch-create spec may set per project (see _read_batch_spec)
+BATCH_PROJECT_FIELDS = ('name', 'is_private', 'active', 'billable', 'color', 'client_id', 'client')
+# Entity writes whose responses are applied to the caches (see _apply_write_response)
+CACHED_WRITE_ENDPOINT = re.compile(r'^/workspaces/(\d+)/(projects|tags|clients)(?:/(\d+))?$')
+
+
+def _unpack_section(value):
+    """Decode a v2 config section stored as gzip+base64 (plain values pass through)"""
+    if isinstance(value, dict) and '__gzip__' in value:
+        return json.loads(gzip.decompress(base64.b64decode(value['__gzip__'])).decode('utf-8'))
+    return value
+
+
+def _section_path(workspace_key, name):
+    """Path of a cached section's NDJSON file (gzip variant: same path + '.gz')"""
+    if workspace_key is None:
+        return os.path.join(CACHE_DIR, f"{name}.ndjson")
+    return os.path.join(CACHE_DIR, workspace_key, f"{name}.ndjson")
+
+
+def _read_section_data(path):
+    """Uncompressed bytes of a section file, or None if it does not exist"""
+    for candidate, opener in ((path + '.gz', gzip.open), (path, open)):
+        try:
+            with opener(candidate, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+    return None
+
+
+def _decode_section(data):
+    """Records of NDJSON section bytes"""
+    lines = [line for line in (data or b'').decode('utf-8').splitlines() if line.strip()]
+    # Parse the lines as one JSON array: a single decoder call is much faster
+    return json.loads('[' + ','.join(lines) + ']')
+
+
+def _read_section(path):
+    """Read the records of a section file; a missing file reads as empty"""
+    return _decode_section(_read_section_data(path))
+
+
+def _encode_section(records):
+    """NDJSON bytes of records, one JSON document per line"""
+    return ''.join(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+                   for record in records).encode('utf-8')
+
+
+def _write_section(path, data, compress_min_bytes=None):
+    """Atomically write encoded section bytes.
+    Gzip-compresses when compress_min_bytes is set and the data reaches it."""
+    compress = compress_min_bytes is not None and len(data) >= compress_min_bytes
+    target, stale = (path + '.gz', path) if compress else (path, path + '.gz')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _atomic_write(target, gzip.compress(data, compresslevel=6) if compress else data)
+    if os.path.exists(stale):
+        os.remove(stale)
+
+
+def _file_fingerprint(path):
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _section_fingerprint(path):
+    """Fingerprints of a section's gzip and plain files; changes whenever it is rewritten"""
+    return (_file_fingerprint(path + '.gz'), _file_fingerprint(path))
+
+
+def _atomic_write(path, data):
+    """Write bytes to a uniquely named temp file next to path, then rename it over path"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _file_lock(shared=False):
+    """Hold the inter-process lock on LOCK_FILE: shared to read, exclusive to write.
+    Windows has no shared file locks, so there every holder is exclusive."""
+    with open(LOCK_FILE, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _merge_records(base, ours, theirs, key='id', stamp='at'):
+    """Three-way merge of a section another process rewrote after we read it.
+
+    base maps each record key to its stamp as we read it. A record present on
+    both sides keeps the newer stamp. A record on one side only was deleted on
+    the other if it is in base, otherwise it was added and is kept."""
+    theirs_by_key = {record.get(key): record for record in theirs}
+    merged = []
+    for record in ours:
+        other = theirs_by_key.pop(record.get(key), None)
+        if other is None:
+            if record.get(key) not in base:
+                merged.append(record)
+        elif other.get(stamp) is not None and (record.get(stamp) is None
+                                               or other.get(stamp) > record.get(stamp)):
+            merged.append(other)
+        else:
+            merged.append(record)
+    merged.extend(record for k, record in theirs_by_key.items() if k not in base)
+    return merged
+
+
+def _section_stamps(name, records):
+    """Map each record key of a section to its change stamp (the base for _merge_records)"""
+    key, stamp = SECTION_MERGE_KEYS.get(name, DEFAULT_MERGE_KEY)
+    return {record.get(key): record.get(stamp) for record in records if record.get(key) is not None}
+
+
+class _LazySections(dict):
+    """Cache sections by name; a section is read from disk on first access.
+    Iterating yields only the sections loaded (or assigned) so far."""
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+
+    def __missing__(self, name):
+        value = self[name] = self._loader(name)
+        return value
+
+
+def _entity_workspace(item):
+    """Workspace ID of an entity (clients use 'wid')"""
+    return item.get('workspace_id') or item.get('wid')
+
+
+def _server_time(headers):
+    """Server clock from a response's Date header, falling back to the local clock"""
+    try:
+        return parsedate_to_datetime(headers['Date']).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return time.time()
+
+
+def _name_key(name):
+    """Key of the name indexes: names match ignoring case and surrounding spaces"""
+    return str(name or '').strip().casefold()
+
+
+def _read_batch_spec(path):
+    """Read a batch-create spec into {'projects': [...], 'tags': [...]} of dicts with a name.
+
+    JSON and YAML specs hold {"projects": [...], "tags": [...]}, where an item
+    is a name or an object with BATCH_PROJECT_FIELDS; a CSV spec has a
+    header row with a type column (project or tag), a name column and
+    optionally the other project fields. Raises ValueError if malformed."""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if ext == '.csv':
+            spec = {'projects': [], 'tags': []}
+            for line, row in enumerate(csv.DictReader(f), 2):
+                kind = (row.pop('type', None) or '').strip().lower()
+                if kind not in ('project', 'tag'):
+                    raise ValueError(f"line {line}: type must be 'project' or 'tag'")
+                spec[kind + 's'].append({key: value.strip() for key, value in row.items()
+                                         if key and value and value.strip()})
+        elif ext in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ValueError("YAML specs need PyYAML (pip install pyyaml); use JSON or CSV instead")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+
+    if not isinstance(spec, dict) or not set(spec) & {'projects', 'tags'}:
+        raise ValueError("expected a 'projects' and/or 'tags' list")
+    result = {}
+    for kind in ('projects', 'tags'):
+        items = []
+        for item in spec.get(kind) or []:
+            item = {'name': item} if isinstance(item, str) else item
+            if not isinstance(item, dict) or not _name_key(item.get('name')):
+                raise ValueError(f"every entry in '{kind}' needs a name: {item!r}")
+            fields = BATCH_PROJECT_FIELDS if kind == 'projects' else ('name',)
+            unknown = set(item) - set(fields)
+            if unknown:
+                raise ValueError(f"unknown field(s) for {kind}: {', '.join(sorted(unknown))}")
+            for key in ('is_private', 'active', 'billable'):
+                if isinstance(item.get(key), str):  # CSV cells
+                    item[key] = item[key].lower() in ('1', 'true', 'yes', 'y')
+            if isinstance(item.get('client_id'), str):
+                if not item['client_id'].isdigit():
+                    raise ValueError(f"client_id must be a number: {item['client_id']!r}")
+                item['client_id'] = int(item['client_id'])
+            item['name'] = str(item['name']).strip()
+            items.append(item)
+        result[kind] = items
+    return result
+
+
+def _entry_day(entry):
+    """UTC day (YYYY-MM-DD) an entry starts on, or None"""
+    return (entry or {}).get('start', '')[:10] or None
+
+
+def _local_day(entry):
+    """Local calendar day (YYYY-MM-DD) an entry starts on, or None"""
+    try:
+        return datetime.fromisoformat(entry['start'].replace('Z', '+00:00')).astimezone().date().isoformat()
+    except (KeyError, AttributeError, ValueError):
+        return None
+
+
+def _period_start(day, first_day, resolution):
+    """First day of the report period ('day', 'week' or 'month', counted from first_day) holding day"""
+    if resolution == 'week':
+        return first_day + timedelta(days=(day - first_day).days // 7 * 7)
+    if resolution == 'month':
+        return max(first_day, day.replace(day=1))
+    return day
+
+
+def _graph_periods(first_day, count, resolution):
+    """Start days of the first `count` periods of a Reports API totals graph"""
+    periods, day = [], first_day
+    for _ in range(count):
+        periods.append(day)
+        if resolution == 'week':
+            day += timedelta(days=7)
+        elif resolution == 'month':
+            day = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            day += timedelta(days=1)
+    return periods
+
+
+def _history_path(month):
+    """Section file of the backfilled entries starting in one month ('YYYY-MM', UTC)"""
+    return _section_path(HISTORY_DIR, month)
+
+
+def _parse_time(value):
+    """Aware datetime of an API timestamp ('...Z' or with an offset)"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _api_time(moment):
+    """API timestamp of an aware datetime, in UTC"""
+    return moment.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _report_range(days):
+    """(start_day, end_day, start_date, end_date) covering the last `days` days up to now.
+    The range starts at midnight UTC so it only moves once a day."""
+    end = datetime.now(timezone.utc)
+    start = (end - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (start.date().isoformat(), end.date().isoformat(),
+            start.isoformat().replace("+00:00", "Z"), end.isoformat().replace("+00:00", "Z"))
+
+
+def _project_row(number, project):
+    """Picker row for a project"""
+    active = "✓" if project.get('active', True) else "✗"
+    return f"{number}. {project['name']} [{active}]"
+
+
+def _name_row(number, item):
+    """Picker row for a tag, task or other named item"""
+    return f"{number}. {item['name']}"
+
+
+def _partitioned_cache(kind):
+    """Property exposing the active workspace's partition of a cached entity list"""
+    def getter(self):
+        return self._partition()[kind]
+
+    def setter(self, items):
+        self._store_entities(kind, items)
+
+    return property(getter, setter)
+
+
+def _global_cache(name):
+    """Property exposing a cached list shared by all workspaces"""
+    def getter(self):
+        return self._global_caches[name]
+
+    def setter(self, items):
+        self._global_caches[name] = items
+
+    return property(getter, setter)
+
+
+def _tsv_cell(value):
+    """One TSV field: lists comma-joined, None empty, tabs and newlines flattened"""
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        value = ','.join(str(item) for item in value)
+    return str(value).replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+
+
+class _RecordWriter:
+    """Streams command results to a file as a JSON array, NDJSON or TSV.
+
+    Each record is written and flushed when it is emitted, so a large
+    result can be piped into jq or a loader without being buffered. TSV
+    takes its header from the first record's keys."""
+
+    def __init__(self, fmt, stream):
+        self.fmt = fmt
+        self.stream = stream
+        self.count = 0
+        self._fields = None
+
+    def emit(self, record):
+        if self.fmt == 'json':
+            text = ('[\n' if not self.count else ',\n') + json.dumps(record, ensure_ascii=False)
+        elif self.fmt == 'ndjson':
+            text = json.dumps(record, ensure_ascii=False) + '\n'
+        else:
+            text = ''
+            if self._fields is None:
+                self._fields = list(record)
+                text = '\t'.join(self._fields) + '\n'
+            text += '\t'.join(_tsv_cell(record.get(field)) for field in self._fields) + '\n'
+        self.stream.write(text)
+        self.stream.flush()
+        self.count += 1
+
+    def close(self):
+        if self.fmt == 'json':
+            self.stream.write('\n]\n' if self.count else '[]\n')
+        self.stream.flush()
+
+
+class _FailureWatch:
+    """Passes printed text through to a stream and notes whether a line was an
+    error message. Every failure the CLI reports starts with ✗, whether an API
+    error (_report_error) or an invalid choice, so this sees them all."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.failed = False
+        self._line_start = True
+
+    def write(self, text):
+        for line in text.splitlines(True):
+            if self._line_start and line.lstrip().startswith('✗'):
+                self.failed = True
+            self._line_start = line.endswith('\n')
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """Receives Toggl webhook deliveries and hands them to the CLI (server.cli)"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        signature = self.headers.get('X-Webhook-Signature-256', '')
+        status, response = self.server.cli._handle_webhook(body, signature)
+        if status == 200 and self.server.cli.settings['webhook_record']:
+            self.server.cli._record_webhook(body, signature)
+        payload = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # Deliveries are reported by the CLI itself
 
 
 class TogglCLI:
+    # Per-workspace entity caches (see _partition)
+    cached_projects = _partitioned_cache('projects')
+    cached_tags = _partitioned_cache('tags')
+    cached_clients = _partitioned_cache('clients')
+    cached_tasks = _partitioned_cache('tasks')
+    cached_organizations = _global_cache('organizations')
+    cached_workspaces = _global_cache('workspaces')
+
     def __init__(self):
         self.api_token = None
         self.workspace_id = None
         self.user_data = None
-        self.cached_projects = []  # Cached projects list
-        self.cached_tags = []      # Cached tags list
-        self.cached_organizations = []  # Cached organizations
-        self.cached_clients = []   # Cached clients
-        self.cached_tasks = []     # Cached tasks
-        self.cached_workspaces = []  # Cached workspaces
-        self._recent_project_ids = None  # Cached recent project IDs
-        self._recent_project_ids_ts = 0  # Timestamp of last refresh
+        self._client = None  # TogglClient for the current token (see client)
+        self._client_token = None
+        self.workspace_caches = {}  # Cache partitions accessed so far, keyed by workspace ID
+        self._global_caches = _LazySections(lambda name: self._load_section(None, name))
+        # What this process last read or wrote, to detect and merge other processes' writes
+        self._section_bases = {}  # {path: {'fingerprint', 'digest', 'stamps'}}
+        self._header_base = {}
+        self._header_fingerprint = None
+        self.settings = dict(DEFAULT_SETTINGS)  # User-tunable settings
+        self.frecency = {}  # Usage scores: {kind: {key: [score, last_used_ts]}}
+        self._indexed_descriptions = None  # Descriptions in the completion index when last written
+        self.sync_state = {}  # Server time of the last /me/{kind} sync, per entity kind
+        # Time entry data versions (ns stamps): bumped per start day on each
+        # change this CLI makes, or for all days by a sync (see _entries_changed)
+        self.data_versions = {'all': 0, 'days': {}, 'floor': 0, 'floor_day': ''}
+        self._versions_fingerprint = None  # Config file state data_versions was last merged from
+        self._scope = None  # Request scope of the running command (see _request_scope)
+        # Background warm-up while the menu waits for input (see _start_warmup). Commands
+        # run holding _state_lock; the warm-up applies its results only while holding it
+        self._state_lock = threading.RLock()
+        self._warmup_thread = None
+        self._warmup_cancel = threading.Event()
+        self._warmed_at = 0
+        self._prefetched_entries = None  # {'at', 'start_day', 'entries'} from the last warm-up
+        self._tracked_totals = None  # Per-project/task sums of the 'tracked' ledger (see _tracked)
+        self.request_totals = {'calls': 0, 'reused': 0, 'coalesced': 0, 'applied': 0}
+        # Running and last stopped entry as last seen by this CLI
+        self.timer_state = {'running': None, 'last_stopped': None, 'validated_at': 0}
+        self.output = None  # _RecordWriter of a --output command; None in the interactive menu
         self.load_config()
         self._start_session_log()
 
@@ -38,16 +541,21 @@ class TogglCLI:
         """Load configuration and cached data from file"""
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
+                with _file_lock(shared=True), open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    self._header_fingerprint = _file_fingerprint(CONFIG_FILE)
                     config = json.load(f)
+                    self._header_base = json.loads(json.dumps(config))
                     self.api_token = config.get('api_token')
                     self.workspace_id = config.get('workspace_id')
-                    self.cached_projects = config.get('cached_projects', [])
-                    self.cached_tags = config.get('cached_tags', [])
-                    self.cached_organizations = config.get('cached_organizations', [])
-                    self.cached_clients = config.get('cached_clients', [])
-                    self.cached_tasks = config.get('cached_tasks', [])
-                    self.cached_workspaces = config.get('cached_workspaces', [])
+                    self.settings.update(config.get('settings', {}))
+                    self.frecency = config.get('frecency', {})
+                    # The completion index was written with these (see _write_name_index)
+                    self._indexed_descriptions = set(self.frecency.get('descriptions', {}))
+                    self.sync_state = config.get('sync_state', {})
+                    self.data_versions.update(config.get('data_versions', {}))
+                    self.timer_state.update(config.get('timer_state', {}))
+                if config.get('version', 1) < 3:
+                    self._migrate_config(config)
             except Exception as e:
                 corrupt_path = CONFIG_FILE + '.corrupt.json'
                 try:
@@ -57,37 +565,483 @@ class TogglCLI:
                     print(f"⚠️  Config corrupted — could not rename: {e}")
                 self.log(f"Error loading config (renamed to .corrupt): {e}")
 
+    def _migrate_config(self, config):
+        """Move the cached lists of a v1/v2 config out into CACHE_DIR"""
+        for name in GLOBAL_CACHES:
+            if config.get(f'cached_{name}'):
+                self._global_caches[name] = config[f'cached_{name}']
+        for key, sections in config.get('workspace_caches', {}).items():
+            partition = self._partition(key)
+            for name, value in sections.items():
+                partition[name] = _unpack_section(value)
+        # v1 configs kept flat lists; file them under their workspaces
+        for kind in PARTITIONED_CACHES:
+            items = config.get(f'cached_{kind}')
+            if items:
+                self._store_entities(kind, items)
+        self.save_config(silent=True)
+        self.log(f"(Config): Moved cached data to {CACHE_DIR}/")
+
+    def _load_section(self, workspace_key, name):
+        """Read one cached section from CACHE_DIR; unreadable files count as empty"""
+        path = _section_path(workspace_key, name)
+        fingerprint = None
+        try:
+            with _file_lock(shared=True):
+                fingerprint = _section_fingerprint(path)
+                data = _read_section_data(path)
+            records = _decode_section(data)
+            digest = hashlib.sha1(data or b'').digest()
+        except (OSError, ValueError) as e:
+            self.log(f"(Config): Ignoring unreadable cache file {path}: {e}")
+            records, digest = [], None
+        self._section_bases[path] = {'fingerprint': fingerprint, 'digest': digest,
+                                     'stamps': _section_stamps(name, records)}
+        return self._section_value(name, records)
+
+    @staticmethod
+    def _section_value(name, records):
+        """In-memory form of a section read from disk"""
+        if name == 'tasks_by_project':
+            # Tasks per project: {project_id: {'fetched_at': ts, 'tasks': [...]}}
+            return {r['project_id']: {'fetched_at': r['fetched_at'], 'tasks': r['tasks']} for r in records}
+        if name == 'reports':
+            # Cached summaries by key, least recently used first
+            return OrderedDict((r['key'], r) for r in sorted(records, key=lambda r: r['used_at']))
+        if name == 'tracked':
+            # Tracked-time ledger: {entry_id: {'id', 'at', 'start', 'project_id', 'task_id', 'seconds'}}
+            return {str(r['id']): r for r in records}
+        return records
+
+    @staticmethod
+    def _section_records(name, value):
+        """On-disk records of an in-memory section (inverse of _section_value)"""
+        if name == 'tasks_by_project':
+            return [dict(entry, project_id=pid) for pid, entry in value.items()]
+        if name in ('reports', 'tracked'):
+            return list(value.values())
+        return value
+
     def _start_session_log(self):
         """Add a blank line to separate sessions in the log file"""
+        self._archive_log()
         try:
             with open(LOG_FILE, 'a', encoding='utf-8') as f:
                 f.write("\n")
         except Exception:
             pass  # Silently ignore if log file can't be written
 
+    def _archive_log(self):
+        """Move an oversized log into a gzip-compressed segment and start a fresh one"""
+        max_bytes = self.settings['log_max_bytes']
+        try:
+            if not max_bytes or os.path.getsize(LOG_FILE) < max_bytes:
+                return
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+            archive_path = f"{os.path.splitext(LOG_FILE)[0]}.{stamp}.txt.gz"
+            with open(LOG_FILE, 'rb') as src, gzip.open(archive_path, 'wb') as dst:
+                dst.write(src.read())
+            os.remove(LOG_FILE)
+            self.log(f"(Archive): Previous log compressed to {archive_path}")
+        except OSError:
+            pass  # No log yet, or it can't be archived; keep appending
+
     def save_config(self, silent=False):
-        """Save configuration and cached data to file (atomic write)"""
+        """Save configuration and cached data to file (atomic writes, safe across processes).
+
+        Only cache sections loaded this session are written, and only if they
+        changed. Sections and header fields another process saved since we read
+        them are merged in rather than overwritten."""
         try:
-            config = {
-                'version': 1,
-                'api_token': self.api_token,
-                'workspace_id': self.workspace_id,
-                'cached_projects': self.cached_projects,
-                'cached_tags': self.cached_tags,
-                'cached_organizations': self.cached_organizations,
-                'cached_clients': self.cached_clients,
-                'cached_tasks': self.cached_tasks,
-                'cached_workspaces': self.cached_workspaces
-            }
-            tmp_path = CONFIG_FILE + '.tmp'
-            with open(tmp_path, 'w') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            os.replace(tmp_path, CONFIG_FILE)
+            min_bytes = self.settings['compress_min_bytes'] if self.settings['compress_cache'] else None
+            # Encode before taking the lock so other processes wait as little as possible
+            pending = []
+            for key, sections in [*self.workspace_caches.items(), (None, self._global_caches)]:
+                for name in list(sections):
+                    records = self._section_records(name, sections[name])
+                    pending.append((sections, key, name, records, _encode_section(records)))
+            merged = 0
+            written = set()
+            with _file_lock():
+                for sections, key, name, records, data in pending:
+                    path = _section_path(key, name)
+                    base = self._section_bases.get(path)
+                    fingerprint = _section_fingerprint(path)
+                    if base and fingerprint != base['fingerprint']:
+                        # Another process rewrote this section since we read it
+                        try:
+                            theirs = _read_section(path)
+                        except (OSError, ValueError):
+                            theirs = []
+                        key_field, stamp = SECTION_MERGE_KEYS.get(name, DEFAULT_MERGE_KEY)
+                        records = _merge_records(base['stamps'], records, theirs, key_field, stamp)
+                        sections[name] = self._section_value(name, records)
+                        data = _encode_section(records)
+                        merged += 1
+                    elif base and hashlib.sha1(data).digest() == base['digest']:
+                        compress = min_bytes is not None and len(data) >= min_bytes
+                        if (fingerprint[0] is not None) == compress or not data:
+                            continue  # Unchanged since read or last written
+                    _write_section(path, data, min_bytes)
+                    written.add(name)
+                    self._section_bases[path] = {'fingerprint': _section_fingerprint(path),
+                                                 'digest': hashlib.sha1(data).digest(),
+                                                 'stamps': _section_stamps(name, records)}
+                config = self._merge_header({
+                    'version': 3,
+                    'api_token': self.api_token,
+                    'workspace_id': self.workspace_id,
+                    'settings': self.settings,
+                    'frecency': self.frecency,
+                    'sync_state': self.sync_state,
+                    'data_versions': self.data_versions,
+                    'timer_state': self.timer_state
+                })
+                data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+                _atomic_write(CONFIG_FILE, data)
+                self._header_base = json.loads(data)
+                self._header_fingerprint = _file_fingerprint(CONFIG_FILE)
+                descriptions = set(self.frecency.get('descriptions', {}))
+                if (written & {'projects', 'tags', 'clients'} or descriptions != self._indexed_descriptions
+                        or not os.path.exists(NAME_INDEX_FILE)):
+                    self._write_name_index(descriptions)
+            if merged:
+                self.log(f"(Config): Merged changes from another process into {merged} cache section(s)")
             if not silent:
                 print(f"✓ Configuration saved to {CONFIG_FILE}")
         except Exception as e:
             print(f"✗ Error saving config: {e}")
 
+    def _write_name_index(self, descriptions):
+        """Rebuild the sorted name index shell completion searches (see toggl_complete.py).
+        Partitions not loaded this session are read from disk without being cached."""
+        names = {'project': [], 'tag': [], 'client': [], 'description': descriptions}
+        keys = set(self.workspace_caches)
+        if os.path.isdir(CACHE_DIR):
+            keys.update(name for name in os.listdir(CACHE_DIR)
+                        if name.isdigit() and os.path.isdir(os.path.join(CACHE_DIR, name)))
+        for key in keys:
+            partition = self.workspace_caches.get(key, {})
+            for kind in ('project', 'tag', 'client'):
+                section = kind + 's'
+                try:
+                    items = partition[section] if section in partition else _read_section(_section_path(key, section))
+                except (OSError, ValueError):
+                    items = []
+                names[kind].extend(item.get('name') for item in items)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            _atomic_write(NAME_INDEX_FILE, build_index(names))
+            self._indexed_descriptions = descriptions
+        except OSError as e:
+            self.log(f"(Config): Could not write the completion index {NAME_INDEX_FILE}: {e}")
+
+    def _merge_header(self, config):
+        """Fold in header changes another process saved since we last read or wrote the file.
+        Fields, settings and sync stamps this process left unchanged take the
+        other value; the newer timer state, the more recent use of each
+        frecency key and the higher data version of each day win."""
+        if _file_fingerprint(CONFIG_FILE) == self._header_fingerprint:
+            return config
+        try:
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                theirs = json.load(f)
+        except (OSError, ValueError):
+            return config
+        base = self._header_base
+        for field in ('api_token', 'workspace_id'):
+            if field in theirs and config[field] == base.get(field):
+                config[field] = theirs[field]
+        if (config['api_token'], config['workspace_id']) != (self.api_token, self.workspace_id):
+            self._adopt_login(config['api_token'], config['workspace_id'])
+        base_settings = base.get('settings', {})
+        for key, value in theirs.get('settings', {}).items():
+            if self.settings.get(key) == base_settings.get(key, DEFAULT_SETTINGS.get(key)):
+                self.settings[key] = value
+        base_sync, their_sync = base.get('sync_state', {}), theirs.get('sync_state', {})
+        for kind in set(base_sync) | set(their_sync) | set(self.sync_state):
+            if self.sync_state.get(kind) == base_sync.get(kind):
+                if kind in their_sync:
+                    self.sync_state[kind] = their_sync[kind]
+                else:
+                    self.sync_state.pop(kind, None)
+        for kind, scores in theirs.get('frecency', {}).items():
+            ours = self.frecency.setdefault(kind, {})
+            for key, entry in scores.items():
+                if key not in ours or entry[1] > ours[key][1]:
+                    ours[key] = entry
+        self._merge_data_versions(theirs.get('data_versions', {}))
+        their_timer = theirs.get('timer_state', {})
+        if their_timer.get('validated_at', 0) > self.timer_state.get('validated_at', 0):
+            self.timer_state.update(their_timer)
+        return config
+
+    def _adopt_login(self, api_token, workspace_id):
+        """Follow a login or workspace switch another process saved. A new token
+        may be another account: drop the client and every loaded cache section
+        so they are rebuilt and reread from disk."""
+        if api_token != self.api_token:
+            if self._client:
+                self._client.close()
+            self._client = self._client_token = None
+            self.user_data = None
+            self.workspace_caches = {}
+            self._global_caches = _LazySections(lambda name: self._load_section(None, name))
+            self._tracked_totals = None
+            self._prefetched_entries = None
+        self.api_token, self.workspace_id = api_token, workspace_id
+        self.log(f"(Config): Another process switched to workspace {workspace_id}; following it")
+
+    def _merge_data_versions(self, theirs):
+        """Take the higher of our and another process's data version, per day"""
+        for field in ('all', 'floor', 'floor_day'):
+            if field in theirs:
+                self.data_versions[field] = max(self.data_versions[field], theirs[field])
+        days = self.data_versions['days']
+        for day, stamp in theirs.get('days', {}).items():
+            days[day] = max(days.get(day, 0), stamp)
+
+    def _reload_data_versions(self):
+        """Pick up entry changes other processes saved since we last looked (one stat if none)"""
+        fingerprint = _file_fingerprint(CONFIG_FILE)
+        if fingerprint in (self._versions_fingerprint, self._header_fingerprint):
+            return
+        self._versions_fingerprint = fingerprint
+        try:
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                self._merge_data_versions(json.load(f).get('data_versions', {}))
+        except (OSError, ValueError):
+            pass
+
+    def _partition(self, workspace_id=None):
+        """Return the cache partition for a workspace; each section loads on first access"""
+        key = str(workspace_id or self.workspace_id)
+        partition = self.workspace_caches.get(key)
+        if partition is None:
+            partition = self.workspace_caches[key] = _LazySections(
+                lambda name: self._load_section(key, name))
+        return partition
+
+    def _all_partitions(self):
+        """Return the cache partition of every workspace stored on disk or accessed so far"""
+        if os.path.isdir(CACHE_DIR):
+            for name in os.listdir(CACHE_DIR):
+                if name.isdigit() and os.path.isdir(os.path.join(CACHE_DIR, name)):
+                    self._partition(name)
+        return list(self.workspace_caches.values())
+
+    def _store_entities(self, kind, items, workspace_id=None):
+        """Store fetched entities in their workspace partitions.
+
+        Without workspace_id the items come from a cross-workspace /me endpoint
+        and replace that kind in every partition (the next sync of that kind is
+        a full one); otherwise only the given workspace's partition is replaced."""
+        if workspace_id:
+            self._partition(workspace_id)[kind] = list(items)
+            partitions = [self._partition(workspace_id)]
+        else:
+            self.sync_state.pop(kind, None)
+            partitions = self._all_partitions()
+            for partition in partitions:
+                partition[kind] = []
+            for item in items:
+                self._partition(_entity_workspace(item))[kind].append(item)
+        if kind == 'tasks':
+            for partition in partitions:
+                self._index_tasks(partition)
+
+    def _remove_entities(self, kind, ids):
+        """Drop entities with the given IDs from every partition"""
+        ids = set(ids)
+        for partition in self._all_partitions():
+            partition[kind] = [item for item in partition[kind] if item.get('id') not in ids]
+
+    def _index_tasks(self, partition):
+        """Rebuild a partition's per-project task index from its full task list.
+        Only projects with tasks in it are indexed; others are fetched on first use."""
+        now = time.time()
+        index = {}
+        for task in partition['tasks']:
+            index.setdefault(str(task.get('project_id')), {'fetched_at': now, 'tasks': []})['tasks'].append(task)
+        partition['tasks_by_project'] = index
+
+    def _merge_entities(self, kind, items):
+        """Insert or update entities (matched by ID) in their workspace partitions"""
+        by_partition = {}
+        for item in items:
+            by_partition.setdefault(_entity_workspace(item), []).append(item)
+        for workspace_id, group in by_partition.items():
+            cached = self._partition(workspace_id)[kind]
+            positions = {entry.get('id'): idx for idx, entry in enumerate(cached)}
+            for item in group:
+                idx = positions.get(item.get('id'))
+                if idx is None:
+                    positions[item.get('id')] = len(cached)
+                    cached.append(item)
+                else:
+                    cached[idx] = item
+
+    def _sync_entities(self, kind, full=False):
+        """Bring a cached entity kind up to date from /me/{kind}.
+
+        After a full download, later syncs request only records created,
+        updated or deleted since the last one (the API's `since` parameter)
+        and merge them into the workspace partitions. Deleted records carry
+        server_deleted_at. A rejected delta request falls back to a full download.
+        Returns (records_received, incremental), or None if the request failed."""
+        incremental, endpoint = self._sync_endpoint(kind, full)
+        items, headers = self.api_request('GET', endpoint, with_headers=True, quiet=incremental)
+        if items is None:
+            return self._sync_entities(kind, full=True) if incremental else None
+        return self._apply_sync(kind, items, headers, incremental)
+
+    def _sync_endpoint(self, kind, full=False):
+        """(incremental, endpoint) of the next sync of an entity kind"""
+        last_sync = self.sync_state.get(kind)
+        incremental = bool(last_sync) and not full
+        endpoint = f'/me/{kind}'
+        if incremental:
+            endpoint += f'?since={int(last_sync) - SYNC_OVERLAP}'
+        return incremental, endpoint
+
+    def _apply_sync(self, kind, items, headers, incremental):
+        """Fold a /me/{kind} response into the caches (the second half of _sync_entities)"""
+        live = [item for item in items if not item.get('server_deleted_at')]
+        if incremental:
+            deleted = [item.get('id') for item in items if item.get('server_deleted_at')]
+            self._merge_entities(kind, live)
+            if deleted:
+                self._remove_entities(kind, deleted)
+            if kind == 'tasks' and items:
+                for partition in self._all_partitions():
+                    self._index_tasks(partition)
+        else:
+            self._store_entities(kind, live)
+        self.sync_state[kind] = _server_time(headers)
+        self.log(f"(Sync): {kind.capitalize()} {'delta' if incremental else 'full'}, {len(items)} record(s)")
+        return len(items), incremental
+
+    def _entries_changed(self, *entries, everything=False):
+        """Bump the data version of the days the given time entries start on
+        (every day with everything=True), so cached summaries covering them
+        are recomputed. Call after the change reached the server."""
+        self._prefetched_entries = None
+        versions = self.data_versions
+        days = versions['days']
+        stamp = max(time.time_ns(), self._data_version() + 1)
+        if everything:
+            versions['all'] = stamp
+        for day in {_entry_day(entry) for entry in entries} - {None}:
+            days[day] = stamp
+        # Fold days past the retention window into one floor version
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=VERSION_KEEP_DAYS)).date().isoformat()
+        for day in [day for day in days if day < cutoff]:
+            versions['floor'] = max(versions['floor'], days.pop(day))
+            versions['floor_day'] = max(versions['floor_day'], cutoff)
+
+    def _data_version(self, start_day='', end_day='9999-12-31'):
+        """Data version of the time entries between two days (inclusive)"""
+        versions = self.data_versions
+        stamps = [versions['all']]
+        stamps += [stamp for day, stamp in versions['days'].items() if start_day <= day <= end_day]
+        if start_day < versions['floor_day']:
+            stamps.append(versions['floor'])
+        return max(stamps)
+
+    def _cached_report(self, grouping, start_day, end_day, compute):
+        """A summary from the report cache, or compute() it and cache the result.
+
+        Reports are keyed by (range, grouping, data version of the range), so
+        a report is reused until an entry in its range changes. The least
+        recently used reports are evicted beyond report_cache_max_bytes.
+        Returns (result, cached_at); cached_at is None for a fresh result.
+        A compute() returning None (request failed) is not cached."""
+        self._reload_data_versions()
+        cache = self._global_caches['reports']
+        key = f"{grouping}|{start_day}|{end_day}|{self._data_version(start_day, end_day)}"
+        record = cache.get(key)
+        if record is not None:
+            record['used_at'] = time.time()
+            cache.move_to_end(key)
+            return record['result'], record['computed_at']
+
+        result = compute()
+        size = len(json.dumps(result, separators=(',', ':')))
+        max_bytes = self.settings['report_cache_max_bytes']
+        if result is None or size > max_bytes:
+            return result, None
+        now = time.time()
+        cache[key] = {'key': key, 'used_at': now, 'computed_at': now, 'bytes': size, 'result': result}
+        total = sum(r['bytes'] for r in cache.values())
+        while total > max_bytes:
+            _, evicted = cache.popitem(last=False)
+            total -= evicted['bytes']
+        self.save_config(silent=True)
+        return result, None
+
+    def _track_entries(self, entries, deleted=(), window=None, save=True):
+        """Fold time entries into the tracked-time ledger and its running totals.
+
+        entries are added or updated (the newer 'at' wins) and deleted ones
+        removed. With window=(start, end), entries the ledger has starting in
+        that range but missing from `entries` were deleted on the server.
+        Running entries count once stopped. Returns the entries that changed:
+        those added or updated, plus {'id', 'start'} stand-ins for the ledger
+        records removed or replaced, ready for _entries_changed."""
+        ledger = self._global_caches['tracked']
+        totals = self._tracked()
+        changed = []
+
+        def drop(key):
+            old = ledger.pop(key, None)
+            if old:
+                self._count_tracked(totals, old, -1)
+                changed.append({'id': old['id'], 'start': _api_time(datetime.fromtimestamp(old['start'], timezone.utc))})
+
+        for entry in deleted:
+            drop(str(entry.get('id')))
+        if window:
+            seen = {str(entry.get('id')) for entry in entries}
+            start, end = window[0].timestamp(), window[1].timestamp()
+            for key in [key for key, r in ledger.items() if start <= r['start'] < end and key not in seen]:
+                drop(key)
+        for entry in entries:
+            key, old = str(entry.get('id')), ledger.get(str(entry.get('id')))
+            if old and (entry.get('at') or '') < old['at']:
+                continue
+            if (entry.get('duration') or 0) <= 0 or not entry.get('start'):
+                drop(key)
+                continue
+            record = {'id': entry['id'], 'at': entry.get('at') or '',
+                      'start': int(_parse_time(entry['start']).timestamp()),
+                      'project_id': entry.get('project_id'), 'task_id': entry.get('task_id'),
+                      'seconds': entry['duration']}
+            if record != old:
+                drop(key)
+                ledger[key] = record
+                self._count_tracked(totals, record, 1)
+                changed.append(entry)
+        if changed and save:
+            self.save_config(silent=True)
+        return changed
+
+    def _tracked(self):
+        """Tracked seconds per project and task ID, summed from the ledger once
+        per process and then kept up to date by _track_entries"""
+        ledger = self._global_caches['tracked']
+        totals = self._tracked_totals
+        if totals is None or totals['ledger'] is not ledger:  # First use, or merged from another process
+            totals = self._tracked_totals = {'ledger': ledger, 'projects': {}, 'tasks': {}}
+            for record in ledger.values():
+                self._count_tracked(totals, record, 1)
+        return totals
+
+    @staticmethod
+    def _count_tracked(totals, record, sign):
+        for kind, key in (('projects', record['project_id']), ('tasks', record['task_id'])):
+            if key:
+                totals[kind][key] = totals[kind].get(key, 0) + sign * record['seconds']
+
     def log(self, message):
         """Append log entry to toggl_cli_logs.txt"""
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
@@ -117,57 +1071,232 @@ class TogglCLI:
                 names.append(tag.get('name', 'Unknown tag'))
         return names
 
-    def api_request(self, method, endpoint, data=None):
-        """Make API request to Toggl with single retry on timeout."""
+    def _emit(self, record):
+        """Send a record to the --output stream (no-op in text mode)"""
+        if self.output:
+            self.output.emit(record)
+
+    def _entry_record(self, entry):
+        """Flat --output record of a time entry; a running entry counts up to now"""
+        seconds = entry.get('duration') or 0
+        if seconds < 0:
+            seconds = int(time.time() - self._entry_start_ts(entry))
+        project_id = entry.get('project_id')
+        return {'id': entry.get('id'), 'start': entry.get('start'), 'stop': entry.get('stop'),
+                'seconds': seconds, 'description': entry.get('description') or '',
+                'project_id': project_id, 'project': self._get_project_name(project_id) if project_id else None,
+                'tags': self._get_tag_names(entry.get('tag_ids') or []) or entry.get('tags') or [],
+                'billable': bool(entry.get('billable')), 'workspace_id': entry.get('workspace_id')}
+
+    def _emit_summary(self, summary, project_name, client_name=None):
+        """Send a _summarize_entries() breakdown to --output, one record per group"""
+        if not self.output:
+            return
+        groups = [('project', summary['projects'], project_name)]
+        if summary.get('clients') and client_name:
+            groups.append(('client', summary['clients'], client_name))
+        for group, totals, name in groups:
+            for key, seconds in sorted(totals.items(), key=lambda x: -x[1]):
+                self._emit({'group': group, 'id': int(key) if key else None,
+                            'name': name(int(key) if key else None), 'seconds': seconds})
+        for tag, seconds in sorted(summary['tags'].items(), key=lambda x: -x[1]):
+            self._emit({'group': 'tag', 'id': None, 'name': tag, 'seconds': seconds})
+        for day in sorted(summary['days'], reverse=True):
+            self._emit({'group': summary.get('resolution', 'day'), 'id': None, 'name': day,
+                        'seconds': summary['days'][day]})
+        self._emit({'group': 'total', 'id': None, 'name': None, 'seconds': summary['total']})
+        self._emit({'group': 'billable', 'id': None, 'name': None, 'seconds': summary['billable']})
+
+    def _name_index(self, kind, workspace_id=None):
+        """Cached entities of one kind by _name_key(name), for duplicate checks"""
+        return {_name_key(item.get('name')): item for item in self._partition(workspace_id)[kind]}
+
+    def api_request(self, method, endpoint, data=None, with_headers=False, quiet=False):
+        """Make API request to Toggl with single retry on timeout.
+
+        With with_headers=True returns (data, response_headers) instead.
+        With quiet=True API errors are only logged, not printed."""
+        result = self._api_call(method, endpoint, data, quiet)
+        return result if with_headers else result[0]
+
+    @property
+    def client(self):
+        """Shared TogglClient for the current API token (rebuilt after login)"""
+        if self._client is None or self._client_token != self.api_token:
+            if self._client:
+                self._client.close()
+            self._client = TogglClient(self.api_token, API_BASE, self.settings['max_parallel_requests'],
+                                       on_retry=self._print_retry,
+                                       reports_base_url=self.settings['reports_base_url'] or REPORTS_BASE)
+            self._client_token = self.api_token
+        return self._client
+
+    def _print_retry(self, message):
+        """Show a client retry notice, except from the warm-up (the menu prompt is up)"""
+        if threading.current_thread() is not self._warmup_thread:
+            print(f"⏱ {message}")
+
+    def _report_error(self, error, quiet=False):
+        """Print (unless quiet) and log a failed API request"""
+        if not quiet:
+            print(f"✗ {error}")
+        self.log(f"(Error): {error}")
+
+    async def _gather(self, *coros):
+        """Run client coroutines concurrently; failed ones are reported and yield None"""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for idx, result in enumerate(results):
+            if isinstance(result, TogglAPIError):
+                self._report_error(result)
+                results[idx] = None
+            elif isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _api_call(self, method, endpoint, data=None, quiet=False):
+        """Perform the HTTP call behind api_request. Returns (data, headers).
+
+        Inside a command's request scope an identical GET made within
+        request_memo_ttl seconds reuses the earlier response; any write
+        clears the scope's memo."""
         if not self.api_token:
             print("✗ Error: Not logged in. Please login first (Option 1)")
-            return None
-
-        url = f"{API_BASE}{endpoint}"
-        auth = b64encode(f"{self.api_token}:api_token".encode()).decode('ascii')
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Basic {auth}'
-        }
-
-        for attempt in range(2):
+            return None, {}
+
+        scope = self._scope
+        if scope is not None and method == 'GET':
+            cached = scope['memo'].get(endpoint)
+            if cached and time.time() - cached[0] < self.settings['request_memo_ttl']:
+                scope['reused'] += 1
+                return copy.deepcopy(cached[1])
+        try:
+            result = self.client.request_blocking(method, endpoint, data)
+        except TogglAPIError as e:
+            self._report_error(e, quiet)
+            return None, e.headers
+
+        applied = method != 'GET' and self._apply_write_response(method, endpoint, result[0])
+        if scope is not None:
+            if method == 'GET':
+                scope['memo'][endpoint] = (time.time(), copy.deepcopy(result))
+            else:
+                scope['memo'].clear()
+                scope['applied'] += applied
+        return result
+
+    def _apply_write_response(self, method, endpoint, result):
+        """Fold the response of a project/tag/client write into the caches,
+        so the list does not have to be downloaded again. Returns True if applied."""
+        match = CACHED_WRITE_ENDPOINT.match(endpoint.split('?')[0])
+        if not match:
+            return False
+        workspace_id, kind, entity_id = match.groups()
+        if method == 'DELETE' and entity_id:
+            self._remove_entities(kind, [int(entity_id)])
+        elif isinstance(result, dict) and result.get('id'):
+            result.setdefault('workspace_id', int(workspace_id))
+            self._merge_entities(kind, [result])
+        else:
+            return False
+        return True
+
+    @contextmanager
+    def _request_scope(self, command):
+        """Scope one menu command: memoize its GETs and report the calls saved by
+        reuse, single-flight coalescing and write responses applied to caches."""
+        def client_stats():
+            return dict(self._client.stats) if self._client else {}
+
+        before = client_stats()
+        self._scope = scope = {'memo': {}, 'reused': 0, 'applied': 0}
+        try:
+            yield scope
+        finally:
+            self._scope = None
+            after = client_stats()
+            # The client is rebuilt after a login, which restarts its counters
+            for key in ('calls', 'coalesced'):
+                stat = 'requests' if key == 'calls' else key
+                scope[key] = max(0, after.get(stat, 0) - before.get(stat, 0))
+            for key in self.request_totals:
+                self.request_totals[key] += scope[key]
+            saved = scope['reused'] + scope['coalesced'] + scope['applied']
+            if saved:
+                print(f"⚡ {saved} API call(s) saved ({scope['calls']} made)")
+                self.log(f"(Requests): Command {command} - {scope['calls']} made, {scope['reused']} reused, "
+                         f"{scope['coalesced']} coalesced, {scope['applied']} write(s) applied to cache")
+
+    def _start_warmup(self):
+        """Warm the connection and caches in the background while the menu waits for input.
+
+        Runs at most once per warmup_interval: revalidates a stale timer
+        state, prefetches the last 7 days of entries and syncs projects and
+        tags that are empty or older than warmup_sync_age. Requests are made
+        outside _state_lock; results are applied under it, and only until
+        _stop_warmup() is called. Failures are only logged."""
+        interval = self.settings['warmup_interval']
+        if not self.api_token or not interval or time.time() - self._warmed_at < interval:
+            return
+        if self._warmup_thread and self._warmup_thread.is_alive():
+            return
+        self._warmed_at = time.time()
+        self._warmup_cancel.clear()
+        self._warmup_thread = threading.Thread(target=self._warm_up, name='toggl-warmup', daemon=True)
+        self._warmup_thread.start()
+
+    def _stop_warmup(self):
+        """Stop applying warm-up results; a request still in flight finishes in the
+        background, and an identical GET by the next command shares it."""
+        self._warmup_cancel.set()
+
+    def _warm_up(self):
+        """Body of the warm-up thread (see _start_warmup)"""
+        with self._state_lock:
+            client = self.client
+            stale_timer = time.time() - self.timer_state.get('validated_at', 0) >= self.settings['timer_state_ttl']
+            start_day, _, start_date, end_date = _report_range(7)
+            syncs = [(kind, *self._sync_endpoint(kind)) for kind in ('projects', 'tags')
+                     if not self._partition()[kind]
+                     or time.time() - self.sync_state.get(kind, 0) >= self.settings['warmup_sync_age']]
+
+        def prefetch(entries, fetched_at):
+            if entries is not None:
+                changed = self._track_entries(entries, window=(_parse_time(start_date), _parse_time(end_date)),
+                                              save=False)
+                if changed:
+                    self._entries_changed(*changed)  # Before the prefetch, which it would discard
+            self._prefetched_entries = {'at': fetched_at, 'start_day': start_day, 'entries': entries or []}
+
+        # (name, endpoint, apply(data, headers, fetched_at))
+        steps = []
+        if stale_timer:
+            steps.append(('timer', '/me/time_entries/current', lambda current, *_: self._apply_current(current)))
+        steps.append(('entries', f'/me/time_entries?start_date={start_date}&end_date={end_date}',
+                      lambda entries, headers, fetched_at: prefetch(entries, fetched_at)))
+        for kind, incremental, endpoint in syncs:
+            steps.append((kind, endpoint, lambda items, headers, _, kind=kind, incremental=incremental:
+                          self._apply_sync(kind, items, headers, incremental)))
+
+        done = []
+        for name, endpoint, apply in steps:
+            if self._warmup_cancel.is_set():
+                break
+            fetched_at = time.time()
             try:
-                if method == 'GET':
-                    response = requests.get(url, headers=headers, timeout=30)
-                elif method == 'POST':
-                    response = requests.post(url, headers=headers, json=data, timeout=30)
-                elif method == 'PATCH':
-                    response = requests.patch(url, headers=headers, json=data, timeout=30)
-                elif method == 'PUT':
-                    response = requests.put(url, headers=headers, json=data, timeout=30)
-                elif method == 'DELETE':
-                    response = requests.delete(url, headers=headers, timeout=30)
-                else:
-                    return None
-
-                if response.status_code in (200, 201):
-                    return response.json()
-                if response.status_code == 204:
-                    return {}
-                else:
-                    error_msg = f"API Error {response.status_code}: {response.text}"
-                    print(f"✗ {error_msg}")
-                    self.log(f"(Error): {error_msg}")
-                    return None
-
-            except requests.exceptions.Timeout:
-                if attempt == 0:
-                    print("⏱ Timeout, retrying...")
-                    continue
-                error_msg = "Network error: Request timed out after retry"
-                print(f"✗ {error_msg}")
-                self.log(f"(Error): {error_msg}")
-                return None
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Network error: {e}"
-                print(f"✗ {error_msg}")
-                self.log(f"(Error): {error_msg}")
-                return None
+                data, headers = client.request_blocking('GET', endpoint)
+            except TogglAPIError as e:
+                self.log(f"(Warm-up): {name} failed: {e}")
+                continue
+            with self._state_lock:
+                if self._warmup_cancel.is_set():
+                    break  # A command started meanwhile; it fetches what it needs itself
+                apply(data, headers, fetched_at)
+                done.append(name)
+        if done:
+            with self._state_lock:
+                if not self._warmup_cancel.is_set():
+                    self.save_config(silent=True)
+            self.log(f"(Warm-up): {', '.join(done)}")
 
     def login(self):
         """Login and setup workspace"""
@@ -197,6 +1326,7 @@ class TogglCLI:
         if not workspaces:
             print("✗ Could not fetch workspaces")
             return
+        self.cached_workspaces = workspaces
 
         print("\n=== SELECT WORKSPACE ===")
         for idx, ws in enumerate(workspaces, 1):
@@ -208,17 +1338,13 @@ class TogglCLI:
                 self.workspace_id = workspaces[choice - 1]['id']
                 print(f"✓ Selected workspace: {workspaces[choice - 1]['name']}")
                 
-                # Fetch and cache projects and tags
+                # Fetch and cache projects and tags (full download for a new login)
                 print("\n⏳ Fetching projects and tags for cache...")
-                projects = self.api_request('GET', '/me/projects')
-                tags = self.api_request('GET', '/me/tags')
-                
-                if projects:
-                    self.cached_projects = projects
-                    print(f"✓ Cached {len(projects)} projects")
-                if tags:
-                    self.cached_tags = tags
-                    print(f"✓ Cached {len(tags)} tags")
+                if self._sync_entities('projects', full=True):
+                    print(f"✓ Cached {len(self.cached_projects)} projects")
+                if self._sync_entities('tags', full=True):
+                    print(f"✓ Cached {len(self.cached_tags)} tags")
+                self._entries_changed(everything=True)  # Possibly another account's entries
                 
                 self.save_config()
             else:
@@ -226,6 +1352,42 @@ class TogglCLI:
         except ValueError:
             print("✗ Please enter a valid number")
 
+    def switch_workspace(self):
+        """Switch the active workspace using cached data (no refetch)"""
+        if not self.api_token:
+            print("✗ Please login first")
+            return
+
+        workspaces = self.cached_workspaces
+        if not workspaces:
+            # Only needed once; the list is cached afterwards
+            workspaces = self.api_request('GET', '/me/workspaces')
+            if not workspaces:
+                print("✗ Could not fetch workspaces")
+                return
+            self.cached_workspaces = workspaces
+
+        print("\n=== SWITCH WORKSPACE ===")
+        for idx, ws in enumerate(workspaces, 1):
+            current = " (current)" if ws['id'] == self.workspace_id else ""
+            print(f"{idx}. {ws['name']}{current}")
+
+        choice = input("\nSelect workspace (number or name): ").strip()
+        selected = self._fuzzy_select_with(workspaces, choice)
+        if not selected:
+            return
+
+        self.workspace_id = selected['id']
+        self.save_config(silent=True)
+
+        projects, tags = self.cached_projects, self.cached_tags
+        print(f"✓ Switched to workspace: {selected['name']}")
+        if projects or tags:
+            print(f"⚡ Using cached data: {len(projects)} projects, {len(tags)} tags")
+        else:
+            print("ℹ No cached data for this workspace yet — it will load on first use")
+        self.log(f"(Switch): Workspace {selected['name']}")
+
     def start_timer(self):
         """Start a new time entry"""
         if not self.workspace_id:
@@ -233,7 +1395,16 @@ class TogglCLI:
             return
 
         print("\n=== START TIMER ===")
-        description = input("Enter task description: ").strip()
+        suggestions = self._frecency_top('descriptions', 5)
+        if suggestions:
+            print("💡 Suggested:")
+            for idx, text in enumerate(suggestions, 1):
+                print(f"  {idx}. {text}")
+            description = input("Enter task description (or suggestion number): ").strip()
+            if description.isdigit() and 1 <= int(description) <= len(suggestions):
+                description = suggestions[int(description) - 1]
+        else:
+            description = input("Enter task description: ").strip()
         
         if not description:
             print("✗ Description cannot be empty")
@@ -243,25 +1414,21 @@ class TogglCLI:
         use_project = input("Track to a project? (y/n) [n]: ").strip().lower()
         project_id = None
         project_name = None
+        task_id = None
+        task_name = None
 
         if use_project in ['y', 'yes']:
             projects = self.list_projects(return_data=True)
             if projects:
-                recent_ids = self._get_recent_project_ids()
-                recent = [p for p in projects if p['id'] in recent_ids]
+                by_id = {p['id']: p for p in projects}
+                recent = [by_id[pid] for pid in self._get_recent_project_ids() if pid in by_id]
+                preamble = []
                 if recent:
-                    print("\n=== RECENT PROJECTS ===")
-                    for idx, project in enumerate(recent, 1):
-                        active = "✓" if project.get('active', True) else "✗"
-                        print(f"{idx}. {project['name']} [{active}]")
-
-                print("\n=== ALL PROJECTS ===")
-                for idx, project in enumerate(projects, 1):
-                    active = "✓" if project.get('active', True) else "✗"
-                    print(f"{idx}. {project['name']} [{active}]")
-                print("P. Create New Project")
+                    preamble.append("\n=== RECENT PROJECTS ===")
+                    preamble += [_project_row(idx, project) for idx, project in enumerate(recent, 1)]
 
-                choice = input("\nSelect project (number, name, or P): ").strip()
+                choice = self._pick(projects, "ALL PROJECTS", "\nSelect project (number, name, or P): ",
+                                    _project_row, ["P. Create New Project"], ('p',), preamble)
 
                 if choice.lower() == 'p':
                     project_id, project_name = self._quick_create_project()
@@ -281,6 +1448,10 @@ class TogglCLI:
         elif use_project and use_project not in ['n', 'no', '']:
             print(f"✗ '{use_project}' is not valid. Enter 'y' or 'n'. Skipping project.")
 
+        # Ask for task (optional, only the selected project's tasks are loaded)
+        if project_id:
+            task_id, task_name = self._select_task(project_id)
+
         # Ask for tags (optional)
         use_tags = input("Add tags? (y/n) [n]: ").strip().lower()
         tag_ids = []
@@ -288,12 +1459,14 @@ class TogglCLI:
         if use_tags in ['y', 'yes']:
             tags = self.list_tags(return_data=True)
             if tags:
-                print("\n=== YOUR TAGS ===")
-                for idx, tag in enumerate(tags, 1):
-                    print(f"{idx}. {tag['name']}")
-                print("T. Create New Tag")
+                options = ["T. Create New Tag"]
+                tag_names = {str(t['id']): t['name'] for t in tags}
+                suggested = [tag_names[tid] for tid in self._frecency_top('tags', 5) if tid in tag_names]
+                if suggested:
+                    options.append(f"⭐ Suggested: {', '.join(suggested)}")
 
-                tag_input = input("\nEnter tags (numbers, names, T for new, comma-separated): ").strip()
+                tag_input = self._pick(tags, "YOUR TAGS", "\nEnter tags (numbers, names, T for new, comma-separated): ",
+                                       options=options, commands=('t',), multi=True)
 
                 # Process mixed input (e.g., "1,T,3" or "1,urgent,3")
                 for item in tag_input.split(','):
@@ -333,16 +1506,33 @@ class TogglCLI:
         if project_id:
             data["project_id"] = project_id
 
+        if task_id:
+            data["task_id"] = task_id
+
         if tag_ids:
             data["tag_ids"] = tag_ids
 
+        data = self._preflight(data)
+        if data is None:
+            return
+        project_id, tag_ids = data.get('project_id'), data.get('tag_ids') or []
+        project_name = project_name if project_id else None
+        task_name = task_name if data.get('task_id') else None
+
         result = self.api_request('POST', f'/workspaces/{self.workspace_id}/time_entries', data)
 
         if result:
             project_info = f" → {project_name}" if project_name else " (no project)"
+            if task_name:
+                project_info += f" / {task_name}"
             tags_info = f" [tags: {len(tag_ids)}]" if tag_ids else ""
             print(f"✓ Timer started: {description}{project_info}{tags_info}")
             self.log(f"(Start): {description}{project_info}{tags_info}")
+            # Toggl stops any running entry when a new one starts
+            previous = self.timer_state.get('running')
+            self._entries_changed(result, previous)
+            self._set_timer_state(running=result, last_stopped=previous or self.timer_state.get('last_stopped'))
+            self._record_usage(description, project_id, tag_ids)
         else:
             print("✗ Failed to start timer")
 
@@ -352,14 +1542,22 @@ class TogglCLI:
             print("✗ Please login first")
             return
 
-        current = self.api_request('GET', f'/me/time_entries/current')
-        
-        if not current or not current.get('id'):
-            print("✗ No timer is currently running")
-            return
-
-        entry_id = current['id']
-        result = self.api_request('PATCH', f'/workspaces/{self.workspace_id}/time_entries/{entry_id}/stop', {})
+        # A locally known running entry is stopped with a single PATCH; the
+        # PATCH itself fails if it was already stopped elsewhere
+        current = self.timer_state.get('running')
+        result = None
+        if current:
+            result = self._stop_entry(current, quiet=True)
+        if not result:
+            try:
+                current = self._fetch_current()
+            except TogglAPIError as e:
+                self._report_error(e)
+                return
+            if not current:
+                print("✗ No timer is currently running")
+                return
+            result = self._stop_entry(current)
 
         if result:
             description = current.get('description', 'Untitled')
@@ -370,14 +1568,64 @@ class TogglCLI:
         else:
             print("✗ Failed to stop timer")
 
+    def _stop_entry(self, entry, quiet=False):
+        """PATCH-stop a running entry and record it as the last stopped one"""
+        workspace_id = entry.get('workspace_id') or self.workspace_id
+        result = self.api_request('PATCH', f'/workspaces/{workspace_id}/time_entries/{entry["id"]}/stop', {},
+                                  quiet=quiet)
+        if result:
+            self._entries_changed(result)
+            self._track_entries([result], save=False)
+            self._set_timer_state(running=None, last_stopped=result)
+        return result
+
+    def _set_timer_state(self, **changes):
+        """Update the locally tracked timer state and persist it"""
+        now = time.time()
+        running = self.timer_state.get('running') or {}
+        if 'running' in changes and (changes['running'] or {}).get('id') != running.get('id'):
+            self.timer_state['changed_at'] = now
+        self.timer_state.update(changes)
+        self.timer_state['validated_at'] = now
+        self.save_config(silent=True)
+
+    def _fetch_current(self):
+        """Fetch the running entry from the server and refresh the local state.
+        Raises TogglAPIError if the request fails, leaving the local state as it
+        was: a failed check says nothing about whether a timer is running."""
+        return self._apply_current(self.client.request_blocking('GET', '/me/time_entries/current')[0])
+
+    def _apply_current(self, current):
+        """Record a /me/time_entries/current response as the local timer state"""
+        # The API answers null when nothing is running
+        current = current if current and current.get('id') else None
+        running = self.timer_state.get('running')
+        if running and (not current or current['id'] != running['id']):
+            # Stopped from another device; still the best candidate to resume
+            self._set_timer_state(running=current, last_stopped=running)
+        else:
+            self._set_timer_state(running=current)
+        return current
+
+    def _get_current(self):
+        """Return the running entry, from local state while it is fresh"""
+        age = time.time() - self.timer_state.get('validated_at', 0)
+        if age < self.settings['timer_state_ttl']:
+            return self.timer_state.get('running')
+        return self._fetch_current()
+
     def current_timer(self):
         """Show current running timer"""
         if not self.workspace_id:
             print("✗ Please login first")
             return
 
-        current = self.api_request('GET', f'/me/time_entries/current')
-        
+        try:
+            current = self._get_current()
+        except TogglAPIError as e:
+            self._report_error(e)
+            return
+
         if not current or not current.get('id'):
             print("ℹ No timer is currently running")
             return
@@ -406,6 +1654,76 @@ class TogglCLI:
         if tag_names:
             print(f"Tags: {', '.join(tag_names)}")
         print(f"Duration: {time_str}")
+        self._emit(self._entry_record(current))
+
+    def watch_timer(self):
+        """Live view of the running timer.
+
+        Elapsed time is redrawn locally every second. The server is checked
+        on an adaptive schedule: every watch_min_interval seconds right after
+        a change, doubling up to watch_max_interval while nothing changes."""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return
+
+        min_interval = self.settings['watch_min_interval']
+        max_interval = self.settings['watch_max_interval']
+        try:
+            current = self._get_current()
+        except TogglAPIError as e:
+            self._report_error(e)
+            current = self.timer_state.get('running')  # Best guess until the next check
+        # Poll sooner if something changed recently (e.g. a timer just started)
+        since_change = time.time() - self.timer_state.get('changed_at', 0)
+        interval = min_interval if since_change < max_interval else max_interval / 2
+        next_check = time.time() + interval
+        checks = 0
+
+        print("\n👁  WATCHING TIMER (Ctrl+C to return to menu)")
+        try:
+            while True:
+                now = time.time()
+                if now >= next_check:
+                    previous_id = (current or {}).get('id')
+                    checks += 1
+                    try:
+                        current = self._fetch_current()
+                        changed = (current or {}).get('id') != previous_id
+                    except TogglAPIError as e:
+                        # Keep showing what we last knew; a failed check is not a change
+                        self.log(f"(Error): {e}")
+                        sys.stdout.write("\r" + f"⚠️  Check failed: {e}"[:79].ljust(79) + "\n")
+                        changed = False
+                    if changed:
+                        change = "started" if current else "stopped"
+                        sys.stdout.write("\r" + f"↻ Timer {change} elsewhere".ljust(79) + "\n")
+                        interval = min_interval
+                    else:
+                        interval = min(interval * 2, max_interval)
+                    next_check = now + interval
+
+                if current:
+                    elapsed = int(now - self._entry_start_ts(current))
+                    hours, rest = divmod(max(elapsed, 0), 3600)
+                    project = self._get_project_name(current.get('project_id'))
+                    line = (f"⏱ {current.get('description') or 'Untitled'} → {project} | "
+                            f"{hours}h {rest // 60:02d}m {rest % 60:02d}s")
+                else:
+                    line = "ℹ No timer running"
+                wait = int(next_check - now)
+                # Pad instead of ANSI clear-line so plain Windows consoles work too
+                sys.stdout.write("\r" + f"{line}  (next sync in {wait // 60}m {wait % 60:02d}s)".ljust(79))
+                sys.stdout.flush()
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"\n✓ Stopped watching ({checks} API call(s))")
+
+    def _entry_start_ts(self, entry):
+        """Unix timestamp of an entry's start, or now if it cannot be parsed"""
+        try:
+            return datetime.fromisoformat(entry.get('start', '').replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return time.time()
 
     def list_projects(self, return_data=False):
         """List all projects. Uses cache when return_data=True, fetches from API otherwise."""
@@ -417,32 +1735,39 @@ class TogglCLI:
         if return_data:
             if self.cached_projects:
                 return self.cached_projects
-            # No cache, need to fetch
-            projects = self.api_request('GET', '/me/projects')
+            # No cache for this workspace, load just its partition
+            projects = self.api_request('GET', f'/workspaces/{self.workspace_id}/projects')
             if projects:
-                self.cached_projects = projects
+                self._store_entities('projects', projects, self.workspace_id)
                 self.save_config(silent=True)
-                return projects
+                return self.cached_projects
             return []
 
-        # Called from menu (option 11) - always fetch fresh and update cache
-        print("\n⏳ Fetching projects from Toggl...")
-        projects = self.api_request('GET', '/me/projects')
-        
+        # Called from menu (option 11) - sync with Toggl (only changes after the first time)
+        print("\n⏳ Syncing projects with Toggl...")
+        result = self._sync_entities('projects')
+        if result is None:
+            return []
+        self.save_config(silent=True)
+        projects = [item for partition in self._all_partitions() for item in partition['projects']]
+
         if not projects:
             print("ℹ No projects found")
             return []
 
-        # Update cache
-        self.cached_projects = projects
-        self.save_config(silent=True)
-
         print("\n=== YOUR PROJECTS (Updated) ===")
         for idx, project in enumerate(projects, 1):
             active = "✓" if project.get('active', True) else "✗"
             print(f"{idx}. {project['name']} [{active}]")
-        
-        print(f"\n✓ Cache updated with {len(projects)} projects")
+            self._emit({'id': project.get('id'), 'name': project.get('name'),
+                        'workspace_id': project.get('workspace_id'), 'client_id': project.get('client_id'),
+                        'active': project.get('active', True)})
+
+        received, incremental = result
+        if incremental:
+            print(f"\n✓ Cache synced: {received} changed project(s) since last sync, {len(projects)} total")
+        else:
+            print(f"\n✓ Cache updated with {len(projects)} projects")
         return []
 
     def list_tags(self, return_data=False):
@@ -455,31 +1780,36 @@ class TogglCLI:
         if return_data:
             if self.cached_tags:
                 return self.cached_tags
-            # No cache, need to fetch
-            tags = self.api_request('GET', '/me/tags')
+            # No cache for this workspace, load just its partition
+            tags = self.api_request('GET', f'/workspaces/{self.workspace_id}/tags')
             if tags:
-                self.cached_tags = tags
+                self._store_entities('tags', tags, self.workspace_id)
                 self.save_config(silent=True)
-                return tags
+                return self.cached_tags
             return []
 
-        # Called from menu (option 12) - always fetch fresh and update cache
-        print("\n⏳ Fetching tags from Toggl...")
-        tags = self.api_request('GET', '/me/tags')
-        
+        # Called from menu (option 12) - sync with Toggl (only changes after the first time)
+        print("\n⏳ Syncing tags with Toggl...")
+        result = self._sync_entities('tags')
+        if result is None:
+            return []
+        self.save_config(silent=True)
+        tags = [item for partition in self._all_partitions() for item in partition['tags']]
+
         if not tags:
             print("ℹ No tags found")
             return []
 
-        # Update cache
-        self.cached_tags = tags
-        self.save_config(silent=True)
-
         print("\n=== YOUR TAGS (Updated) ===")
         for idx, tag in enumerate(tags, 1):
             print(f"{idx}. {tag['name']}")
-        
-        print(f"\n✓ Cache updated with {len(tags)} tags")
+            self._emit({'id': tag.get('id'), 'name': tag.get('name'), 'workspace_id': tag.get('workspace_id')})
+
+        received, incremental = result
+        if incremental:
+            print(f"\n✓ Cache synced: {received} changed tag(s) since last sync, {len(tags)} total")
+        else:
+            print(f"\n✓ Cache updated with {len(tags)} tags")
         return []
 
     def _quick_create_project(self):
@@ -491,10 +1821,9 @@ class TogglCLI:
             print("✗ Project name cannot be empty")
             return None, None
 
-        for p in self.cached_projects:
-            if p.get('name', '').strip().casefold() == name.strip().casefold():
-                print(f"✗ Project '{name}' already exists (use option 11 to see all)")
-                return None, None
+        if _name_key(name) in self._name_index('projects'):
+            print(f"✗ Project '{name}' already exists (use option 11 to see all)")
+            return None, None
 
         data = {
             "name": name,
@@ -507,9 +1836,7 @@ class TogglCLI:
         if result:
             print(f"✓ Project created: {name}")
             self.log(f"(Create Project): {name}")
-            # Add to cache directly (no extra API call)
-            self.cached_projects.append(result)
-            self._recent_project_ids = None  # Invalidate recent project cache
+            # _apply_write_response already added it to the cache (no extra API call)
             self.save_config(silent=True)
             return result.get('id'), name
         else:
@@ -525,10 +1852,9 @@ class TogglCLI:
             print("✗ Tag name cannot be empty")
             return None
 
-        for t in self.cached_tags:
-            if t.get('name', '').strip().casefold() == name.strip().casefold():
-                print(f"✗ Tag '{name}' already exists (use option 12 to see all)")
-                return None
+        if _name_key(name) in self._name_index('tags'):
+            print(f"✗ Tag '{name}' already exists (use option 12 to see all)")
+            return None
 
         data = {"name": name}
 
@@ -537,36 +1863,70 @@ class TogglCLI:
         if result:
             print(f"✓ Tag created: {name}")
             self.log(f"(Create Tag): {name}")
-            # Add to cache directly (no extra API call)
-            self.cached_tags.append(result)
+            # _apply_write_response already added it to the cache (no extra API call)
             self.save_config(silent=True)
             return result.get('id')
         else:
             print("✗ Failed to create tag")
             return None
 
-    def _fuzzy_select(self, items, prompt_text="Select"):
-        """Let user type a number OR partial name to select from a list."""
-        choice = input(prompt_text).strip()
-        # Try as number first
-        try:
-            idx = int(choice)
-            if 1 <= idx <= len(items):
-                return items[idx - 1]
-            print(f"✗ Number out of range (1-{len(items)})")
-            return None
-        except ValueError:
-            pass
-        # Fuzzy match by name
-        choice_lower = choice.lower()
-        matches = [i for i in items if choice_lower in i.get('name', '').lower()]
-        if len(matches) == 1:
-            return matches[0]
-        elif len(matches) > 1:
-            print(f"✗ Ambiguous — {len(matches)} matches. Be more specific.")
-        else:
-            print(f"✗ No match for '{choice}'")
-        return None
+    def _pick(self, items, title, prompt, row=_name_row, options=(), commands=(), preamble=(), multi=False):
+        """Show a long list one window at a time and read the user's choice.
+
+        Each screen is rendered in a single write. '>' and '<' page, '/text'
+        filters by name ('/' alone shows all again), and a name matching several
+        items narrows the list to them, so typing more refines it. Rows keep
+        their number in the full list and a name unique among the shown rows
+        is returned as its number, so the result goes straight to
+        _fuzzy_select_with(items, choice). With multi=True the choice is a
+        comma-separated list and each part is resolved the same way.
+        Strings in commands (e.g. 'p') are returned as typed."""
+        rows = self.settings['picker_rows'] or max(10, shutil.get_terminal_size().lines - 12)
+        names = [str(item.get('name', '')).casefold() for item in items]
+        view = list(range(len(items)))
+        page, filter_text = 0, ''
+        while True:
+            pages = max(1, -(-len(view) // rows))
+            page = max(0, min(page, pages - 1))
+            window = view[page * rows:(page + 1) * rows]
+            lines = list(preamble) + [f"\n=== {title} ==="]
+            lines += [row(idx + 1, items[idx]) for idx in window]
+            if pages > 1 or filter_text:
+                shown = f"{page * rows + 1}-{page * rows + len(window)} of {len(view)}" if window else "none"
+                where = f" matching '{filter_text}'" if filter_text else ""
+                lines.append(f"── {shown}{where}  |  > next  < prev  /text filter  / all ──")
+            lines += list(options)
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+
+            choice = input(prompt).strip()
+            if choice in ('>', '<'):
+                page += 1 if choice == '>' else -1
+                continue
+            if choice.startswith('/'):
+                filter_text = choice[1:].strip().casefold()
+                view = [idx for idx, name in enumerate(names) if filter_text in name]
+                page = 0
+                continue
+
+            resolved = []
+            for part in ([p.strip() for p in choice.split(',')] if multi else [choice]):
+                if not part or part.isdigit() or part.lower() in commands:
+                    resolved.append(part)
+                    continue
+                needle = part.casefold()
+                matches = [idx for idx in view if needle in names[idx]]
+                exact = [idx for idx in matches if names[idx] == needle]
+                if len(exact) == 1 or len(matches) == 1:
+                    resolved.append(str((exact or matches)[0] + 1))
+                elif len(matches) > 1 and not multi:
+                    break  # Narrow the list and ask again
+                else:
+                    resolved.append(part)
+            else:
+                return ','.join(resolved)
+            filter_text, view, page = needle, matches, 0
+            print(f"🔎 {len(matches)} matches — pick a number or type more of the name")
 
     def _fuzzy_select_with(self, items, choice):
         """Select item by number or partial name from a pre-read choice string."""
@@ -592,31 +1952,153 @@ class TogglCLI:
             print(f"✗ No match for '{choice}'")
         return None
 
-    def _get_recent_project_ids(self, limit=5):
-        """Get project IDs from today's most recent entries (cached for 5 min)."""
-        import time
+    def _record_usage(self, description=None, project_id=None, tag_ids=None):
+        """Update the local frecency model after a successful start/resume/edit"""
         now = time.time()
-        if self._recent_project_ids is not None and (now - self._recent_project_ids_ts) < 300:
-            return self._recent_project_ids
+        half_life = self.settings['frecency_half_life_days'] * 86400
+        used = {
+            'descriptions': [description] if description else [],
+            'projects': [project_id] if project_id else [],
+            'tags': tag_ids or [],
+        }
+        for kind, keys in used.items():
+            scores = self.frecency.setdefault(kind, {})
+            for key in keys:
+                score, last_used = scores.get(str(key), (0.0, now))
+                # Decay the old score to now, then count this use
+                scores[str(key)] = [score * 0.5 ** ((now - last_used) / half_life) + 1.0, now]
+            if len(scores) > FRECENCY_MAX_ITEMS:
+                keep = self._frecency_top(kind, FRECENCY_MAX_ITEMS)
+                self.frecency[kind] = {key: scores[key] for key in keep}
+        self.save_config(silent=True)
 
-        if not self.workspace_id:
-            return set()
-        start_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0).isoformat().replace('+00:00', 'Z')
-        end_date = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
-        if not entries:
-            return set()
-        recent_ids = set()
-        for e in reversed(entries[-10:]):
-            pid = e.get('project_id')
-            if pid:
-                recent_ids.add(pid)
-                if len(recent_ids) >= limit:
-                    break
+    def _frecency_top(self, kind, limit):
+        """Return up to `limit` keys of a frecency kind, best (frequent and recent) first"""
+        now = time.time()
+        half_life = self.settings['frecency_half_life_days'] * 86400
+        scores = self.frecency.get(kind, {})
+        ranked = sorted(scores.items(),
+                        key=lambda item: -item[1][0] * 0.5 ** ((now - item[1][1]) / half_life))
+        return [key for key, _ in ranked[:limit]]
 
-        self._recent_project_ids = recent_ids
-        self._recent_project_ids_ts = now
-        return recent_ids
+    def _get_recent_project_ids(self, limit=5):
+        """Get the most-used recent project IDs from the local frecency model (no API call)."""
+        return [int(pid) for pid in self._frecency_top('projects', limit)]
+
+    def _get_project_tasks(self, project_id, force=False):
+        """Get a project's tasks, fetching only that project's list when stale."""
+        index = self._partition()['tasks_by_project']
+        cached = index.get(str(project_id))
+        if cached and not force and time.time() - cached['fetched_at'] < self.settings['task_ttl']:
+            return cached['tasks']
+
+        tasks = self.api_request('GET', f'/workspaces/{self.workspace_id}/projects/{project_id}/tasks')
+        if tasks is None:
+            return cached['tasks'] if cached else []
+        index[str(project_id)] = {'fetched_at': time.time(), 'tasks': tasks}
+        self.save_config(silent=True)
+        return tasks
+
+    def _select_task(self, project_id):
+        """Offer the project's active tasks for selection.
+        Returns (task_id, task_name), or (None, None) if skipped or none exist."""
+        tasks = [t for t in self._get_project_tasks(project_id) if t.get('active', True)]
+        if not tasks:
+            return None, None
+
+        choice = self._pick(tasks, "PROJECT TASKS", "\nSelect task (number, name, or Enter to skip): ")
+        selected = self._fuzzy_select_with(tasks, choice)
+        if selected:
+            return selected['id'], selected['name']
+        return None, None
+
+    def _check_entry(self, data, entry=None):
+        """Problems the API would reject a time entry payload for, found in the
+        local caches (entry: the entry being edited). Returns [(problem, fix)];
+        fix is a dict of payload changes, or None if only the user can fix it.
+        IDs missing from the caches trigger one delta sync of that kind."""
+        workspace_id = data.get('workspace_id')
+        problems = []
+        if workspace_id != self.workspace_id:
+            problems.append((f"Payload names workspace {workspace_id}, not the active one",
+                             {'workspace_id': self.workspace_id}))
+        if entry and entry.get('workspace_id') not in (None, self.workspace_id):
+            problems.append(("The entry is in another workspace → switch to it first (main menu 15)", None))
+
+        def lookup(kind, ids):
+            found = {item['id']: item for partition in self._all_partitions()
+                     for item in partition[kind] if item.get('id') in ids}
+            if set(ids) - set(found) and self._sync_entities(kind) is not None:
+                found = {item['id']: item for partition in self._all_partitions()
+                         for item in partition[kind] if item.get('id') in ids}
+            return found
+
+        project_id = data.get('project_id')
+        if project_id:
+            project = lookup('projects', {project_id}).get(project_id)
+            name = f"'{project['name']}'" if project else f"#{project_id}"
+            if not project:
+                problems.append((f"Project {name} no longer exists → leave the project out",
+                                 {'project_id': None, 'task_id': None}))
+            elif project.get('workspace_id') != workspace_id:
+                problems.append((f"Project {name} is in another workspace → leave the project out",
+                                 {'project_id': None, 'task_id': None}))
+            elif not project.get('active', True):
+                problems.append((f"Project {name} is archived → leave the project out",
+                                 {'project_id': None, 'task_id': None}))
+            elif data.get('task_id'):
+                task = next((t for t in self._get_project_tasks(project_id)
+                             if t.get('id') == data['task_id']), None)
+                if not task or not task.get('active', True):
+                    reason = "is done or archived" if task else "is not a task of this project"
+                    problems.append((f"Task #{data['task_id']} {reason} → leave the task out", {'task_id': None}))
+        elif data.get('task_id'):
+            problems.append(("A task needs a project → leave the task out", {'task_id': None}))
+
+        tag_ids = data.get('tag_ids') or []
+        if tag_ids:
+            tags = lookup('tags', set(tag_ids))
+            bad = [tid for tid in tag_ids if tid not in tags or tags[tid].get('workspace_id') != workspace_id]
+            if bad:
+                names = ', '.join(f"'{tags[tid]['name']}'" if tid in tags else f"#{tid}" for tid in bad)
+                problems.append((f"Tag(s) {names} deleted or in another workspace → leave them out",
+                                 {'tag_ids': [tid for tid in tag_ids if tid not in bad]}))
+
+        try:
+            start = _parse_time(data['start']).timestamp()
+        except (KeyError, AttributeError, ValueError):
+            problems.append(("Start time is missing or not an ISO 8601 time", None))
+        else:
+            duration = data.get('duration')
+            now = time.time()
+            if not isinstance(duration, int):
+                problems.append(("Duration is missing or not a whole number of seconds", None))
+            elif duration < 0 and start > now + 60:
+                problems.append(("A running timer cannot start in the future", None))
+            elif duration >= 0 and start + duration > now + 60:
+                problems.append(("The entry would end in the future", None))
+        return problems
+
+    def _preflight(self, data, entry=None):
+        """Check a time entry payload before sending it and offer the fixes.
+        Returns the payload to send (fixed if accepted), or None to cancel."""
+        problems = self._check_entry(data, entry)
+        if not problems:
+            return data
+        print("\n⚠️  The API would reject this entry:")
+        for problem, _ in problems:
+            print(f"  • {problem}")
+        self.log(f"(Preflight): {'; '.join(problem for problem, _ in problems)}")
+        if any(fix is None for _, fix in problems):
+            print("✗ Not sent")
+            return None
+        if input("Send it with these fixes? (Y/n): ").strip().lower() in ('n', 'no'):
+            print("✗ Not sent")
+            return None
+        fixed = dict(data)
+        for _, fix in problems:
+            fixed.update(fix)
+        return fixed
 
     def create_project(self):
         """Create a new project"""
@@ -644,13 +2126,9 @@ class TogglCLI:
         if result:
             print(f"✓ Project created: {name}")
             self.log(f"(Create Project): {name}")
-            # Refresh projects cache
-            print("⏳ Updating projects cache...")
-            projects = self.api_request('GET', '/me/projects')
-            if projects:
-                self.cached_projects = projects
-                self.save_config(silent=True)
-                print(f"✓ Cache updated with {len(projects)} projects")
+            # _apply_write_response already added it to the projects cache
+            self.save_config(silent=True)
+            print(f"✓ Cache updated ({len(self.cached_projects)} projects, no refetch)")
         else:
             print("✗ Failed to create project")
 
@@ -674,16 +2152,158 @@ class TogglCLI:
         if result:
             print(f"✓ Tag created: {name}")
             self.log(f"(Create Tag): {name}")
-            # Refresh tags cache
-            print("⏳ Updating tags cache...")
-            tags = self.api_request('GET', '/me/tags')
-            if tags:
-                self.cached_tags = tags
-                self.save_config(silent=True)
-                print(f"✓ Cache updated with {len(tags)} tags")
+            # _apply_write_response already added it to the tags cache
+            self.save_config(silent=True)
+            print(f"✓ Cache updated ({len(self.cached_tags)} tags, no refetch)")
         else:
             print("✗ Failed to create tag")
 
+    def _recent_time_entries(self, days):
+        """Time entries from midnight UTC `days` days ago until now. Entries the
+        menu warm-up prefetched are used while younger than warmup_interval."""
+        start_day, _, start_date, end_date = _report_range(days)
+        prefetch = self._prefetched_entries
+        if (prefetch and prefetch['start_day'] <= start_day
+                and time.time() - prefetch['at'] < self.settings['warmup_interval']):
+            if self._scope is not None:
+                self._scope['reused'] += 1
+            return [copy.deepcopy(entry) for entry in prefetch['entries'] if (_entry_day(entry) or '') >= start_day]
+        entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
+        if entries is not None:
+            changed = self._track_entries(entries, window=(_parse_time(start_date), _parse_time(end_date)), save=False)
+            if changed:
+                self._entries_changed(*changed)
+                self.save_config(silent=True)
+        return entries
+
+    def batch_create(self, path=None):
+        """Create the projects and tags listed in a JSON, YAML or CSV file.
+
+        Names already cached (after a delta sync) or repeated in the file are
+        skipped. The rest are created concurrently, at most
+        max_parallel_requests at a time and no more than the quota has
+        left; a rate-limit or quota error stops the remaining ones. All
+        created items are merged into the caches with one save."""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return
+
+        print("\n=== BATCH CREATE ===")
+        path = path or input("Spec file (.json, .yaml or .csv): ").strip().strip('"')
+        if not path:
+            print("✗ No file given")
+            return
+        try:
+            spec = _read_batch_spec(path)
+        except (OSError, ValueError) as e:
+            print(f"✗ Could not read {path}: {e}")
+            return
+
+        # Names created elsewhere since the last sync count as existing too
+        for kind in ('projects', 'tags'):
+            if spec[kind]:
+                self._sync_entities(kind)
+        if any('client' in item for item in spec['projects']):
+            self._sync_entities('clients')
+        clients = self._name_index('clients')
+
+        plan, skipped = [], []
+        for kind in ('projects', 'tags'):
+            index = self._name_index(kind)
+            for item in spec[kind]:
+                key = _name_key(item['name'])
+                if key in index:
+                    skipped.append(item['name'])
+                    continue
+                data = dict(item)
+                if kind == 'projects':
+                    client_name = data.pop('client', None)
+                    if client_name:
+                        client = clients.get(_name_key(client_name))
+                        if not client:
+                            print(f"✗ Skipping project '{item['name']}': unknown client '{client_name}'")
+                            continue
+                        data['client_id'] = client['id']
+                    data = {'is_private': False, 'active': True, **data}
+                index[key] = data  # Later duplicates in the file are skipped
+                plan.append((kind, data))
+
+        counts = {kind: sum(1 for k, _ in plan if k == kind) for kind in ('projects', 'tags')}
+        print(f"📋 To create: {counts['projects']} project(s), {counts['tags']} tag(s)")
+        if skipped:
+            print(f"ℹ Skipping {len(skipped)} existing or repeated name(s): {', '.join(skipped[:10])}"
+                  + (" ..." if len(skipped) > 10 else ""))
+        if not plan:
+            print("ℹ Nothing to create")
+            return
+
+        quota = self._quota_left()
+        if quota and quota.get('remaining') is not None and quota['remaining'] < len(plan):
+            print(f"⚠️  Only {quota['remaining']} API call(s) left in this quota window "
+                  f"(resets in {quota.get('resets_in_secs', 0) // 60} min)")
+            plan = plan[:quota['remaining']]
+            if not plan:
+                return
+            print(f"   Creating the first {len(plan)}; run the file again after the reset for the rest")
+        if input(f"Create {len(plan)} item(s)? (y/n): ").strip().lower() not in ('y', 'yes'):
+            print("✗ Cancelled")
+            return
+
+        print(f"\n⏳ Creating {len(plan)} item(s)...")
+        created, errors = asyncio.run(self._create_batch(plan))
+        for kind in ('projects', 'tags'):
+            items = [result for k, result in created if k == kind]
+            for result in items:
+                result.setdefault('workspace_id', self.workspace_id)
+            if items:
+                self._merge_entities(kind, items)
+        self.save_config(silent=True)
+
+        done = {kind: sum(1 for k, _ in created if k == kind) for kind in ('projects', 'tags')}
+        print(f"✓ Created {done['projects']} project(s) and {done['tags']} tag(s) (cache updated, no refetch)")
+        for name, error in errors:
+            print(f"✗ {name}: {error}")
+        not_tried = len(plan) - len(created) - len(errors)
+        if not_tried:
+            print(f"⚠️  {not_tried} item(s) not attempted after a rate-limit/quota error; run the file again later")
+        self.log(f"(Batch Create): {done['projects']} projects, {done['tags']} tags from {path}, "
+                 f"{len(errors)} failed, {len(skipped)} skipped")
+
+    async def _create_batch(self, plan):
+        """Create (kind, data) items in rounds of max_parallel_requests.
+        Returns ([(kind, created_item)], [(name, error)]); stops after a round
+        that hit the rate limit (429) or the quota (402)."""
+        create = {'projects': self.client.create_project, 'tags': self.client.create_tag}
+        created, errors = [], []
+        size = max(1, self.settings['max_parallel_requests'])
+        for start in range(0, len(plan), size):
+            batch = plan[start:start + size]
+            results = await asyncio.gather(*(create[kind](self.workspace_id, data) for kind, data in batch),
+                                           return_exceptions=True)
+            limited = False
+            for (kind, data), result in zip(batch, results):
+                if isinstance(result, TogglAPIError):
+                    errors.append((data['name'], result))
+                    limited = limited or result.status in (402, 429)
+                elif isinstance(result, BaseException):
+                    raise result
+                elif isinstance(result, dict) and result.get('id'):
+                    created.append((kind, result))
+                    self.log(f"(Create {kind[:-1].capitalize()}): {data['name']}")
+            if limited:
+                break
+        return created, errors
+
+    def _quota_left(self):
+        """Quota entry of the active workspace's organization ({'remaining', 'resets_in_secs', ...}), or None"""
+        org_id = next((ws.get('organization_id') for ws in self.cached_workspaces
+                       if ws.get('id') == self.workspace_id), None)
+        quota = self.api_request('GET', '/me/quota', quiet=True)
+        for item in quota if isinstance(quota, list) else []:
+            if org_id is None or item.get('organization_id') == org_id:
+                return item
+        return None
+
     def recent_entries(self):
         """Show recent time entries"""
         if not self.workspace_id:
@@ -691,10 +2311,7 @@ class TogglCLI:
             return
 
         # Get entries from today
-        start_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0).isoformat().replace('+00:00', 'Z')
-        end_date = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-        entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
+        entries = self._recent_time_entries(0)
 
         if not entries:
             print("ℹ No entries today")
@@ -712,96 +2329,755 @@ class TogglCLI:
                 project_name = self._get_project_name(entry.get('project_id'))
                 project_str = f" → {project_name}" if entry.get('project_id') else ""
                 print(f"• {description}{project_str} ({minutes} min)")
+                self._emit(self._entry_record(entry))
 
         total_hours = total_duration // 3600
         total_mins = (total_duration % 3600) // 60
         print(f"\nTotal today: {total_hours}h {total_mins}m")
 
-    def weekly_summary(self):
-        """Show weekly time summary"""
-        if not self.workspace_id:
-            print("✗ Please login first")
-            return
+    def weekly_summary(self):
+        """Show weekly time summary"""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return
+
+        # Entries from the past 7 days; the summary is reused until one of them changes
+        start_day, end_day, _, _ = _report_range(7)
+
+        def compute():
+            entries = self._recent_time_entries(7)
+            return None if entries is None else self._summarize_entries(entries)
+
+        summary, cached_at = self._cached_report('weekly', start_day, end_day, compute)
+        if not summary or not summary['entries']:
+            print("ℹ No entries in the past 7 days")
+            return
+
+        print("\n=== WEEKLY SUMMARY (Last 7 Days) ===")
+        if cached_at:
+            print(f"⚡ Cached summary from {datetime.fromtimestamp(cached_at).strftime('%H:%M')} "
+                  "(no entry changes since; Refresh Cache recomputes)")
+
+        self._print_summary(summary, self._get_project_name)
+        self._emit_summary(summary, self._get_project_name)
+
+    @staticmethod
+    def _print_summary(summary, project_name, client_name=None):
+        """Print a _summarize_entries() breakdown; project_name (and client_name, for
+        summaries with clients) map an ID, or None, to a name"""
+        # Display project breakdown
+        print("\n📊 By Project:")
+        for project_id, duration in sorted(summary['projects'].items(), key=lambda x: -x[1]):
+            hours = duration // 3600
+            mins = (duration % 3600) // 60
+            print(f"  {project_name(int(project_id) if project_id else None)}: {hours}h {mins}m")
+
+        # Display client breakdown
+        if summary.get('clients') and client_name:
+            print("\n🏢 By Client:")
+            for client_id, duration in sorted(summary['clients'].items(), key=lambda x: -x[1]):
+                print(f"  {client_name(int(client_id) if client_id else None)}: "
+                      f"{duration // 3600}h {(duration % 3600) // 60}m")
+
+        # Display tag breakdown
+        if summary['tags']:
+            print("\n🏷️  By Tag:")
+            for tag, duration in sorted(summary['tags'].items(), key=lambda x: -x[1]):
+                hours = duration // 3600
+                mins = (duration % 3600) // 60
+                print(f"  {tag}: {hours}h {mins}m")
+
+        # Display daily (or weekly/monthly, for long server-side reports) breakdown
+        print(f"\n📅 By {summary.get('resolution', 'day').capitalize()}:")
+        for day in sorted(summary['days'].keys(), reverse=True):
+            duration = summary['days'][day]
+            hours = duration // 3600
+            mins = (duration % 3600) // 60
+            print(f"  {day}: {hours}h {mins}m")
+
+        # Totals
+        total_duration, total_billable = summary['total'], summary['billable']
+        total_hours = total_duration // 3600
+        total_mins = (total_duration % 3600) // 60
+        billable_hours = total_billable // 3600
+        billable_mins = (total_billable % 3600) // 60
+        
+        print(f"\n📈 Total Time: {total_hours}h {total_mins}m")
+        if total_billable > 0:
+            print(f"💰 Billable Time: {billable_hours}h {billable_mins}m")
+
+    @staticmethod
+    def _summarize_entries(entries, day_of=_entry_day):
+        """Sum stopped entries by project ID, tag and day (UTC, or as day_of says),
+        plus total and billable time. Project IDs are string keys ('' = no
+        project) so the result survives JSON."""
+        summary = {'entries': len(entries), 'projects': {}, 'tags': {}, 'days': {},
+                   'total': 0, 'billable': 0}
+        for entry in entries:
+            duration = entry.get('duration', 0)
+            if duration <= 0:
+                continue  # Running entries are counted once stopped
+            summary['total'] += duration
+            project_key = str(entry.get('project_id') or '')
+            summary['projects'][project_key] = summary['projects'].get(project_key, 0) + duration
+            for tag in entry.get('tags') or []:
+                summary['tags'][tag] = summary['tags'].get(tag, 0) + duration
+            day = day_of(entry)
+            if day:
+                summary['days'][day] = summary['days'].get(day, 0) + duration
+            if entry.get('billable', False):
+                summary['billable'] += duration
+        return summary
+
+    @staticmethod
+    def _merge_summaries(summaries):
+        """Add up several _summarize_entries() results into one"""
+        merged = {'entries': 0, 'projects': {}, 'tags': {}, 'days': {}, 'total': 0, 'billable': 0}
+        for summary in summaries:
+            for field in ('entries', 'total', 'billable'):
+                merged[field] += summary[field]
+            for field in ('projects', 'tags', 'days'):
+                for key, duration in summary[field].items():
+                    merged[field][key] = merged[field].get(key, 0) + duration
+        return merged
+
+    def _entries_between(self, start, end):
+        """All time entries between two datetimes, fetched concurrently in 30-day
+        windows. Returns None if any window failed."""
+        windows = []
+        while start < end:
+            windows.append((start, min(start + timedelta(days=30), end)))
+            start = windows[-1][1]
+        iso = lambda moment: moment.isoformat().replace("+00:00", "Z")
+        chunks = asyncio.run(self._gather(*(self.client.list_time_entries(iso(a), iso(b)) for a, b in windows)))
+        if any(chunk is None for chunk in chunks):
+            return None
+        changed = [entry for chunk, window in zip(chunks, windows)
+                   for entry in self._track_entries(chunk, window=window, save=False)]
+        if changed:
+            self._entries_changed(*changed)
+            self.save_config(silent=True)
+        by_id = {}  # An entry on a window boundary comes back twice
+        for chunk in chunks:
+            for entry in chunk:
+                by_id[entry.get('id')] = entry
+        return list(by_id.values())
+
+    def _audit_index(self, title):
+        """Ask how many days to audit, fetch them and index the entries as intervals.
+        Returns (index, first_day, range_start_ts, now_ts), or None."""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return None
+
+        print(f"\n=== {title} ===")
+        raw = input("Days to check [30]: ").strip()
+        if raw and not (raw.isdigit() and int(raw) > 0):
+            print("✗ Please enter a positive number of days")
+            return None
+        days = int(raw or 30)
+        now = datetime.now(timezone.utc)
+        first_day = (now.astimezone() - timedelta(days=days - 1)).date()
+        # Local days may start before UTC midnight, so fetch one day more
+        start = datetime.combine(first_day, dtime()).astimezone()
+
+        print(f"⏳ Fetching {days} day(s) of entries...")
+        entries = self._entries_between((start - timedelta(days=1)).astimezone(timezone.utc), now)
+        if entries is None:
+            print("✗ Could not fetch time entries")
+            return None
+        index = IntervalIndex.from_entries(entries, now.timestamp())
+        print(f"🔎 Indexed {len(index)} entries")
+        return index, first_day, start.timestamp(), now.timestamp()
+
+    @staticmethod
+    def _entry_label(entry):
+        """Short description of an entry for audit listings"""
+        return f"{entry.get('description') or 'Untitled'} (#{entry.get('id')})"
+
+    def list_overlaps(self):
+        """List time entries that overlap each other (double-booked time)"""
+        audit = self._audit_index("OVERLAPPING ENTRIES")
+        if not audit:
+            return
+        index, _, start, end = audit
+
+        overlaps = index.overlaps(start, end)
+        if not overlaps:
+            print("✓ No overlapping entries")
+            return
+        print(f"\n⚠️  {len(overlaps)} overlap(s):")
+        total = 0
+        for earlier, later, a, b in overlaps:
+            total += b - a
+            print(f"  {datetime.fromtimestamp(a):%Y-%m-%d %H:%M}–{datetime.fromtimestamp(b):%H:%M} ({int(b - a) // 60} min): "
+                  f"{self._entry_label(earlier)} ↔ {self._entry_label(later)}")
+        print(f"\n📈 Double-booked time: {int(total) // 3600}h {(int(total) % 3600) // 60}m")
+        self.log(f"(Audit): {len(overlaps)} overlap(s)")
+
+    def list_gaps(self):
+        """List untracked stretches of the working day and each day's coverage"""
+        audit = self._audit_index("UNTRACKED GAPS")
+        if not audit:
+            return
+        index, day, _, now = audit
+        try:
+            day_start, day_end = (dtime.fromisoformat(self.settings[key]) for key in ('workday_start', 'workday_end'))
+        except ValueError:
+            print("✗ workday_start and workday_end must be HH:MM")
+            return
+        min_gap = self.settings['gap_min_minutes'] * 60
+
+        print(f"\nWorking day {day_start:%H:%M}–{day_end:%H:%M}, gaps of {self.settings['gap_min_minutes']}+ min:")
+        total_gap = 0
+        while day <= datetime.fromtimestamp(now).date():
+            start = datetime.combine(day, day_start).astimezone().timestamp()
+            end = min(datetime.combine(day, day_end).astimezone().timestamp(), now)
+            if day.weekday() in self.settings['workdays'] and end > start:
+                covered = index.coverage(start, end)
+                gaps = index.gaps(start, end, min_gap)
+                print(f"\n📅 {day:%Y-%m-%d %a}: {int(covered) // 3600}h {(int(covered) % 3600) // 60}m tracked "
+                      f"({covered * 100 / (end - start):.0f}%)")
+                for a, b in gaps:
+                    total_gap += b - a
+                    print(f"  {datetime.fromtimestamp(a):%H:%M}–{datetime.fromtimestamp(b):%H:%M} "
+                          f"untracked ({int(b - a) // 60} min)")
+            day += timedelta(days=1)
+        print(f"\n📈 Untracked working time: {int(total_gap) // 3600}h {(int(total_gap) % 3600) // 60}m")
+        self.log("(Audit): Gaps")
+
+    def period_summary(self, days=None):
+        """Summary of the active workspace over the last N days (asked unless given).
+        Long periods are totalled server-side by the Reports API instead of
+        downloading every entry."""
+        period = self._ask_period("PERIOD SUMMARY", days)
+        if not period:
+            return
+        first_day, last_day = period
+
+        def compute():
+            summary, source = self._period_totals(first_day, last_day)
+            return None if summary is None else dict(summary, source=source)
+
+        # Data versions are per UTC day; widen the key's range so local days are covered
+        summary, cached_at = self._cached_report(
+            f'period-{self.workspace_id}', (first_day - timedelta(days=1)).isoformat(),
+            (last_day + timedelta(days=1)).isoformat(), compute)
+        if not summary or not summary['total']:
+            print(f"ℹ No stopped entries from {first_day} to {last_day}")
+            return
+
+        print(f"\n=== PERIOD SUMMARY ({first_day} to {last_day}) ===")
+        if summary['source'] == 'reports':
+            print("📡 Totals from the Toggl Reports API")
+        else:
+            print(f"🧮 Added up locally from {summary['entries']} entries")
+        if cached_at:
+            print(f"⚡ Cached summary from {datetime.fromtimestamp(cached_at).strftime('%H:%M')} "
+                  "(no entry changes since; Refresh Cache recomputes)")
+        clients = {c.get('id'): c.get('name', 'Unknown client') for c in self.cached_clients}
+        client_name = lambda cid: clients.get(cid, f"Client #{cid}") if cid else "No client"
+        self._print_summary(summary, self._get_project_name, client_name)
+        self._emit_summary(summary, self._get_project_name, client_name)
+
+    def check_summary_consistency(self):
+        """Total one period both via the Reports API and locally, and list the differences"""
+        period = self._ask_period("SUMMARY CONSISTENCY CHECK")
+        if not period:
+            return
+        first_day, last_day = period
+
+        print("⏳ Fetching server-side totals and raw entries...")
+        try:
+            server = asyncio.run(self._reports_totals(first_day, last_day))
+        except (TogglAPIError, ValueError, TypeError, AttributeError) as e:
+            print(f"✗ Reports API unavailable: {e}")
+            return
+        local = self._local_totals(first_day, last_day)
+        if local is None:
+            print("✗ Could not fetch time entries")
+            return
+
+        # The server may total long periods per week or month
+        resolution = server['resolution']
+        local_periods = {}
+        for day, duration in local['days'].items():
+            period = _period_start(date.fromisoformat(day), first_day, resolution).isoformat()
+            local_periods[period] = local_periods.get(period, 0) + duration
+
+        clients = {c.get('id'): c.get('name', 'Unknown client') for c in self.cached_clients}
+        dimensions = (
+            ("Total", {'': server['total']}, {'': local['total']}, lambda key: "all entries"),
+            ("Billable", {'': server['billable']}, {'': local['billable']}, lambda key: "billable entries"),
+            ("Project", server['projects'], local['projects'],
+             lambda key: self._get_project_name(int(key) if key else None)),
+            ("Client", server['clients'], local['clients'],
+             lambda key: clients.get(int(key), f"Client #{key}") if key else "No client"),
+            ("Tag", server['tags'], local['tags'], str),
+            (resolution.capitalize(), server['days'], local_periods, str),
+        )
+        compared, mismatches = 0, []
+        for label, ours, theirs, name in dimensions:
+            for key in sorted(set(ours) | set(theirs)):
+                compared += 1
+                if abs(ours.get(key, 0) - theirs.get(key, 0)) > 60:  # Allow for rounding
+                    mismatches.append((label, name(key), ours.get(key, 0), theirs.get(key, 0)))
+
+        if not mismatches:
+            print(f"✓ Reports API and local totals agree on all {compared} values (within 1 min)")
+        else:
+            print(f"\n⚠️  {len(mismatches)} of {compared} values differ (Reports API vs local):")
+            for label, name, server_secs, local_secs in mismatches:
+                print(f"  {label} {name}: {server_secs // 3600}h {(server_secs % 3600) // 60}m "
+                      f"vs {local_secs // 3600}h {(local_secs % 3600) // 60}m")
+        self.log(f"(Reports): Consistency check {first_day}..{last_day}, {len(mismatches)} mismatch(es)")
+
+    def _ask_period(self, title, days=None):
+        """Ask how many days back a report goes (unless given). Returns
+        (first_day, last_day) as local dates, or None."""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return None
+        print(f"\n=== {title} ===")
+        raw = str(days) if days is not None else input("Days to include [30]: ").strip()
+        if raw and not (raw.isdigit() and int(raw) > 0):
+            print("✗ Please enter a positive number of days")
+            return None
+        last_day = datetime.now().astimezone().date()
+        return last_day - timedelta(days=int(raw or 30) - 1), last_day
+
+    def _period_totals(self, first_day, last_day):
+        """(summary, 'reports' or 'local') of the active workspace between two local days.
+        Periods of reports_min_days or more try the Reports API first and
+        fall back to adding up the entries locally."""
+        if (last_day - first_day).days + 1 >= self.settings['reports_min_days']:
+            try:
+                return asyncio.run(self._reports_totals(first_day, last_day)), 'reports'
+            except (TogglAPIError, ValueError, TypeError, AttributeError) as e:
+                self.log(f"(Reports): Falling back to local totals: {e}")
+                print("ℹ Reports API unavailable, adding up the entries locally instead")
+        return self._local_totals(first_day, last_day), 'local'
+
+    def _local_totals(self, first_day, last_day):
+        """Period summary from the active workspace's raw entries, days in local time"""
+        start = datetime.combine(first_day, dtime()).astimezone()
+        end = min(datetime.combine(last_day + timedelta(days=1), dtime()).astimezone(), datetime.now(timezone.utc))
+        entries = self._history_between(start.astimezone(timezone.utc), end.astimezone(timezone.utc))
+        if entries is None:
+            return None
+        entries = [entry for entry in entries if entry.get('workspace_id') == self.workspace_id]
+        summary = self._summarize_entries(entries, _local_day)
+        # Entries carry no client; take it from the cached project
+        project_clients = {str(p.get('id')): str(p.get('client_id') or '') for p in self.cached_projects}
+        summary['clients'] = {}
+        for project_key, duration in summary['projects'].items():
+            client_key = project_clients.get(project_key, '')
+            summary['clients'][client_key] = summary['clients'].get(client_key, 0) + duration
+        return summary
+
+    async def _reports_totals(self, first_day, last_day):
+        """The same period summary, totalled server-side by the Reports API v3.
+        Four small requests, whatever the number of entries. Raises
+        TogglAPIError, or ValueError for a response it cannot use."""
+        dates = {'start_date': first_day.isoformat(), 'end_date': last_day.isoformat()}
+        by_project, by_tag, totals, billable = await asyncio.gather(
+            self.client.summary_report(self.workspace_id, {**dates, 'grouping': 'projects', 'sub_grouping': 'clients'}),
+            self.client.summary_report(self.workspace_id, {**dates, 'grouping': 'tags', 'sub_grouping': 'projects'}),
+            self.client.totals_report(self.workspace_id, dates),
+            self.client.totals_report(self.workspace_id, {**dates, 'billable': True}))
+
+        resolution = totals.get('resolution') or 'day'
+        if resolution not in ('day', 'week', 'month'):
+            raise ValueError(f"unsupported totals resolution {resolution!r}")
+        summary = {'entries': None, 'projects': {}, 'clients': {}, 'tags': {}, 'days': {},
+                   'resolution': resolution, 'total': totals.get('seconds') or 0,
+                   'billable': billable.get('seconds') or 0}
+        for group in by_project.get('groups') or []:
+            project_key = str(group.get('id') or '')
+            for sub in group.get('sub_groups') or []:
+                client_key, seconds = str(sub.get('id') or ''), sub.get('seconds') or 0
+                summary['projects'][project_key] = summary['projects'].get(project_key, 0) + seconds
+                summary['clients'][client_key] = summary['clients'].get(client_key, 0) + seconds
+        tag_names = {t.get('id'): t.get('name') for t in self.cached_tags}
+        for group in by_tag.get('groups') or []:
+            if group.get('id'):  # The untagged group has no ID
+                name = tag_names.get(group['id']) or f"Tag #{group['id']}"
+                summary['tags'][name] = sum(sub.get('seconds') or 0 for sub in group.get('sub_groups') or [])
+        graph = totals.get('graph') or []
+        for period, point in zip(_graph_periods(first_day, len(graph), resolution), graph):
+            if point.get('seconds'):
+                summary['days'][period.isoformat()] = point['seconds']
+        return summary
+
+    def backfill_history(self):
+        """Download the time-entry history into CACHE_DIR/history/, newest first.
+        Progress is checkpointed in BACKFILL_FILE after every window, so an
+        interrupted backfill resumes where it stopped."""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return
+
+        print("\n=== BACKFILL HISTORY ===")
+        checkpoint = self._read_backfill()
+        if checkpoint and checkpoint['done']:
+            print(f"✓ History is stored back to {checkpoint['cursor'][:10]} ({checkpoint['entries']} entries)")
+            if input("Download it all again? (y/N): ").strip().lower() != 'y':
+                return
+            checkpoint = None
+        elif checkpoint:
+            print(f"ℹ Resuming: stored back to {checkpoint['cursor'][:10]}, {checkpoint['entries']} entries so far")
+
+        if not checkpoint:
+            raw = input(f"Oldest day to fetch (YYYY-MM-DD) [until "
+                        f"{self.settings['backfill_empty_windows']} empty windows in a row]: ").strip()
+            try:
+                oldest = _api_time(datetime.combine(date.fromisoformat(raw), dtime(), timezone.utc)) if raw else None
+            except ValueError:
+                print("✗ Invalid date format")
+                return
+            now = _api_time(datetime.now(timezone.utc))
+            checkpoint = {'until': now, 'cursor': now, 'oldest': oldest, 'windows': 0,
+                          'entries': 0, 'empty_windows': 0, 'done': False}
+            self._write_backfill(checkpoint)
+
+        try:
+            asyncio.run(self._run_backfill(checkpoint))
+        except KeyboardInterrupt:
+            print(f"\n⏸ Interrupted; stored back to {checkpoint['cursor'][:10]}. "
+                  "Choose Backfill History again to resume.")
+            self.log(f"(Backfill): Interrupted at {checkpoint['cursor']}")
+            return
+        except TogglAPIError as e:
+            print(f"\n✗ Backfill stopped: {e}")
+            print(f"ℹ Stored back to {checkpoint['cursor'][:10]}; choose Backfill History again to resume.")
+            self.log(f"(Backfill): Stopped at {checkpoint['cursor']}: {e}")
+            return
+
+        checkpoint['done'] = True
+        self._write_backfill(checkpoint)
+        print(f"\n✓ Backfill complete: {checkpoint['entries']} entries back to {checkpoint['cursor'][:10]}")
+        self.log(f"(Backfill): Complete, {checkpoint['entries']} entries back to {checkpoint['cursor']}")
+
+    async def _run_backfill(self, checkpoint):
+        """Walk back from the checkpoint's cursor one window at a time.
+
+        Up to max_parallel_requests windows are in flight. Results are stored
+        in window order, each followed by a checkpoint, so the cursor only
+        ever covers windows that are on disk. Raises TogglAPIError."""
+        span = timedelta(days=self.settings['backfill_window_days'])
+        oldest = _parse_time(checkpoint['oldest']) if checkpoint['oldest'] else None
+
+        def windows():
+            end = _parse_time(checkpoint['cursor'])
+            while oldest is None or end > oldest:
+                start = end - span if oldest is None else max(end - span, oldest)
+                yield start, end
+                end = start
+
+        pending, upcoming = deque(), windows()
+        started, windows_done, entries_done = time.monotonic(), 0, 0
+        try:
+            while True:
+                while len(pending) < self.settings['max_parallel_requests']:
+                    window = next(upcoming, None)
+                    if window is None:
+                        break
+                    request = self.client.list_time_entries(_api_time(window[0]), _api_time(window[1]))
+                    pending.append((window, asyncio.ensure_future(request)))
+                if not pending:
+                    return
+                (start, end), request = pending.popleft()
+                entries = await request
+                self._store_history(entries)
+                changed = self._track_entries(entries, window=(start, end), save=False)
+                if changed:
+                    self._entries_changed(*changed)
+                windows_done += 1
+                entries_done += len(entries)
+                checkpoint['cursor'] = _api_time(start)
+                checkpoint['windows'] += 1
+                checkpoint['entries'] += len(entries)
+                checkpoint['empty_windows'] = 0 if entries else checkpoint['empty_windows'] + 1
+                self._write_backfill(checkpoint)
+
+                elapsed = max(time.monotonic() - started, 1e-6)
+                eta = ""
+                if oldest:
+                    remaining = (start - oldest) / span / (windows_done / elapsed)
+                    eta = f", ETA {int(remaining) // 60}m {int(remaining) % 60:02d}s"
+                print(f"\r⏳ Back to {start.date()}: {checkpoint['entries']} entries | "
+                      f"{entries_done / elapsed:.0f} entries/s, {windows_done / elapsed * 60:.1f} windows/min{eta}   ",
+                      end='', flush=True)
+                if oldest is None and checkpoint['empty_windows'] >= self.settings['backfill_empty_windows']:
+                    return
+        finally:
+            for _, request in pending:
+                request.cancel()
+            self.save_config(silent=True)  # Tracked-time ledger (see _track_entries)
+
+    def _read_backfill(self):
+        """The backfill checkpoint, or None if no backfill was started"""
+        try:
+            with open(BACKFILL_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.log(f"(Backfill): Ignoring unreadable {BACKFILL_FILE}: {e}")
+            return None
+
+    def _write_backfill(self, checkpoint):
+        _atomic_write(BACKFILL_FILE, json.dumps(checkpoint, indent=2).encode('utf-8'))
 
-        # Get entries from the past 7 days
-        from datetime import timedelta
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=7)
-        
-        start_str = start_date.isoformat().replace("+00:00", "Z")
-        end_str = end_date.isoformat().replace("+00:00", "Z")
+    def _store_history(self, entries, deleted=()):
+        """Merge entries into the monthly history sections (the newer 'at' wins)
+        and drop the deleted ones from the months they started in"""
+        months = {}
+        for entry in deleted:
+            months.setdefault((entry.get('start') or '')[:7], ([], set()))[1].add(entry.get('id'))
+        for entry in entries:
+            months.setdefault((entry.get('start') or '')[:7], ([], set()))[0].append(entry)
+        min_bytes = self.settings['compress_min_bytes'] if self.settings['compress_cache'] else None
+        with _file_lock():
+            for month, (changed, removed) in months.items():
+                if len(month) != 7:
+                    continue
+                path = _history_path(month)
+                stored = {entry['id']: entry for entry in _read_section(path) if entry.get('id') not in removed}
+                for entry in changed:
+                    current = stored.get(entry.get('id'))
+                    if current is None or (entry.get('at') or '') >= (current.get('at') or ''):
+                        stored[entry.get('id')] = entry
+                records = sorted(stored.values(), key=lambda entry: entry.get('start') or '')
+                _write_section(path, _encode_section(records), min_bytes)
+
+    def _history_changed(self, entry, previous=None, deleted=False):
+        """Apply an entry edited or deleted through the CLI to the backfilled history"""
+        checkpoint = self._read_backfill()
+        if not checkpoint:
+            return
+        cursor, until = _parse_time(checkpoint['cursor']), _parse_time(checkpoint['until'])
+        covered = lambda e: bool(e and e.get('start')) and cursor <= _parse_time(e['start']) < until
+        stale = [e for e in (previous, entry if deleted else None) if covered(e)]
+        changed = [entry] if not deleted and covered(entry) else []
+        if stale or changed:
+            self._store_history(changed, stale)
+
+    def _stored_entries(self, start, end):
+        """Backfilled entries starting between two datetimes"""
+        entries = []
+        month = start.astimezone(timezone.utc).date().replace(day=1)
+        while month < end.astimezone(timezone.utc).date() + timedelta(days=1):
+            for entry in _read_section(_history_path(month.isoformat()[:7])):
+                if entry.get('start') and start <= _parse_time(entry['start']) < end:
+                    entries.append(entry)
+            month = (month + timedelta(days=32)).replace(day=1)
+        return entries
+
+    def _history_between(self, start, end):
+        """Time entries between two datetimes. The part of the range covered by
+        the backfill and older than backfill_live_days is read from disk; the
+        rest is fetched. Returns None if a request failed."""
+        checkpoint = self._read_backfill()
+        if not checkpoint:
+            return self._entries_between(start, end)
+        live = datetime.now(timezone.utc) - timedelta(days=self.settings['backfill_live_days'])
+        stored_from = max(start, _parse_time(checkpoint['cursor']))
+        stored_to = min(end, _parse_time(checkpoint['until']), live)
+        if stored_from >= stored_to:
+            return self._entries_between(start, end)
+
+        entries = self._stored_entries(stored_from, stored_to)
+        for fetch_from, fetch_to in ((start, stored_from), (stored_to, end)):
+            if fetch_from < fetch_to:
+                fetched = self._entries_between(fetch_from, fetch_to)
+                if fetched is None:
+                    return None
+                entries += fetched
+        return entries
 
-        entries = self.api_request('GET', f'/me/time_entries?start_date={start_str}&end_date={end_str}')
+    def team_summary(self):
+        """Summary across the team members listed in TEAM_FILE, one API token each"""
+        try:
+            with open(TEAM_FILE, 'r', encoding='utf-8') as f:
+                members = json.load(f).get('members', [])
+        except FileNotFoundError:
+            print(f"✗ No {TEAM_FILE} found. Create it with one entry per team member:")
+            print('  {"members": [{"name": "Alice", "api_token": "..."}, {"name": "Bob", "api_token": "..."}]}')
+            return
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"✗ Could not read {TEAM_FILE}: {e}")
+            return
+        members = [m for m in members if isinstance(m, dict) and m.get('api_token')]
+        if not members:
+            print(f"✗ {TEAM_FILE} lists no members with an api_token")
+            return
 
-        if not entries:
-            print("ℹ No entries in the past 7 days")
+        print("\n=== TEAM SUMMARY ===")
+        raw = input("Days to include [7]: ").strip()
+        if raw and not (raw.isdigit() and int(raw) > 0):
+            print("✗ Please enter a positive number of days")
+            return
+        days = int(raw or 7)
+        _, _, start_date, end_date = _report_range(days)
+
+        print(f"⏳ Fetching {len(members)} member(s), {self.settings['team_max_workers']} at a time...")
+        results = asyncio.run(self._fetch_team(members, start_date, end_date))
+
+        project_names = {}
+        for _, _, projects, _ in results:
+            project_names.update(projects)
+        summaries = [summary for _, summary, _, _ in results if summary]
+
+        print(f"\n=== TEAM SUMMARY (Last {days} Days) ===")
+        print("\n👥 By Member:")
+        for name, summary, _, error in results:
+            if error:
+                print(f"  ✗ {name}: {error}")
+                continue
+            billable = f", {summary['billable'] // 3600}h {(summary['billable'] % 3600) // 60}m billable" \
+                if summary['billable'] else ""
+            print(f"  {name}: {summary['total'] // 3600}h {(summary['total'] % 3600) // 60}m{billable}")
+        if not summaries:
+            return
+        self._print_summary(self._merge_summaries(summaries),
+                            lambda pid: project_names.get(pid, f"Project #{pid}") if pid else "No project")
+        failed = sum(1 for *_, error in results if error)
+        self.log(f"(Team): {len(summaries)} member(s) summarized over {days} day(s), {failed} failed")
+
+    async def _fetch_team(self, members, start_date, end_date):
+        """Summaries of all members, at most team_max_workers at a time.
+        Returns [(name, summary or None, {project_id: name}, error or None)] in member order."""
+        pool = asyncio.Semaphore(max(1, self.settings['team_max_workers']))
+        return await asyncio.gather(*(self._fetch_member(member, idx, pool, start_date, end_date)
+                                      for idx, member in enumerate(members, 1)))
+
+    async def _fetch_member(self, member, number, pool, start_date, end_date):
+        """One team member's entries and project names, with their own client.
+
+        Each token gets its own connection pool and is rate limited on its
+        own: requests are spaced team_min_interval apart, and a 429 is
+        retried once after Retry-After. Project names are cached per member
+        under CACHE_DIR/team/<token hash>/, apart from the main caches, and
+        only refetched when an entry refers to an unknown project."""
+        name = member.get('name') or f"Member {number}"
+        token = member['api_token']
+        path = _section_path(os.path.join(TEAM_CACHE_DIR, hashlib.sha1(token.encode()).hexdigest()[:12]), 'projects')
+        try:
+            projects = {p['id']: p['name'] for p in _read_section(path)}
+        except (OSError, ValueError, KeyError):
+            projects = {}
+
+        loop = asyncio.get_running_loop()
+        interval = self.settings['team_min_interval']
+        last_request = [-interval]
+
+        async def call(request):
+            for attempt in range(2):
+                await asyncio.sleep(max(0, last_request[0] + interval - loop.time()))
+                last_request[0] = loop.time()
+                try:
+                    return await request()
+                except TogglAPIError as e:
+                    if e.status != 429 or attempt:
+                        raise
+                    try:
+                        retry_after = float(e.headers.get('Retry-After') or 0)
+                    except ValueError:
+                        retry_after = 0
+                    await asyncio.sleep(max(retry_after, interval))
+
+        client = TogglClient(token, API_BASE, max_concurrency=1)
+        try:
+            async with pool:
+                entries = await call(lambda: client.list_time_entries(start_date, end_date))
+                unknown = {entry.get('project_id') for entry in entries} - set(projects) - {None}
+                if unknown:
+                    fetched = await call(client.list_projects)
+                    projects = {p['id']: p.get('name', 'Unknown project') for p in fetched}
+                    data = _encode_section([{'id': pid, 'name': project} for pid, project in projects.items()])
+
+                    def write():
+                        with _file_lock():
+                            _write_section(path, data)
+                    # The lock may be held by another process; wait for it off the event loop
+                    await loop.run_in_executor(None, write)
+            return name, self._summarize_entries(entries), projects, None
+        except TogglAPIError as e:
+            self.log(f"(Team): {name}: {e}")
+            return name, None, projects, str(e)
+        finally:
+            client.close()
+
+    def all_workspaces_summary(self):
+        """Show a 7-day summary across all workspaces"""
+        if not self.api_token:
+            print("✗ Please login first")
             return
 
-        print("\n=== WEEKLY SUMMARY (Last 7 Days) ===")
-        
-        # Organize by project
-        project_times = {}
-        tag_times = {}
-        daily_times = {}
-        total_duration = 0
-        total_billable = 0
+        workspaces = self.cached_workspaces or self.api_request('GET', '/me/workspaces')
+        if not workspaces:
+            print("✗ Could not fetch workspaces")
+            return
+        self.cached_workspaces = workspaces
 
-        for entry in entries:
-            duration = entry.get('duration', 0)
-            if duration > 0:
-                total_duration += duration
-                
-                # By project
-                project_name = self._get_project_name(entry.get('project_id'))
-                project_times[project_name] = project_times.get(project_name, 0) + duration
-                
-                # By tag
-                tags = entry.get('tags', [])
-                for tag in tags:
-                    tag_times[tag] = tag_times.get(tag, 0) + duration
-                
-                # By day
-                start = entry.get('start', '')
-                if start:
-                    day = start[:10]  # YYYY-MM-DD
-                    daily_times[day] = daily_times.get(day, 0) + duration
-                
-                # Billable tracking
-                if entry.get('billable', False):
-                    total_billable += duration
+        start_day, end_day, start_str, end_str = _report_range(7)
 
-        # Display project breakdown
-        print("\n📊 By Project:")
-        for project, duration in sorted(project_times.items(), key=lambda x: -x[1]):
-            hours = duration // 3600
-            mins = (duration % 3600) // 60
-            print(f"  {project}: {hours}h {mins}m")
+        # Only workspaces whose partition has never been loaded need a fetch
+        missing = [ws['id'] for ws in workspaces if not self._partition(ws['id'])['projects']]
 
-        # Display tag breakdown
-        if tag_times:
-            print("\n🏷️  By Tag:")
-            for tag, duration in sorted(tag_times.items(), key=lambda x: -x[1]):
-                hours = duration // 3600
-                mins = (duration % 3600) // 60
-                print(f"  {tag}: {hours}h {mins}m")
+        def compute():
+            # Stopped entries grouped by workspace, then by project
+            print("\n⏳ Fetching all workspaces...")
+            entries, *project_lists = asyncio.run(self._gather(
+                self.client.list_time_entries(start_str, end_str),
+                *(self.client.list_projects(ws_id) for ws_id in missing)))
+            for ws_id, projects in zip(missing, project_lists):
+                if projects:
+                    self._store_entities('projects', projects, ws_id)
+            missing.clear()
+            if entries is None:
+                return None
+            by_workspace = {}
+            for entry in entries:
+                duration = entry.get('duration', 0)
+                if duration > 0:
+                    ws_times = by_workspace.setdefault(str(entry.get('workspace_id')), {})
+                    project_key = str(entry.get('project_id') or '')
+                    ws_times[project_key] = ws_times.get(project_key, 0) + duration
+            return {'entries': len(entries), 'workspaces': by_workspace}
+
+        summary, cached_at = self._cached_report('workspaces', start_day, end_day, compute)
+        if missing:
+            # Served from cache, but some project lists were never loaded
+            project_lists = asyncio.run(self._gather(*(self.client.list_projects(ws_id) for ws_id in missing)))
+            for ws_id, projects in zip(missing, project_lists):
+                if projects:
+                    self._store_entities('projects', projects, ws_id)
+        self.save_config(silent=True)
 
-        # Display daily breakdown
-        print("\n📅 By Day:")
-        for day in sorted(daily_times.keys(), reverse=True):
-            duration = daily_times[day]
-            hours = duration // 3600
-            mins = (duration % 3600) // 60
-            print(f"  {day}: {hours}h {mins}m")
+        if not summary or not summary['entries']:
+            print("ℹ No entries in the past 7 days")
+            return
 
-        # Totals
-        total_hours = total_duration // 3600
-        total_mins = (total_duration % 3600) // 60
-        billable_hours = total_billable // 3600
-        billable_mins = (total_billable % 3600) // 60
-        
-        print(f"\n📈 Total Time: {total_hours}h {total_mins}m")
-        if total_billable > 0:
-            print(f"💰 Billable Time: {billable_hours}h {billable_mins}m")
+        print("\n=== ALL WORKSPACES SUMMARY (Last 7 Days) ===")
+        if cached_at:
+            print(f"⚡ Cached summary from {datetime.fromtimestamp(cached_at).strftime('%H:%M')} "
+                  "(no entry changes since; Refresh Cache recomputes)")
+        grand_total = 0
+        for ws in workspaces:
+            ws_times = summary['workspaces'].get(str(ws['id']))
+            if not ws_times:
+                continue
+            ws_total = sum(ws_times.values())
+            grand_total += ws_total
+            print(f"\n🏢 {ws['name']}: {ws_total // 3600}h {(ws_total % 3600) // 60}m")
+            projects = {str(p['id']): p.get('name', 'Unknown project') for p in self._partition(ws['id'])['projects']}
+            for project_key, duration in sorted(ws_times.items(), key=lambda x: -x[1]):
+                name = projects.get(project_key, f"Project #{project_key}") if project_key else "No project"
+                print(f"  {name}: {duration // 3600}h {(duration % 3600) // 60}m")
+
+        print(f"\n📈 Total Time: {grand_total // 3600}h {(grand_total % 3600) // 60}m")
 
     def edit_entry(self):
         """Edit a time entry"""
@@ -810,9 +3086,7 @@ class TogglCLI:
             return
 
         # Get recent entries
-        start_date = (datetime.now(timezone.utc) - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0).isoformat().replace('+00:00', 'Z')
-        end_date = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
+        entries = self._recent_time_entries(7)
 
         if not entries:
             print("ℹ No recent entries to edit")
@@ -846,6 +3120,7 @@ class TogglCLI:
             print("2. Project")
             print("3. Tags")
             print("4. Mark as Billable/Non-billable")
+            print("5. Task")
             
             edit_choice = input("\nSelect what to edit: ").strip()
 
@@ -859,24 +3134,23 @@ class TogglCLI:
             elif edit_choice == '2':
                 projects = self.list_projects(return_data=True)
                 if projects:
-                    print("\n=== YOUR PROJECTS ===")
-                    for idx, project in enumerate(projects, 1):
-                        active = "✓" if project.get('active', True) else "✗"
-                        print(f"{idx}. {project['name']} [{active}]")
-                    print("P. Create New Project  |  0. No Project")
-
-                    proj_choice = input("\nSelect project (number, name, P, or 0): ").strip()
+                    proj_choice = self._pick(projects, "YOUR PROJECTS", "\nSelect project (number, name, P, or 0): ",
+                                             _project_row, ["P. Create New Project  |  0. No Project"], ('p',))
 
                     if proj_choice == '0':
                         update_data['project_id'] = None
+                        update_data['task_id'] = None
                     elif proj_choice.lower() == 'p':
                         new_project_id, _ = self._quick_create_project()
                         if new_project_id:
                             update_data['project_id'] = new_project_id
+                            update_data['task_id'] = None
                     else:
                         selected = self._fuzzy_select_with(projects, proj_choice)
                         if selected:
                             update_data['project_id'] = selected['id']
+                            # The old task belongs to the old project
+                            update_data['task_id'], _ = self._select_task(selected['id'])
                         else:
                             print("Invalid selection")
                             return
@@ -892,12 +3166,8 @@ class TogglCLI:
             elif edit_choice == '3':
                 tags = self.list_tags(return_data=True)
                 if tags:
-                    print("\n=== YOUR TAGS ===")
-                    for idx, tag in enumerate(tags, 1):
-                        print(f"{idx}. {tag['name']}")
-                    print("T. Create New Tag  |  0. No Tags")
-
-                    tag_input = input("\nEnter tags (numbers, names, T for new, comma-separated): ").strip()
+                    tag_input = self._pick(tags, "YOUR TAGS", "\nEnter tags (numbers, names, T for new, comma-separated): ",
+                                           options=["T. Create New Tag  |  0. No Tags"], commands=('t',), multi=True)
 
                     if tag_input == '0':
                         update_data['tag_ids'] = []
@@ -933,6 +3203,16 @@ class TogglCLI:
                 billable = input("Billable? (y/n): ").strip().lower() == 'y'
                 update_data['billable'] = billable
 
+            elif edit_choice == '5':
+                if not entry.get('project_id'):
+                    print("✗ Entry has no project — assign a project first")
+                    return
+                if not any(t.get('active', True) for t in self._get_project_tasks(entry['project_id'])):
+                    print("ℹ No tasks available for this project")
+                task_id, _ = self._select_task(entry['project_id'])  # Cached list; no second request
+                if task_id:
+                    update_data['task_id'] = task_id
+
             else:
                 print("✗ Invalid option")
                 return
@@ -945,12 +3225,27 @@ class TogglCLI:
             update_data['start'] = entry['start']
             update_data['duration'] = entry['duration']
             update_data['workspace_id'] = self.workspace_id
+            # Check the entry as it would be after the edit
+            edited = dict(entry, **update_data)
+            checked = self._preflight(edited, entry)
+            if checked is None:
+                return
+            update_data.update({key: value for key, value in checked.items() if edited.get(key) != value})
 
             result = self.api_request('PUT', f'/workspaces/{self.workspace_id}/time_entries/{entry_id}', update_data)
 
             if result:
                 print(f"✓ Entry updated successfully")
                 self.log(f"(Edit): Updated entry #{entry_id}")
+                self._entries_changed(entry, result if isinstance(result, dict) else None)
+                if isinstance(result, dict):
+                    self._history_changed(result, previous=entry)
+                    self._track_entries([result], save=False)
+                last_stopped = self.timer_state.get('last_stopped')
+                if last_stopped and last_stopped.get('id') == entry_id and isinstance(result, dict):
+                    self._set_timer_state(last_stopped=result)
+                self._record_usage(update_data.get('description'), update_data.get('project_id'),
+                                   update_data.get('tag_ids'))
             else:
                 print("✗ Failed to update entry")
 
@@ -966,10 +3261,7 @@ class TogglCLI:
             return
 
         # Get recent entries
-        from datetime import timedelta
-        start_date = (datetime.now(timezone.utc) - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0).isoformat().replace('+00:00', 'Z')
-        end_date = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
+        entries = self._recent_time_entries(7)
 
         if not entries:
             print("ℹ No recent entries to delete")
@@ -1008,6 +3300,14 @@ class TogglCLI:
             if result is not None:  # DELETE returns empty response on success
                 print(f"✓ Entry deleted: {description}")
                 self.log(f"(Delete): {description}")
+                self._entries_changed(entry)
+                self._history_changed(entry, deleted=True)
+                self._track_entries([], deleted=[entry], save=False)
+                self.save_config(silent=True)
+                for key in ('running', 'last_stopped'):
+                    tracked = self.timer_state.get(key)
+                    if tracked and tracked.get('id') == entry_id:
+                        self._set_timer_state(**{key: None})
             else:
                 print("✗ Failed to delete entry")
 
@@ -1020,25 +3320,32 @@ class TogglCLI:
             print("✗ Please login first")
             return
 
-        # Check if there's already a running timer
-        current = self.api_request('GET', f'/me/time_entries/current')
-        if current and current.get('id'):
+        # Check if there's already a running timer. A running one in the local
+        # state is confirmed with the server before refusing (it may have been
+        # stopped elsewhere); none running is trusted while fresh.
+        try:
+            current = self._fetch_current() if self.timer_state.get('running') else self._get_current()
+        except TogglAPIError as e:
+            self._report_error(e)
+            return
+        if current:
             print("✗ Timer is already running. Stop it first.")
             return
 
-        # Get the most recent stopped entry
-        entries = self.api_request('GET', '/me/time_entries')
-        
-        if not entries:
-            print("ℹ No previous entries to resume")
-            return
+        # The last stopped entry is tracked locally; download entries only if unknown
+        last_entry = self.timer_state.get('last_stopped')
+        if not last_entry:
+            entries = self.api_request('GET', '/me/time_entries')
 
-        # Find the last stopped entry
-        last_entry = None
-        for entry in reversed(entries):
-            if entry.get('duration', 0) > 0:  # Stopped entry
-                last_entry = entry
-                break
+            if not entries:
+                print("ℹ No previous entries to resume")
+                return
+
+            # Find the last stopped entry
+            for entry in reversed(entries):
+                if entry.get('duration', 0) > 0:  # Stopped entry
+                    last_entry = entry
+                    break
 
         if not last_entry:
             print("ℹ No previous entries to resume")
@@ -1065,35 +3372,57 @@ class TogglCLI:
         if tag_ids:
             data["tag_ids"] = tag_ids
 
+        # The old entry's project or tags may have been archived or deleted since
+        data = self._preflight(data)
+        if data is None:
+            return
+        project_id, tag_ids = data.get('project_id'), data.get('tag_ids') or []
+
         result = self.api_request('POST', f'/workspaces/{self.workspace_id}/time_entries', data)
 
         if result:
-            project_name = self._get_project_name(last_entry.get('project_id'))
-            project_str = f" → {project_name}" if last_entry.get('project_id') else ""
+            project_name = self._get_project_name(project_id)
+            project_str = f" → {project_name}" if project_id else ""
             print(f"✓ Resumed: {description}{project_str}")
             self.log(f"(Resume): {description}{project_str}")
+            self._entries_changed(result, self.timer_state.get('running'))
+            self._set_timer_state(running=result)
+            self._record_usage(description, project_id, tag_ids)
         else:
             print("✗ Failed to resume timer")
 
-    def search_entries(self):
-        """Search time entries"""
+    def search_entries(self, by=None, value=None):
+        """Search time entries. by ('description', 'project', 'tag', 'date' or
+        'client') and value skip the prompts."""
         if not self.workspace_id:
             print("✗ Please login first")
             return
 
-        print("\n=== SEARCH ENTRIES ===")
-        print("1. Search by description")
-        print("2. Search by project")
-        print("3. Search by tag")
-        print("4. Search by date range")
-        
-        choice = input("\nSelect search type: ").strip()
+        if by:
+            choice = {'description': '1', 'project': '2', 'tag': '3', 'date': '4', 'client': '5'}[by]
+        else:
+            print("\n=== SEARCH ENTRIES ===")
+            print("1. Search by description")
+            print("2. Search by project")
+            print("3. Search by tag")
+            print("4. Search by date range")
+            print("5. Search by client")
+
+            choice = input("\nSelect search type: ").strip()
 
         # Get entries from last 30 days
         from datetime import timedelta
         start_date = (datetime.now(timezone.utc) - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0).isoformat().replace('+00:00', 'Z')
         end_date = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
+        checkpoint = self._read_backfill()
+        if checkpoint and _parse_time(checkpoint['cursor']) < _parse_time(start_date):
+            # The backfilled history reaches further back: search it too, newest first like the API
+            entries = self._history_between(_parse_time(checkpoint['cursor']), _parse_time(end_date))
+            entries = sorted(entries or [], key=lambda e: _parse_time(e['start']) if e.get('start') else
+                             datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+            print(f"🔎 Searching {len(entries)} entries since {checkpoint['cursor'][:10]} (backfilled history)")
+        else:
+            entries = self.api_request('GET', f'/me/time_entries?start_date={start_date}&end_date={end_date}')
 
         if not entries:
             print("ℹ No entries found")
@@ -1102,18 +3431,15 @@ class TogglCLI:
         filtered = []
 
         if choice == '1':
-            keyword = input("Enter description keyword: ").strip().lower()
+            keyword = (value if by else input("Enter description keyword: ")).strip().lower()
             filtered = [e for e in entries if keyword in e.get('description', '').lower() and e.get('duration', 0) > 0]
 
         elif choice == '2':
             projects = self.list_projects(return_data=True)
             if not projects:
                 return
-            print("\n=== YOUR PROJECTS ===")
-            for idx, project in enumerate(projects, 1):
-                active = "✓" if project.get('active', True) else "✗"
-                print(f"{idx}. {project['name']} [{active}]")
-            selected = self._fuzzy_select(projects, "\nSelect project: ")
+            pick = value if by else self._pick(projects, "YOUR PROJECTS", "\nSelect project: ", _project_row)
+            selected = self._fuzzy_select_with(projects, pick)
             if selected:
                 project_id = selected['id']
                 filtered = [e for e in entries if e.get('project_id') == project_id and e.get('duration', 0) > 0]
@@ -1125,10 +3451,8 @@ class TogglCLI:
             tags = self.list_tags(return_data=True)
             if not tags:
                 return
-            print("\n=== YOUR TAGS ===")
-            for idx, tag in enumerate(tags, 1):
-                print(f"{idx}. {tag['name']}")
-            selected = self._fuzzy_select(tags, "\nSelect tag: ")
+            pick = value if by else self._pick(tags, "YOUR TAGS", "\nSelect tag: ")
+            selected = self._fuzzy_select_with(tags, pick)
             if selected:
                 tag_id = selected['id']
                 filtered = [e for e in entries if tag_id in e.get('tag_ids', []) and e.get('duration', 0) > 0]
@@ -1137,13 +3461,30 @@ class TogglCLI:
                 return
 
         elif choice == '4':
-            date_str = input("Enter date (YYYY-MM-DD): ").strip()
+            date_str = (value if by else input("Enter date (YYYY-MM-DD): ")).strip()
             try:
                 filtered = [e for e in entries if e.get('start', '').startswith(date_str) and e.get('duration', 0) > 0]
             except:
                 print("✗ Invalid date format")
                 return
 
+        elif choice == '5':
+            if not self.cached_clients:
+                self._sync_entities('clients')
+            clients = self.cached_clients
+            if not clients:
+                print("ℹ No clients found")
+                return
+            pick = value if by else self._pick(clients, "YOUR CLIENTS", "\nSelect client: ")
+            selected = self._fuzzy_select_with(clients, pick)
+            if selected:
+                projects = self.list_projects(return_data=True) or []
+                project_ids = {p.get('id') for p in projects if p.get('client_id') == selected['id']}
+                filtered = [e for e in entries if e.get('project_id') in project_ids and e.get('duration', 0) > 0]
+            else:
+                print("✗ No client selected")
+                return
+
         else:
             print("✗ Invalid option")
             return
@@ -1163,6 +3504,7 @@ class TogglCLI:
             total_duration += duration
             date = entry.get('start', '')[:10]
             print(f"• {description} → {project} ({minutes} min) [{date}]")
+            self._emit(self._entry_record(entry))
 
         total_hours = total_duration // 3600
         total_mins = (total_duration % 3600) // 60
@@ -1183,35 +3525,97 @@ class TogglCLI:
             tasks = self.api_request('GET', '/me/tasks')
             
             if tasks:
-                # Cache the tasks
+                # Cache the tasks (also indexes them per project)
                 self.cached_tasks = tasks
                 self.save_config(silent=True)
                 print("✓ Tasks cached for future use")
+                tasks = self.cached_tasks
         
         if not tasks:
             print("ℹ No tasks found")
             return
 
         print("\n=== YOUR TASKS ===")
-        # Group tasks by project
+        # Group tasks by project using a single ID -> name map
+        project_names = {p.get('id'): p.get('name', 'Unknown project') for p in self.cached_projects}
         tasks_by_project = {}
         for task in tasks:
             project_id = task.get('project_id')
-            project_name = self._get_project_name(project_id)
-            if project_name not in tasks_by_project:
-                tasks_by_project[project_name] = []
-            tasks_by_project[project_name].append(task)
+            project_name = project_names.get(project_id) or self._get_project_name(project_id)
+            tasks_by_project.setdefault(project_name, []).append(task)
         
+        tracked = self._tracked()['tasks']
         for project_name, project_tasks in sorted(tasks_by_project.items()):
             print(f"\n📁 {project_name}:")
             for task in project_tasks:
                 active = "✓" if task.get('active', True) else "✗"
-                estimated = f" (est: {task.get('estimated_seconds', 0) // 3600}h)" if task.get('estimated_seconds') else ""
-                print(f"  • {task['name']} [{active}]{estimated}")
+                spent = tracked.get(task.get('id'), 0)
+                spent = f"tracked: {spent // 3600}h {(spent % 3600) // 60}m" if spent else ""
+                estimated = f"est: {task.get('estimated_seconds', 0) // 3600}h" if task.get('estimated_seconds') else ""
+                details = ', '.join(part for part in (spent, estimated) if part)
+                print(f"  • {task['name']} [{active}]{f' ({details})' if details else ''}")
         
         print(f"\n✓ Total tasks: {len(tasks)}")
         print("💡 Tip: Use option 7 in Settings to refresh cache")
 
+    def budget_view(self):
+        """Tracked time against project and task estimates, answered from the
+        tracked-time ledger without any API call"""
+        if not self.workspace_id:
+            print("✗ Please login first")
+            return
+
+        totals = self._tracked()
+        ledger = totals['ledger']
+        print("\n=== BUDGETS ===")
+        if ledger:
+            oldest = datetime.fromtimestamp(min(r['start'] for r in ledger.values())).date()
+            print(f"📒 Counted from {len(ledger)} entries since {oldest}")
+        backfill = self._read_backfill()
+        if not backfill or not backfill['done']:
+            print("💡 Only entries this CLI has seen are counted; Backfill History (S -> 18) adds the rest")
+
+        tasks_by_project = {}
+        for task in self.cached_tasks:
+            tasks_by_project.setdefault(task.get('project_id'), []).append(task)
+        project_estimate = lambda p: p.get('estimated_seconds') or int((p.get('estimated_hours') or 0) * 3600)
+        budgeted = [p for p in self.cached_projects if project_estimate(p)
+                    or any(t.get('estimated_seconds') for t in tasks_by_project.get(p.get('id'), []))]
+        if not budgeted:
+            print("ℹ No project or task in this workspace has an estimate")
+            return
+
+        def used(project):
+            estimate = project_estimate(project)
+            return totals['projects'].get(project['id'], 0) / estimate if estimate else 0
+
+        for project in sorted(budgeted, key=used, reverse=True):
+            self._budget_row(f"📁 {project['name']}", totals['projects'].get(project['id'], 0),
+                             project_estimate(project))
+            self._emit({'kind': 'project', 'id': project['id'], 'name': project['name'], 'project_id': project['id'],
+                        'tracked_seconds': totals['projects'].get(project['id'], 0),
+                        'estimated_seconds': project_estimate(project) or None})
+            for task in tasks_by_project.get(project['id'], []):
+                if task.get('estimated_seconds') or totals['tasks'].get(task.get('id')):
+                    self._budget_row(f"   └ {task['name']}", totals['tasks'].get(task['id'], 0),
+                                     task.get('estimated_seconds'))
+                    self._emit({'kind': 'task', 'id': task['id'], 'name': task['name'], 'project_id': project['id'],
+                                'tracked_seconds': totals['tasks'].get(task['id'], 0),
+                                'estimated_seconds': task.get('estimated_seconds') or None})
+
+    @staticmethod
+    def _budget_row(label, tracked, estimate):
+        """One budget line: tracked vs estimate with a 10-cell burn bar"""
+        hours = lambda seconds: f"{seconds // 3600}h {(seconds % 3600) // 60:02d}m"
+        if not estimate:
+            print(f"{label[:34]:<34} {hours(tracked):>9}   (no estimate)")
+            return
+        cells = min(10, round(tracked / estimate * 10))
+        left = estimate - tracked
+        status = f"{hours(left)} left" if left >= 0 else f"⚠️  {hours(-left)} over"
+        print(f"{label[:34]:<34} {hours(tracked):>9} / {hours(estimate):<9} "
+              f"{'█' * cells}{'░' * (10 - cells)} {tracked / estimate:>4.0%}  {status}")
+
     def list_clients(self):
         """List all clients"""
         if not self.workspace_id:
@@ -1335,53 +3739,95 @@ class TogglCLI:
         self.log("(Check): API quota")
 
     def list_projects_paginated(self):
-        """List projects with pagination support (better for large project lists)"""
+        """List projects with pagination support (better for large project lists).
+
+        The first page tells how many pages exist (X-Total-Count / X-Pages
+        headers); the rest are fetched concurrently and printed as they arrive.
+        Without those headers, pages are fetched in parallel waves until a
+        short page shows up."""
         if not self.workspace_id:
             print("✗ Please login first")
             return
 
         print("\n⏳ Fetching projects (paginated)...")
-        
-        # Start with first page
-        page = 1
-        per_page = 50
-        all_projects = []
-        
-        while True:
-            endpoint = f'/me/projects/paginated?page={page}&per_page={per_page}'
-            response = self.api_request('GET', endpoint)
-            
-            if not response:
-                break
-            
-            # The paginated endpoint returns projects in a different format
-            projects = response if isinstance(response, list) else response.get('data', [])
-            
-            if not projects:
-                break
-            
-            all_projects.extend(projects)
-            
-            # Check if there are more pages
-            if len(projects) < per_page:
-                break
-            
-            page += 1
-        
-        if not all_projects:
-            print("ℹ No projects found")
+
+        per_page = self.settings['page_size']
+        workers = self.settings['max_parallel_requests']
+        seen_ids = set()
+        failed_pages = []
+
+        async def fetch_page(page):
+            try:
+                projects, headers = await self.client.list_projects_page(page, per_page)
+            except TogglAPIError as e:
+                self._report_error(e)
+                failed_pages.append(page)
+                return page, [], {}
+            return page, projects, headers
+
+        def show_page(page, projects):
+            # Stream rows and fold them into the cache as each page arrives
+            lines = []
+            for idx, project in enumerate(projects, (page - 1) * per_page + 1):
+                active = "✓" if project.get('active', True) else "✗"
+                client_name = f" (Client: {project.get('client_name', 'None')})" if project.get('client_name') else ""
+                lines.append(f"{idx}. {project['name']} [{active}]{client_name}")
+            if lines:
+                print("\n".join(lines))
+            self._merge_entities('projects', projects)
+            seen_ids.update(p.get('id') for p in projects)
+
+        async def fetch_all():
+            _, first, headers = await fetch_page(1)
+            if not first:
+                return 0
+
+            print("\n=== YOUR PROJECTS (Paginated) ===")
+            show_page(1, first)
+            pages_loaded = 1
+
+            total_pages = None
+            if headers.get('X-Pages'):
+                total_pages = int(headers['X-Pages'])
+            elif headers.get('X-Total-Count'):
+                total_pages = -(-int(headers['X-Total-Count']) // per_page)
+
+            # With a known page count every page is queued at once (the client
+            # bounds concurrency); otherwise probe in waves of `workers` pages
+            next_page = 2
+            more = bool(total_pages) or len(first) >= per_page
+            while more:
+                last_page = total_pages if total_pages else next_page + workers - 1
+                wave = [fetch_page(page) for page in range(next_page, last_page + 1)]
+                more = False
+                for future in asyncio.as_completed(wave):
+                    page, projects, _ = await future
+                    if projects:
+                        show_page(page, projects)
+                        pages_loaded += 1
+                    if not total_pages and len(projects) >= per_page and page == last_page:
+                        more = True
+                if total_pages:
+                    break
+                next_page = last_page + 1
+            return pages_loaded
+
+        pages_loaded = asyncio.run(fetch_all())
+        if not pages_loaded:
+            if not failed_pages:
+                print("ℹ No projects found")
             return
 
-        print("\n=== YOUR PROJECTS (Paginated) ===")
-        for idx, project in enumerate(all_projects, 1):
-            active = "✓" if project.get('active', True) else "✗"
-            client_name = f" (Client: {project.get('client_name', 'None')})" if project.get('client_name') else ""
-            print(f"{idx}. {project['name']} [{active}]{client_name}")
-        
-        print(f"\n✓ Total projects: {len(all_projects)} (loaded across {page} page(s))")
-        
-        # Update cache
-        self.cached_projects = all_projects
+        if failed_pages:
+            # Projects on the missing pages were not seen; keep them cached
+            print(f"⚠️  {len(failed_pages)} page(s) failed to load; cached projects were not pruned")
+        else:
+            # Drop cached projects that no longer exist on the server
+            for partition in self._all_partitions():
+                partition['projects'] = [p for p in partition['projects'] if p.get('id') in seen_ids]
+
+        print(f"\n✓ Total projects: {len(seen_ids)} (loaded across {pages_loaded} page(s))")
+
         self.save_config(silent=True)
         print("✓ Cache updated")
 
@@ -1602,50 +4048,38 @@ class TogglCLI:
         print("  6. Refresh Projects        [1🔄]")
         print("  7. Refresh Tags            [1🔄]")
         print("  8. Clear All Cache         [0⚡]")
+        print("  9. Full Re-sync All        [6🔄]")
         print("  0. Cancel")
         print("\n  Legend: 🔄 Refresh (API calls)  ⚡ No calls")
+        print("  Clients, tasks, projects and tags fetch only changes since the last sync.")
         print("="*60)
         
         choice = input("\nSelect option: ").strip()
         
-        if choice == '1':
-            # Refresh all
-            print("\n⏳ Refreshing all cached data...")
-            self.cached_organizations = []
-            self.cached_clients = []
-            self.cached_tasks = []
-            self.cached_workspaces = []
-            self.cached_projects = []
-            self.cached_tags = []
-            
-            # Fetch fresh data
+        if choice in ('1', '9'):
+            # Refresh all; entity lists sync incrementally unless a full re-sync was asked for
+            full = choice == '9'
+            print(f"\n⏳ {'Re-downloading' if full else 'Refreshing'} all cached data...")
             orgs = self.api_request('GET', '/me/organizations')
-            if orgs:
+            if orgs is not None:
                 self.cached_organizations = orgs
-            
-            clients = self.api_request('GET', '/me/clients')
-            if clients:
-                self.cached_clients = clients
-            
-            tasks = self.api_request('GET', '/me/tasks')
-            if tasks:
-                self.cached_tasks = tasks
-            
+
             workspaces = self.api_request('GET', '/me/workspaces')
-            if workspaces:
+            if workspaces is not None:
                 self.cached_workspaces = workspaces
-            
-            projects = self.api_request('GET', '/me/projects')
-            if projects:
-                self.cached_projects = projects
-            
-            tags = self.api_request('GET', '/me/tags')
-            if tags:
-                self.cached_tags = tags
+
+            for kind in ('clients', 'tasks', 'projects', 'tags'):
+                result = self._sync_entities(kind, full=full)
+                if result:
+                    received, incremental = result
+                    detail = f"{received} changed" if incremental else "full download"
+                    print(f"  ✓ {kind.capitalize()}: {detail}")
+            # Entries may have changed elsewhere too; recompute cached summaries
+            self._entries_changed(everything=True)
             
             self.save_config(silent=True)
             print("✓ All cache refreshed successfully")
-            self.log("(Refresh): All cache")
+            self.log(f"(Refresh): All cache{' (full re-sync)' if full else ''}")
             
         elif choice == '2':
             print("\n⏳ Refreshing organizations...")
@@ -1657,26 +4091,6 @@ class TogglCLI:
                 print("✓ Organizations cache refreshed")
                 self.log("(Refresh): Organizations cache")
             
-        elif choice == '3':
-            print("\n⏳ Refreshing clients...")
-            self.cached_clients = []
-            clients = self.api_request('GET', '/me/clients')
-            if clients:
-                self.cached_clients = clients
-                self.save_config(silent=True)
-                print("✓ Clients cache refreshed")
-                self.log("(Refresh): Clients cache")
-            
-        elif choice == '4':
-            print("\n⏳ Refreshing tasks...")
-            self.cached_tasks = []
-            tasks = self.api_request('GET', '/me/tasks')
-            if tasks:
-                self.cached_tasks = tasks
-                self.save_config(silent=True)
-                print("✓ Tasks cache refreshed")
-                self.log("(Refresh): Tasks cache")
-            
         elif choice == '5':
             print("\n⏳ Refreshing workspaces...")
             self.cached_workspaces = []
@@ -1687,25 +4101,16 @@ class TogglCLI:
                 print("✓ Workspaces cache refreshed")
                 self.log("(Refresh): Workspaces cache")
             
-        elif choice == '6':
-            print("\n⏳ Refreshing projects...")
-            self.cached_projects = []
-            projects = self.api_request('GET', '/me/projects')
-            if projects:
-                self.cached_projects = projects
-                self.save_config(silent=True)
-                print("✓ Projects cache refreshed")
-                self.log("(Refresh): Projects cache")
-            
-        elif choice == '7':
-            print("\n⏳ Refreshing tags...")
-            self.cached_tags = []
-            tags = self.api_request('GET', '/me/tags')
-            if tags:
-                self.cached_tags = tags
+        elif choice in ('3', '4', '6', '7'):
+            kind = {'3': 'clients', '4': 'tasks', '6': 'projects', '7': 'tags'}[choice]
+            print(f"\n⏳ Refreshing {kind}...")
+            result = self._sync_entities(kind)
+            if result:
+                received, incremental = result
                 self.save_config(silent=True)
-                print("✓ Tags cache refreshed")
-                self.log("(Refresh): Tags cache")
+                detail = f"{received} changed since last sync" if incremental else "full download"
+                print(f"✓ {kind.capitalize()} cache refreshed ({detail})")
+                self.log(f"(Refresh): {kind.capitalize()} cache")
             
         elif choice == '8':
             # Clear all cache without refetching
@@ -1717,6 +4122,7 @@ class TogglCLI:
                 self.cached_workspaces = []
                 self.cached_projects = []
                 self.cached_tags = []
+                self._global_caches['reports'] = OrderedDict()
                 self.save_config(silent=True)
                 print("✓ All cache cleared")
                 self.log("(Clear): All cache")
@@ -1729,6 +4135,181 @@ class TogglCLI:
         else:
             print("✗ Invalid option")
 
+    def webhook_server(self):
+        """Run a local receiver for Toggl webhook events until Ctrl+C"""
+        secret = self.settings.get('webhook_secret')
+        if not secret:
+            secret = input("Webhook subscription secret: ").strip()
+            if not secret:
+                print("✗ A secret is required to validate webhook signatures")
+                return
+            self.settings['webhook_secret'] = secret
+            self.save_config(silent=True)
+
+        port = self.settings['webhook_port']
+        try:
+            server = HTTPServer(('127.0.0.1', port), WebhookHandler)
+        except OSError as e:
+            print(f"✗ Could not listen on port {port}: {e}")
+            return
+        server.cli = self
+
+        print(f"\n📨 Webhook receiver listening on http://127.0.0.1:{port}/")
+        print("   Expose it to Toggl (e.g. through a tunnel) and register it as the callback URL")
+        print("   Press Ctrl+C to stop")
+        self.log(f"(Webhook): Receiver started on port {port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n✓ Webhook receiver stopped")
+        finally:
+            server.server_close()
+
+    def replay_webhooks(self, path=None):
+        """Apply recorded webhook deliveries (one JSON object per line) to the caches"""
+        path = path or input(f"Recorded deliveries file [{WEBHOOK_LOG_FILE}]: ").strip() or WEBHOOK_LOG_FILE
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = [line for line in f if line.strip()]
+        except OSError as e:
+            print(f"✗ Could not read {path}: {e}")
+            return
+
+        applied = rejected = 0
+        for number, line in enumerate(lines, 1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            # Recorded deliveries keep the raw body and signature; bare events are applied as-is
+            if not isinstance(record, dict) or not isinstance(record.get('body', ''), str):
+                self.log(f"(Webhook): Skipping unreadable line {number} of {path}")
+                status = 400
+            elif 'body' in record:
+                status, _ = self._handle_webhook(record['body'].encode('utf-8'), str(record.get('signature') or ''))
+            else:
+                status = 200 if self._apply_webhook_event(record) else 400
+            if status == 200:
+                applied += 1
+            else:
+                rejected += 1
+        print(f"✓ Replayed {applied} event(s), rejected {rejected}")
+
+    def _handle_webhook(self, body, signature):
+        """Validate and apply one webhook delivery. Returns (http_status, response_dict)."""
+        secret = self.settings.get('webhook_secret') or ''
+        expected = 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        if not secret or not hmac.compare_digest(expected, signature or ''):
+            self.log("(Webhook): Rejected delivery with invalid signature")
+            return 401, {'error': 'invalid signature'}
+
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return 400, {'error': 'invalid JSON'}
+        if not isinstance(event, dict):
+            return 400, {'error': 'unsupported event'}
+
+        # Subscription validation ping: echo the code back
+        if event.get('payload') == 'ping':
+            return 200, {'validation_code': event.get('validation_code')}
+
+        if not self._apply_webhook_event(event):
+            return 400, {'error': 'unsupported event'}
+        return 200, {}
+
+    def _apply_webhook_event(self, event):
+        """Apply a created/updated/deleted event to the local caches. Returns True if handled."""
+        metadata = event.get('metadata')
+        metadata = metadata if isinstance(metadata, dict) else {}
+        action, model = metadata.get('action'), metadata.get('model')
+        payload = event.get('payload')
+        if not isinstance(payload, dict) or action not in ('created', 'updated', 'deleted'):
+            return False
+
+        if model == 'time_entry':
+            self._apply_entry_event(action, payload)
+        elif model in WEBHOOK_MODELS:
+            kind = WEBHOOK_MODELS[model]
+            if action == 'deleted':
+                self._remove_entities(kind, [payload.get('id')])
+            else:
+                payload.setdefault('workspace_id', metadata.get('workspace_id'))
+                self._merge_entities(kind, [payload])
+            self.save_config(silent=True)
+        else:
+            return False
+
+        self.log(f"(Webhook): {model} #{payload.get('id')} {action}")
+        return True
+
+    def _apply_entry_event(self, action, entry):
+        """Fold a time entry event into the locally tracked timer state and data versions"""
+        # Deletions may carry no start; then every cached summary is recomputed
+        self._entries_changed(entry, everything=not _entry_day(entry))
+        self._history_changed(entry, deleted=action == 'deleted')
+        if action == 'deleted':
+            self._track_entries([], deleted=[entry], save=False)
+        else:
+            self._track_entries([entry], save=False)
+        self.save_config(silent=True)
+        running = self.timer_state.get('running') or {}
+        last_stopped = self.timer_state.get('last_stopped') or {}
+        if action == 'deleted':
+            for key, tracked in (('running', running), ('last_stopped', last_stopped)):
+                if tracked.get('id') == entry.get('id'):
+                    self._set_timer_state(**{key: None})
+        elif entry.get('duration', 0) < 0:
+            self._set_timer_state(running=entry)
+        elif running.get('id') == entry.get('id') or last_stopped.get('id') == entry.get('id'):
+            self._set_timer_state(running=None, last_stopped=entry)
+
+    def _record_webhook(self, body, signature):
+        """Append a raw delivery to WEBHOOK_LOG_FILE so it can be replayed later"""
+        try:
+            with open(WEBHOOK_LOG_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'signature': signature, 'body': body.decode('utf-8')}, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.log(f"(Error): Could not record webhook: {e}")
+
+    def show_storage_stats(self):
+        """Show API transfer counters and on-disk sizes of config, cache and logs"""
+        print("\n=== NETWORK & STORAGE ===")
+        if self._client:
+            stats = self._client.stats
+            wire, decoded = stats['bytes_wire'], stats['bytes_decoded']
+            ratio = f" ({decoded / wire:.1f}x compression)" if wire else ""
+            print(f"📡 Requests this session: {stats['requests']}")
+            print(f"   Transferred: {wire / 1024:.1f} KB → {decoded / 1024:.1f} KB decoded{ratio}")
+        else:
+            print("📡 No API requests this session")
+        totals = self.request_totals
+        saved = totals['reused'] + totals['coalesced'] + totals['applied']
+        if saved:
+            print(f"⚡ Calls saved this session: {saved} ({totals['reused']} reused within a command, "
+                  f"{totals['coalesced']} coalesced, {totals['applied']} write(s) applied to cache)")
+
+        log_dir = os.path.dirname(os.path.abspath(LOG_FILE))
+        log_prefix = os.path.splitext(os.path.basename(LOG_FILE))[0] + '.'
+        archives = [name for name in os.listdir(log_dir)
+                    if name.startswith(log_prefix) and name.endswith('.txt.gz')]
+        for label, path in (("Config", CONFIG_FILE), ("Log", LOG_FILE)):
+            if os.path.exists(path):
+                print(f"💾 {label}: {os.path.getsize(path) / 1024:.1f} KB ({path})")
+        cache_files = [os.path.join(root, name) for root, _, names in os.walk(CACHE_DIR) for name in names]
+        if cache_files:
+            cache_size = sum(os.path.getsize(path) for path in cache_files)
+            print(f"💾 Cache: {len(cache_files)} file(s), {cache_size / 1024:.1f} KB ({CACHE_DIR}/)")
+        if archives:
+            archived = sum(os.path.getsize(os.path.join(log_dir, name)) for name in archives)
+            print(f"🗜  Archived logs: {len(archives)} segment(s), {archived / 1024:.1f} KB")
+        print(f"   Cache compression: {'on' if self.settings['compress_cache'] else 'off'}")
+        reports = self._global_caches['reports']
+        if reports:
+            used = sum(r['bytes'] for r in reports.values())
+            print(f"📊 Cached summaries: {len(reports)} ({used / 1024:.1f} of "
+                  f"{self.settings['report_cache_max_bytes'] / 1024:.0f} KB)")
+
     def toggl_settings_menu(self):
         """Display and handle Toggl Settings submenu"""
         while True:
@@ -1742,30 +4323,66 @@ class TogglCLI:
             print("  5. Update User Profile [2-3📡]")
             print("  6. Check API Quota     [2📡 1⚡]")
             print("  7. Refresh Cache       [🔄 see submenu]")
+            print("  8. All Workspaces Summary [1📡+]")
+            print("  9. Webhook Receiver    [0📡 live updates]")
+            print("  10. Replay Webhook Log [0📡]")
+            print("  11. Network & Storage  [0📡]")
+            print("  12. Batch Create from File [1📡 per item]")
+            print("  13. Find Overlapping Entries [1📡 per 30 days]")
+            print("  14. Find Untracked Gaps  [1📡 per 30 days]")
+            print("  15. Team Summary        [1-2📡 per member]")
+            print("  16. Period Summary      [4📡, or 1📡 per 30 days]")
+            print("  17. Check Summary Consistency [4📡 + 1📡 per 30 days]")
+            print("  18. Backfill History    [1📡 per 30 days, resumable]")
+            print("  19. Budgets             [0📡]")
             print("  0. Back to Main Menu")
             print("\n  Legend: 📡 API calls  ⚡ Cached  🔄 Refresh")
             print("="*60)
             
             choice = input("\nSelect option: ").strip()
-            
-            if choice == '1':
-                self.view_organizations()
-            elif choice == '2':
-                self.list_clients()
-            elif choice == '3':
-                self.list_tasks()
-            elif choice == '4':
-                self.list_projects_paginated()
-            elif choice == '5':
-                self.update_user_profile()
-            elif choice == '6':
-                self.check_api_quota()
-            elif choice == '7':
-                self.refresh_cache()
-            elif choice == '0':
-                break
-            else:
-                print("✗ Invalid option. Please try again.")
+            with self._request_scope(f"S-{choice}"):
+                if choice == '1':
+                    self.view_organizations()
+                elif choice == '2':
+                    self.list_clients()
+                elif choice == '3':
+                    self.list_tasks()
+                elif choice == '4':
+                    self.list_projects_paginated()
+                elif choice == '5':
+                    self.update_user_profile()
+                elif choice == '6':
+                    self.check_api_quota()
+                elif choice == '7':
+                    self.refresh_cache()
+                elif choice == '8':
+                    self.all_workspaces_summary()
+                elif choice == '9':
+                    self.webhook_server()
+                elif choice == '10':
+                    self.replay_webhooks()
+                elif choice == '11':
+                    self.show_storage_stats()
+                elif choice == '12':
+                    self.batch_create()
+                elif choice == '13':
+                    self.list_overlaps()
+                elif choice == '14':
+                    self.list_gaps()
+                elif choice == '15':
+                    self.team_summary()
+                elif choice == '16':
+                    self.period_summary()
+                elif choice == '17':
+                    self.check_summary_consistency()
+                elif choice == '18':
+                    self.backfill_history()
+                elif choice == '19':
+                    self.budget_view()
+                elif choice == '0':
+                    break
+                else:
+                    print("✗ Invalid option. Please try again.")
 
     def open_reports(self):
         """Open Toggl Reports in default browser"""
@@ -1786,6 +4403,8 @@ class TogglCLI:
         'te': '6',   # Today's Entries
         'ws': '7',   # Weekly Summary
         'se': '8',   # Search
+        'sw': '15',  # Switch Workspace
+        'wt': '16',  # Watch Timer
         'quit': '0',
         'exit': '0',
     }
@@ -1807,6 +4426,8 @@ class TogglCLI:
         print("─"*29 + "┼" + "─"*30)
         print("  13. 📝 Create Project      │     O. 🌐 Open Reports (Web)")
         print("  14. 📝 Create Tag          │     S. ⚙️ Toggl Settings")
+        print("  15. 🔀 Switch Workspace(sw)│")
+        print("  16. 👁  Watch Timer  (wt)   │")
         print("="*60)
 
     def run(self):
@@ -1814,48 +4435,59 @@ class TogglCLI:
         while True:
             try:
                 self.show_menu()
-                choice = input("\nSelect option: ").strip()
+                self._start_warmup()
+                try:
+                    choice = input("\nSelect option: ").strip()
+                finally:
+                    self._stop_warmup()
                 if not choice:
                     continue
                 choice = self.ALIASES.get(choice.lower(), choice)
 
-                if choice == '1':
-                    self.login()
-                elif choice == '2':
-                    self.start_timer()
-                elif choice == '3':
-                    self.stop_timer()
-                elif choice == '4':
-                    self.resume_last()
-                elif choice == '5':
-                    self.current_timer()
-                elif choice == '6':
-                    self.recent_entries()
-                elif choice == '7':
-                    self.weekly_summary()
-                elif choice == '8':
-                    self.search_entries()
-                elif choice == '9':
-                    self.edit_entry()
-                elif choice == '10':
-                    self.delete_entry()
-                elif choice == '11':
-                    self.list_projects()
-                elif choice == '12':
-                    self.list_tags()
-                elif choice == '13':
-                    self.create_project()
-                elif choice == '14':
-                    self.create_tag()
-                elif choice.lower() == 'o':
-                    self.open_reports()
-                elif choice.lower() == 's':
-                    self.toggl_settings_menu()
-                elif choice == '0':
-                    print("\n👋 Goodbye!")
-                    break
-                else:
-                    print("✗ Invalid option. Please try again.")
+                # Each command gets its own request scope; the settings submenu scopes its options
+                scope = nullcontext() if choice.lower() == 's' else self._request_scope(choice)
+                with self._state_lock, scope:
+                    if choice == '1':
+                        self.login()
+                    elif choice == '2':
+                        self.start_timer()
+                    elif choice == '3':
+                        self.stop_timer()
+                    elif choice == '4':
+                        self.resume_last()
+                    elif choice == '5':
+                        self.current_timer()
+                    elif choice == '6':
+                        self.recent_entries()
+                    elif choice == '7':
+                        self.weekly_summary()
+                    elif choice == '8':
+                        self.search_entries()
+                    elif choice == '9':
+                        self.edit_entry()
+                    elif choice == '10':
+                        self.delete_entry()
+                    elif choice == '11':
+                        self.list_projects()
+                    elif choice == '12':
+                        self.list_tags()
+                    elif choice == '13':
+                        self.create_project()
+                    elif choice == '14':
+                        self.create_tag()
+                    elif choice == '15':
+                        self.switch_workspace()
+                    elif choice == '16':
+                        self.watch_timer()
+                    elif choice.lower() == 'o':
+                        self.open_reports()
+                    elif choice.lower() == 's':
+                        self.toggl_settings_menu()
+                    elif choice == '0':
+                        print("\n👋 Goodbye!")
+                        break
+                    else:
+                        print("✗ Invalid option. Please try again.")
 
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
@@ -1864,7 +4496,70 @@ class TogglCLI:
                 print(f"\n✗ Unexpected error: {e}")
                 self.log(f"(Error): {e}")
 
+    # Commands runnable without the menu: name -> (help, method call)
+    COMMANDS = {
+        'current': ("Show the running timer", lambda cli, args: cli.current_timer()),
+        'recent': ("Show today's entries", lambda cli, args: cli.recent_entries()),
+        'weekly': ("Summary of the last 7 days", lambda cli, args: cli.weekly_summary()),
+        'period': ("Summary of the last N days (--days)", lambda cli, args: cli.period_summary(args.days)),
+        'search': ("Search entries (--description, --project, --tag, --client or --date)",
+                   lambda cli, args: cli.search_entries(*args.search)),
+        'projects': ("Sync and list projects", lambda cli, args: cli.list_projects()),
+        'tags': ("Sync and list tags", lambda cli, args: cli.list_tags()),
+        'budget': ("Tracked time against project and task estimates", lambda cli, args: cli.budget_view()),
+    }
+
+    def run_command(self, args):
+        """Run one command from the command line and return the exit status:
+        1 if it reported an error (a ✗ message), 0 otherwise. With --output
+        other than text, stdout carries only the records and everything else
+        printed goes to stderr."""
+        self.output = _RecordWriter(args.output, sys.stdout) if args.output != 'text' else None
+        watch = _FailureWatch(sys.stderr if self.output else sys.stdout)
+        try:
+            with redirect_stdout(watch):
+                if not self.workspace_id:
+                    print("✗ Please login first (run without a command to open the menu)")
+                    return 1
+                with self._state_lock, self._request_scope(args.command):
+                    self.COMMANDS[args.command][1](self, args)
+        finally:
+            if self.output:
+                self.output.close()
+                self.output = None
+        return 1 if watch.failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Toggl Track from the terminal. Without a command, the interactive menu opens.")
+    parser.add_argument('--output', choices=OUTPUT_FORMATS, default='text',
+                        help="text (default) or records streamed to stdout as json, ndjson or tsv")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    for name, (help_text, _) in TogglCLI.COMMANDS.items():
+        command = commands.add_parser(name, help=help_text)
+        if name == 'period':
+            command.add_argument('--days', type=int, default=30, help="days to include (default 30)")
+        elif name == 'search':
+            # Each option stores (search type, value) in args.search
+            by = command.add_mutually_exclusive_group(required=True)
+            for option, metavar, help_text in (('description', 'KEYWORD', "keyword in the description"),
+                                               ('project', 'NAME', "project name (partial) or number"),
+                                               ('tag', 'NAME', "tag name (partial) or number"),
+                                               ('date', 'YYYY-MM-DD', "day the entries start on"),
+                                               ('client', 'NAME', "client name (partial) or number")):
+                by.add_argument(f'--{option}', dest='search', metavar=metavar, help=help_text,
+                                type=lambda value, option=option: (option, value))
+    args = parser.parse_args(argv)
 
-if __name__ == "__main__":
     cli = TogglCLI()
-    cli.run()
+    if not args.command:
+        if args.output != 'text':
+            parser.error("--output needs a command")
+        cli.run()
+        return 0
+    return cli.run_command(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
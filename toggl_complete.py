@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Toggl Name Completion
+Shell-completion entry point: prints the project, tag, client or description
+names starting with a prefix, read from a prebuilt sorted name index.
+Imports only the standard library modules it needs, so each keystroke
+costs little more than interpreter startup.
+
+The index (CACHE_DIR/INDEX_FILE) is written by toggl_cli.py whenever the
+cached names change. It holds one "kind:casefolded name<TAB>name" line per
+name, sorted bytewise, and is binary-searched through mmap without being
+read in full.
+
+Usage: python3 -S toggl_complete.py {project,tag,client,description} [prefix]
+The scripts in completions/ import it instead (python3 -S -c 'import
+toggl_complete; ...'), which skips compiling this file on every keystroke.
+"""
+
+import mmap
+import os
+import sys
+
+CACHE_DIR = "toggl_cache"  # Same as toggl_cli.CACHE_DIR
+INDEX_FILE = "names.idx"
+KINDS = ('project', 'tag', 'client', 'description')
+MAX_RESULTS = 200
+
+
+def build_index(names):
+    """Index bytes for {kind: names}. Whitespace runs (tabs, newlines) become
+    single spaces; blank and duplicate names are dropped."""
+    lines = set()
+    for kind, values in names.items():
+        for name in values:
+            name = ' '.join(str(name or '').split())
+            if name:
+                lines.add(f"{kind}:{name.casefold()}\t{name}".encode('utf-8'))
+    return b''.join(line + b'\n' for line in sorted(lines))
+
+
+def complete(path, kind, prefix='', limit=MAX_RESULTS):
+    """Names of one kind starting with prefix (ignoring case), in index order"""
+    key = f"{kind}:{prefix.casefold()}".encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+                # lo and hi are line starts; find the first line >= key
+                lo, hi = 0, len(index)
+                while lo < hi:
+                    start = index.rfind(b'\n', 0, (lo + hi) // 2) + 1
+                    end = index.find(b'\n', start)
+                    if index[start:end] < key:
+                        lo = end + 1
+                    else:
+                        hi = start
+                names = []
+                while lo < len(index) and len(names) < limit:
+                    end = index.find(b'\n', lo)
+                    line = index[lo:end]
+                    if not line.startswith(key):
+                        break
+                    names.append(line.split(b'\t', 1)[1].decode('utf-8'))
+                    lo = end + 1
+                return names
+    except (OSError, ValueError):
+        return []
+
+
+def index_path():
+    """The index in $TOGGL_CLI_DIR, the working directory or next to this file"""
+    directories = [os.environ.get('TOGGL_CLI_DIR'), os.getcwd(), os.path.dirname(os.path.abspath(__file__))]
+    paths = [os.path.join(directory, CACHE_DIR, INDEX_FILE) for directory in directories if directory]
+    return next((path for path in paths if os.path.exists(path)), paths[-1])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in KINDS:
+        sys.stderr.write(f"usage: toggl_complete.py {{{','.join(KINDS)}}} [prefix]\n")
+        return 2
+    names = complete(index_path(), argv[0], argv[1] if len(argv) > 1 else '')
+    sys.stdout.write(''.join(name + '\n' for name in names))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Toggl Interval Index
+Time entries as [start, end) intervals, for overlap, gap and coverage queries.
+Contains no prompts or printing, so it can be embedded in other programs.
+
+Example:
+    index = IntervalIndex.from_entries(entries)
+    for earlier, later, start, end in index.overlaps(day_start, day_end):
+        ...
+    untracked = index.gaps(day_start, day_end, min_length=15 * 60)
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Entry = Dict[str, Any]
+Span = Tuple[float, float]
+
+_FAR = float('inf')
+_SCAN = 64  # Candidate ranges up to this long are scanned instead of searched in the tree
+
+
+def entry_span(entry: Entry, now: Optional[float] = None) -> Optional[Span]:
+    """(start, end) UNIX times of a time entry, or None if it has no usable start.
+    A running entry (negative duration, no stop) ends now."""
+    try:
+        start = datetime.fromisoformat(entry['start'].replace('Z', '+00:00')).timestamp()
+    except (KeyError, AttributeError, ValueError):
+        return None
+    if entry.get('stop'):
+        try:
+            return start, datetime.fromisoformat(entry['stop'].replace('Z', '+00:00')).timestamp()
+        except (AttributeError, ValueError):
+            pass
+    duration = entry.get('duration') or 0
+    if duration < 0:
+        return start, time.time() if now is None else now
+    return start, start + duration
+
+
+class IntervalIndex:
+    """Intervals sorted by start, with a max-end segment tree over them.
+
+    Building sorts once (O(n log n)). A query bisects for the intervals that
+    start before its end, then descends only into subtrees holding an
+    interval that ends after its start: O((k + 1) log n) for k results, even
+    when one long interval (a forgotten timer) spans everything after it.
+    Empty and negative intervals are ignored.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, Any]]):
+        rows = sorted((start, end, idx, item) for idx, (start, end, item)
+                      in enumerate(intervals) if end > start)
+        self._starts = [row[0] for row in rows]
+        self._ends = [row[1] for row in rows]
+        self._items = [row[3] for row in rows]
+        self._reach = []  # _reach[i] = max(_ends[:i + 1])
+        reach = -_FAR
+        for end in self._ends:
+            reach = max(reach, end)
+            self._reach.append(reach)
+        # _tree[node] = max end below node; leaf i is _tree[_size + i], node n has children 2n, 2n + 1
+        self._size = 1
+        while self._size < len(self._ends):
+            self._size *= 2
+        self._tree = [-_FAR] * self._size + self._ends + [-_FAR] * (self._size - len(self._ends))
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Entry], now: Optional[float] = None) -> 'IntervalIndex':
+        """Index time entries (API dicts); entries without a start are skipped"""
+        now = time.time() if now is None else now
+        spans = ((entry_span(entry, now), entry) for entry in entries)
+        return cls((span[0], span[1], entry) for span, entry in spans if span)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _range(self, start: float, end: float) -> Iterator[int]:
+        """Positions of the intervals that intersect [start, end), in start order"""
+        lo = bisect_right(self._reach, start)  # Everything before lo ends by `start`
+        hi = bisect_left(self._starts, end)    # Everything from hi starts at or after `end`
+        if hi - lo <= _SCAN:
+            for i in range(lo, hi):
+                if self._ends[i] > start:
+                    yield i
+            return
+        # An early long interval keeps lo low; skip the subtrees that all end by `start`
+        tree, size = self._tree, self._size
+        stack = [(1, 0, size)]  # (node, first, last): node covers positions [first, last)
+        while stack:
+            node, first, last = stack.pop()
+            if first >= hi or last <= lo or tree[node] <= start:
+                continue
+            if node >= size:
+                yield first
+            else:
+                middle = (first + last) // 2
+                stack.append((2 * node + 1, middle, last))
+                stack.append((2 * node, first, middle))  # Popped first: start order
+
+    def intersecting(self, start: float = -_FAR, end: float = _FAR) -> List[Tuple[float, float, Any]]:
+        """(start, end, item) of every interval intersecting [start, end)"""
+        return [(self._starts[i], self._ends[i], self._items[i]) for i in self._range(start, end)]
+
+    def overlaps(self, start: float = -_FAR, end: float = _FAR) -> List[Tuple[Any, Any, float, float]]:
+        """Double-booked time within [start, end) as (earlier, later, from, to).
+
+        One sweep in start order: an interval starting before the furthest
+        end seen so far overlaps the interval that reaches furthest, so every
+        interval that overlaps an earlier one is reported exactly once."""
+        result = []
+        reach_end, reach_item = -_FAR, None
+        for i in self._range(start, end):
+            s, e = self._starts[i], self._ends[i]
+            if s < reach_end:
+                lo, hi = max(s, start), min(e, reach_end, end)
+                if hi > lo:
+                    result.append((reach_item, self._items[i], lo, hi))
+            if e > reach_end:
+                reach_end, reach_item = e, self._items[i]
+        return result
+
+    def merged(self, start: float = -_FAR, end: float = _FAR) -> List[Span]:
+        """The union of the intervals within [start, end), as sorted disjoint spans"""
+        spans = []
+        for i in self._range(start, end):
+            s, e = max(self._starts[i], start), min(self._ends[i], end)
+            if spans and s <= spans[-1][1]:
+                if e > spans[-1][1]:
+                    spans[-1] = (spans[-1][0], e)
+            else:
+                spans.append((s, e))
+        return spans
+
+    def coverage(self, start: float, end: float) -> float:
+        """Seconds of [start, end) covered by at least one interval"""
+        return sum(e - s for s, e in self.merged(start, end))
+
+    def gaps(self, start: float, end: float, min_length: float = 0) -> List[Span]:
+        """Uncovered stretches of [start, end) lasting at least min_length seconds"""
+        result = []
+        cursor = start
+        for s, e in self.merged(start, end) + [(end, end)]:
+            if s - cursor >= min_length and s > cursor:
+                result.append((cursor, s))
+            cursor = max(cursor, e)
+        return result